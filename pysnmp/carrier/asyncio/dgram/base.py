@@ -34,9 +34,9 @@
 # THE POSSIBILITY OF SUCH DAMAGE.
 #
 
+import socket
 import sys
 import traceback
-from socket import socket
 from pysnmp.carrier.asyncio.base import AbstractAsyncioTransport
 from pysnmp.carrier.base import AbstractTransportAddress
 from pysnmp.carrier import error
@@ -54,10 +54,29 @@ class DgramAsyncioProtocol(asyncio.DatagramProtocol, AbstractAsyncioTransport):
     loop: asyncio.AbstractEventLoop
 
     def __init__(
-        self, sock=None, sockMap=None, loop: "asyncio.AbstractEventLoop | None" = None
+        self,
+        sock=None,
+        sockMap=None,
+        loop: "asyncio.AbstractEventLoop | None" = None,
+        batchSize: int = 0,
     ):
+        """Create datagram transport.
+
+        Parameters
+        ----------
+        batchSize : int
+            If non-zero, enables batched I/O: incoming datagrams are drained
+            from the socket in bursts of up to `batchSize` packets and handed
+            over to the dispatcher in a single callback, outgoing messages are
+            queued and flushed together once per event loop iteration.
+        """
         self._writeQ = []
+        self._readQ = []
         self._lport = None
+        self._batchSize = batchSize
+        self._readPending = False
+        self._writePending = False
+        self._drainSock = None
         if loop is None:
             loop = asyncio.get_event_loop()
         self.loop = loop
@@ -65,16 +84,69 @@ class DgramAsyncioProtocol(asyncio.DatagramProtocol, AbstractAsyncioTransport):
     def datagram_received(self, datagram, transportAddress: AbstractTransportAddress):
         if self._cbFun is None:
             raise error.CarrierError("Unable to call cbFun")
+        elif self._batchSize:
+            self._readQ.append((transportAddress, datagram))
+            self._drainSocket()
+            if not self._readPending:
+                self._readPending = True
+                self.loop.call_soon(self._flushReadQueue)
         else:
             self.loop.call_soon(self._cbFun, self, transportAddress, datagram)
 
-    def connection_made(self, transport: asyncio.DatagramTransport):
-        self.transport = transport
-        debug.logger & debug.FLAG_IO and debug.logger("connection_made: invoked")
-        while self._writeQ:
-            outgoingMessage, transportAddress = self._writeQ.pop(0)
+    def _drainSocket(self):
+        # Pull whatever else is already sitting in the socket buffer so that
+        # a burst costs a single event loop wakeup
+        if self._drainSock is None:
+            return
+
+        while len(self._readQ) < self._batchSize:
+            try:
+                datagram, transportAddress = self._drainSock.recvfrom(65535)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                # Let asyncio transport report socket errors on its next read
+                break
+
+            self._readQ.append((transportAddress, datagram))
+
+    def _flushReadQueue(self):
+        incomingBatch = self._readQ[: self._batchSize]
+        del self._readQ[: self._batchSize]
+
+        if self._readQ:
+            self.loop.call_soon(self._flushReadQueue)
+        else:
+            self._readPending = False
+
+        debug.logger & debug.FLAG_IO and debug.logger(
+            "_flushReadQueue: dispatching %d datagram(s)" % len(incomingBatch)
+        )
+
+        if self._batchCbFun is not None:
+            self._batchCbFun(self, incomingBatch)
+
+        elif self._cbFun is not None:
+            for transportAddress, datagram in incomingBatch:
+                self._cbFun(self, transportAddress, datagram)
+
+        else:
             debug.logger & debug.FLAG_IO and debug.logger(
-                "connection_made: transportAddress %r outgoingMessage %s"
+                "_flushReadQueue: transport closed, dropping %d datagram(s)"
+                % len(incomingBatch)
+            )
+
+    def _flushWriteQueue(self):
+        self._writePending = False
+
+        if self.transport is None:
+            return
+
+        writeQ, self._writeQ = self._writeQ, []
+
+        for outgoingMessage, transportAddress in writeQ:
+            debug.logger & debug.FLAG_IO and debug.logger(
+                "_flushWriteQueue: transportAddress %r outgoingMessage %s"
                 % (transportAddress, debug.hexdump(outgoingMessage))
             )
             try:
@@ -86,6 +158,37 @@ class DgramAsyncioProtocol(asyncio.DatagramProtocol, AbstractAsyncioTransport):
                     ";".join(traceback.format_exception(*sys.exc_info()))
                 )
 
+    def connection_made(self, transport: asyncio.DatagramTransport):
+        self.transport = transport
+        debug.logger & debug.FLAG_IO and debug.logger("connection_made: invoked")
+        if self._batchSize:
+            self._openDrainSocket()
+        self._flushWriteQueue()
+
+    def _openDrainSocket(self):
+        # Draining from a duplicate socket only makes sense with readiness
+        # based event loops, completion based ones own the socket reads
+        if not isinstance(self.loop, asyncio.selector_events.BaseSelectorEventLoop):
+            return
+
+        transportSocket = self.transport.get_extra_info("socket")  # type: ignore
+        if transportSocket is None:
+            return
+
+        try:
+            sock = socket.fromfd(
+                transportSocket.fileno(), transportSocket.family, transportSocket.type
+            )
+            sock.setblocking(False)
+        except OSError:
+            debug.logger & debug.FLAG_IO and debug.logger(
+                "_openDrainSocket: socket duplication failed, "
+                "falling back to per-datagram reads"
+            )
+            return
+
+        self._drainSock = sock
+
     def connection_lost(self, exc):
         debug.logger & debug.FLAG_IO and debug.logger("connection_lost: invoked")
 
@@ -111,14 +214,37 @@ class DgramAsyncioProtocol(asyncio.DatagramProtocol, AbstractAsyncioTransport):
         return self
 
     def openServerMode(
-        self, iface: "tuple[str, int] | None" = None, sock: "socket | None" = None
+        self,
+        iface: "tuple[str, int] | None" = None,
+        sock: "socket.socket | None" = None,
+        reusePort: bool = False,
     ):
+        """Bind transport to local address and start receiving messages.
+
+        Parameters
+        ----------
+        reusePort : bool
+            If `True`, sets `SO_REUSEPORT` on the socket so that several
+            transports (typically in different processes) may bind the same
+            `iface` and have the kernel load-balance incoming datagrams
+            between them.
+        """
         if iface is None and sock is None:
             raise error.CarrierError("either iface or sock is required")
 
+        if reusePort and not hasattr(socket, "SO_REUSEPORT"):
+            raise error.CarrierError("SO_REUSEPORT is not supported on this platform")
+
         try:
             if sock:
                 c = self.loop.create_datagram_endpoint(lambda: self, sock=sock)
+            elif reusePort:
+                c = self.loop.create_datagram_endpoint(
+                    lambda: self,
+                    local_addr=iface,
+                    family=self.SOCK_FAMILY,
+                    reuse_port=True,
+                )
             else:
                 c = self.loop.create_datagram_endpoint(
                     lambda: self, local_addr=iface, family=self.SOCK_FAMILY
@@ -132,6 +258,9 @@ class DgramAsyncioProtocol(asyncio.DatagramProtocol, AbstractAsyncioTransport):
         return self
 
     def closeTransport(self):
+        if self._drainSock is not None:
+            self._drainSock.close()
+            self._drainSock = None
         if self._lport is not None:
             self._lport.cancel()
         if self.transport is not None:
@@ -152,6 +281,13 @@ class DgramAsyncioProtocol(asyncio.DatagramProtocol, AbstractAsyncioTransport):
         )
         if self.transport is None:
             self._writeQ.append((outgoingMessage, transportAddress))
+        elif self._batchSize:
+            self._writeQ.append((outgoingMessage, transportAddress))
+            if len(self._writeQ) >= self._batchSize:
+                self._flushWriteQueue()
+            elif not self._writePending:
+                self._writePending = True
+                self.loop.call_soon(self._flushWriteQueue)
         else:
             try:
                 self.transport.sendto(
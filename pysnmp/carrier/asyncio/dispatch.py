@@ -36,8 +36,12 @@
 import sys
 from time import time
 import traceback
-from typing import Tuple
-from pysnmp.carrier.base import AbstractTransport, AbstractTransportDispatcher
+from typing import Callable, Tuple
+from pysnmp.carrier.base import (
+    AbstractTransport,
+    AbstractTransportDispatcher,
+    TimerCall,
+)
 from pysnmp.error import PySnmpError
 
 import asyncio
@@ -48,10 +52,12 @@ class AsyncioDispatcher(AbstractTransportDispatcher):
 
     loop: asyncio.AbstractEventLoop
     __transportCount: int
+    __timerCalls: "set[TimerCall]"
 
     def __init__(self, *args, **kwargs):
         AbstractTransportDispatcher.__init__(self)
         self.__transportCount = 0
+        self.__timerCalls = set()
         if "timeout" in kwargs:
             self.setTimerResolution(kwargs["timeout"])
         self.loopingcall = None
@@ -62,6 +68,19 @@ class AsyncioDispatcher(AbstractTransportDispatcher):
             await asyncio.sleep(self.getTimerResolution())
             self.handleTimerTick(time())
 
+    def scheduleTimerCall(self, delay: float, cbFun: Callable, *args) -> TimerCall:
+        timerCall = TimerCall(
+            self.loop.time() + delay, cbFun, args, self.__timerCalls.discard
+        )
+        timerCall.setHandle(self.loop.call_at(timerCall.deadline, timerCall))
+        self.__timerCalls.add(timerCall)
+        return timerCall
+
+    def cancelTimerCalls(self):
+        for timerCall in list(self.__timerCalls):
+            timerCall.cancel()
+        AbstractTransportDispatcher.cancelTimerCalls(self)
+
     def runDispatcher(self, timeout: float = 0.0):
         if not self.loop.is_running():
             try:
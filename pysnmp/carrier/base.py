@@ -5,9 +5,10 @@
 # Copyright (C) 2024, LeXtudio Inc. <support@lextudio.com>
 # License: https://www.pysnmp.com/pysnmp/license.html
 #
+import heapq
+from time import time
 from typing import Any, Callable
 from pysnmp.carrier import error
-from typing import Callable
 
 
 class TimerCallable:
@@ -41,6 +42,50 @@ class TimerCallable:
         self.__callInterval = callInterval
 
 
+class TimerCall:
+    """One-shot call scheduled by transport dispatcher at a deadline."""
+
+    __cbFun: Callable
+    __handle: Any
+
+    def __init__(
+        self,
+        deadline: float,
+        cbFun: Callable,
+        args: tuple = (),
+        discardFun: "Callable | None" = None,
+    ):
+        self.deadline = deadline
+        self.cancelled = False
+        self.__cbFun = cbFun
+        self.__args = args
+        self.__discardFun = discardFun
+        self.__handle = None
+
+    def __call__(self):
+        if self.cancelled:
+            return
+        self.cancelled = True
+        if self.__discardFun is not None:
+            self.__discardFun(self)
+        self.__cbFun(*self.__args)
+
+    def __lt__(self, other: "TimerCall"):
+        return self.deadline < other.deadline
+
+    def setHandle(self, handle):
+        self.__handle = handle
+
+    def cancel(self):
+        if self.cancelled:
+            return
+        self.cancelled = True
+        if self.__handle is not None:
+            self.__handle.cancel()
+        if self.__discardFun is not None:
+            self.__discardFun(self)
+
+
 class AbstractTransportAddress:
     _localAddress = None
 
@@ -61,6 +106,7 @@ class AbstractTransport:
     PROTO_TRANSPORT_DISPATCHER = None
     ADDRESS_TYPE = AbstractTransportAddress
     _cbFun = None
+    _batchCbFun = None
 
     @classmethod
     def isCompatibleWithDispatcher(
@@ -79,8 +125,12 @@ class AbstractTransport:
             )
         self._cbFun = cbFun
 
+    def registerBatchCbFun(self, batchCbFun):
+        self._batchCbFun = batchCbFun
+
     def unregisterCbFun(self):
         self._cbFun = None
+        self._batchCbFun = None
 
     def closeTransport(self):
         self.unregisterCbFun()
@@ -102,6 +152,7 @@ class AbstractTransportDispatcher:
     __transportDomainMap: "dict[AbstractTransport, tuple[int, ...]]"
     __recvCallables: "dict['tuple[int, ...] | None', Callable]"
     __timerCallables: "list[TimerCallable]"
+    __timerCalls: "list[TimerCall]"
     __ticks: int
     __timerResolution: float
     __timerDelta: float
@@ -114,6 +165,7 @@ class AbstractTransportDispatcher:
         self.__jobs = {}
         self.__recvCallables = {}
         self.__timerCallables = []
+        self.__timerCalls = []
         self.__ticks = 0
         self.__timerResolution = 0.5
         self.__timerDelta = self.__timerResolution * 0.05
@@ -131,6 +183,43 @@ class AbstractTransportDispatcher:
         else:
             raise error.CarrierError(f"Unregistered transport {incomingTransport}")
 
+        self.__dispatchMessage(transportDomain, transportAddress, incomingMessage)
+
+    def _batchCbFun(
+        self,
+        incomingTransport: AbstractTransport,
+        incomingBatch: "list[tuple[AbstractTransportAddress, Any]]",
+    ):
+        """Dispatch a burst of messages received by one transport.
+
+        Every message is routed even if an earlier one fails, the first
+        failure is re-raised once the whole batch has been processed.
+        """
+        if incomingTransport in self.__transportDomainMap:
+            transportDomain = self.__transportDomainMap[incomingTransport]
+        else:
+            raise error.CarrierError(f"Unregistered transport {incomingTransport}")
+
+        exc = None
+
+        for transportAddress, incomingMessage in incomingBatch:
+            try:
+                self.__dispatchMessage(
+                    transportDomain, transportAddress, incomingMessage
+                )
+            except Exception as e:
+                if exc is None:
+                    exc = e
+
+        if exc is not None:
+            raise exc
+
+    def __dispatchMessage(
+        self,
+        transportDomain: "tuple[int, ...]",
+        transportAddress: AbstractTransportAddress,
+        incomingMessage,
+    ):
         if self.__routingCbFun:
             recvId = self.__routingCbFun(
                 transportDomain, transportAddress, incomingMessage
@@ -187,12 +276,29 @@ class AbstractTransportDispatcher:
         else:
             self.__timerCallables = []
 
+    def scheduleTimerCall(self, delay: float, cbFun: Callable, *args) -> TimerCall:
+        """Call `cbFun(*args)` once, `delay` seconds from now.
+
+        Returns a :py:class:`TimerCall` handle which can be cancelled.
+        This generic implementation fires calls from timer ticks,
+        event loop based dispatchers schedule them at exact deadlines.
+        """
+        timerCall = TimerCall(time() + delay, cbFun, args)
+        heapq.heappush(self.__timerCalls, timerCall)
+        return timerCall
+
+    def cancelTimerCalls(self):
+        for timerCall in self.__timerCalls:
+            timerCall.cancel()
+        self.__timerCalls = []
+
     def registerTransport(
         self, tDomain: "tuple[int, ...]", transport: AbstractTransport
     ):
         if tDomain in self.__transports:
             raise error.CarrierError(f"Transport {tDomain} already registered")
         transport.registerCbFun(self._cbFun)
+        transport.registerBatchCbFun(self._batchCbFun)
         self.__transports[tDomain] = transport
         self.__transportDomainMap[transport] = tDomain
 
@@ -242,6 +348,9 @@ class AbstractTransportDispatcher:
         return self.__ticks
 
     def handleTimerTick(self, timeNow: float):
+        while self.__timerCalls and self.__timerCalls[0].deadline <= timeNow:
+            heapq.heappop(self.__timerCalls)()
+
         if self.__nextTime == 0:  # initial initialization
             self.__nextTime = timeNow + self.__timerResolution - self.__timerDelta
 
@@ -278,3 +387,4 @@ class AbstractTransportDispatcher:
         self.__transports.clear()
         self.unregisterRecvCbFun()
         self.unregisterTimerCbFun()
+        self.cancelTimerCalls()
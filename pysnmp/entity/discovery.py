@@ -0,0 +1,353 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from pyasn1.type import univ
+from pysnmp.proto.mpmod.rfc3412 import SnmpV3MessageProcessingModel
+from pysnmp.proto.secmod.rfc3414 import SnmpUSMSecurityModel
+from pysnmp import debug, error
+
+__all__ = [
+    "AbstractEngineDiscoveryStore",
+    "JsonEngineDiscoveryStore",
+    "SqliteEngineDiscoveryStore",
+]
+
+
+class AbstractEngineDiscoveryStore:
+    """Persistent store of discovered SNMPv3 engines.
+
+    Keeps SNMP engine ID and time of SNMP engines discovered at each
+    transport endpoint across application restarts. Once loaded into
+    SNMP engine, requests to known peers skip engine ID discovery and
+    time synchronization round-trips. Engine time is extrapolated by
+    the wall-clock time passed since it was last received.
+
+    Concrete stores implement :py:meth:`readRecords` and
+    :py:meth:`writeRecords`, each record being a dict of:
+
+    * `transportDomain` and `transportAddress` of SNMP engine
+    * `securityEngineId`, `contextEngineId` and `contextName` octets
+    * `snmpEngineBoots` and `snmpEngineTime`, `None` if not known
+    * `timestamp` of the record, seconds since epoch
+
+    Parameters
+    ----------
+    maxAge : float
+        Records older than this, seconds, are not loaded.
+    """
+
+    def __init__(self, maxAge=86400):
+        self.maxAge = maxAge
+
+    def readRecords(self):
+        """Return a list of stored records."""
+        raise error.PySnmpError("Method not implemented")
+
+    def writeRecords(self, records):
+        """Replace stored records with `records`."""
+        raise error.PySnmpError("Method not implemented")
+
+    def load(self, snmpEngine):
+        """Feed stored SNMP engines information into `snmpEngine`."""
+        mpHandler = snmpEngine.messageProcessingSubsystems[
+            SnmpV3MessageProcessingModel.MESSAGE_PROCESSING_MODEL_ID
+        ]
+        smHandler = snmpEngine.securityModels[SnmpUSMSecurityModel.SECURITY_MODEL_ID]
+
+        now = time.time()
+
+        for record in self.readRecords():
+            age = now - record["timestamp"]
+            if not 0 <= age <= self.maxAge:
+                continue
+
+            securityEngineId = univ.OctetString(record["securityEngineId"])
+
+            mpHandler.setPeerEngineInfo(
+                snmpEngine,
+                record["transportDomain"],
+                record["transportAddress"],
+                securityEngineId,
+                univ.OctetString(record["contextEngineId"]),
+                univ.OctetString(record["contextName"]),
+            )
+
+            if record["snmpEngineBoots"] is None:
+                continue
+
+            snmpEngineTime = record["snmpEngineTime"] + int(age)
+
+            # engine time wraps by incrementing engine boots
+            if snmpEngineTime > 2147483647:
+                continue
+
+            smHandler.setPeerEngineTimeline(
+                snmpEngine,
+                securityEngineId,
+                record["snmpEngineBoots"],
+                snmpEngineTime,
+                record["snmpEngineTime"],
+                int(now),
+            )
+
+        debug.logger & debug.FLAG_APP and debug.logger(
+            f"load: loaded SNMP engines from {self}"
+        )
+
+    def save(self, snmpEngine):
+        """Store SNMP engines information known to `snmpEngine`.
+
+        Stored records of SNMP engines `snmpEngine` no longer caches
+        are kept until they become older than `maxAge`.
+        """
+        mpHandler = snmpEngine.messageProcessingSubsystems[
+            SnmpV3MessageProcessingModel.MESSAGE_PROCESSING_MODEL_ID
+        ]
+        smHandler = snmpEngine.securityModels[SnmpUSMSecurityModel.SECURITY_MODEL_ID]
+
+        now = time.time()
+
+        records = {
+            (record["transportDomain"], record["transportAddress"]): record
+            for record in self.readRecords()
+            if now - record["timestamp"] <= self.maxAge
+        }
+
+        timelines = {
+            securityEngineId: (snmpEngineBoots, snmpEngineTime, timestamp)
+            for (
+                securityEngineId,
+                snmpEngineBoots,
+                snmpEngineTime,
+                _,
+                timestamp,
+            ) in smHandler.getPeerEnginesTimeline()
+        }
+
+        for (
+            transportDomain,
+            transportAddress,
+            securityEngineId,
+            contextEngineId,
+            contextName,
+        ) in mpHandler.getPeerEnginesInfo():
+            transportDomain = tuple(transportDomain)
+            transportAddress = self.__makeAddress(transportAddress)
+
+            snmpEngineBoots, snmpEngineTime, timestamp = timelines.get(
+                securityEngineId, (None, None, now)
+            )
+
+            records[(transportDomain, transportAddress)] = {
+                "transportDomain": transportDomain,
+                "transportAddress": transportAddress,
+                "securityEngineId": securityEngineId.asOctets(),
+                "contextEngineId": contextEngineId.asOctets(),
+                "contextName": contextName.asOctets(),
+                "snmpEngineBoots": None
+                if snmpEngineBoots is None
+                else int(snmpEngineBoots),
+                "snmpEngineTime": None
+                if snmpEngineTime is None
+                else int(snmpEngineTime),
+                "timestamp": timestamp,
+            }
+
+        self.writeRecords(list(records.values()))
+
+        debug.logger & debug.FLAG_APP and debug.logger(
+            f"save: stored {len(records)} SNMP engines at {self}"
+        )
+
+    @staticmethod
+    def __makeAddress(transportAddress):
+        # transport address classes may carry extra attributes
+        if isinstance(transportAddress, tuple):
+            return tuple(transportAddress)
+
+        return str(transportAddress)
+
+    @staticmethod
+    def _encodeRecord(record):
+        record = dict(record)
+
+        for key in ("securityEngineId", "contextEngineId", "contextName"):
+            record[key] = record[key].hex()
+
+        return record
+
+    @staticmethod
+    def _decodeRecord(record):
+        record = dict(record)
+
+        for key in ("securityEngineId", "contextEngineId", "contextName"):
+            record[key] = bytes.fromhex(record[key])
+
+        record["transportDomain"] = tuple(record["transportDomain"])
+
+        if isinstance(record["transportAddress"], list):
+            record["transportAddress"] = tuple(record["transportAddress"])
+
+        return record
+
+
+class JsonEngineDiscoveryStore(AbstractEngineDiscoveryStore):
+    """Persistent store of discovered SNMPv3 engines in a JSON file.
+
+    Parameters
+    ----------
+    path : str
+        File to keep records in.
+    maxAge : float
+        Records older than this, seconds, are not loaded.
+    """
+
+    def __init__(self, path, maxAge=86400):
+        AbstractEngineDiscoveryStore.__init__(self, maxAge)
+        self.path = path
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.path!r})"
+
+    def readRecords(self):
+        try:
+            with open(self.path) as f:
+                return [self._decodeRecord(record) for record in json.load(f)]
+
+        except (OSError, ValueError, KeyError, TypeError):
+            debug.logger & debug.FLAG_APP and debug.logger(
+                f"readRecords: could not read {self.path}: {sys.exc_info()[1]}"
+            )
+            return []
+
+    def writeRecords(self, records):
+        fd, fn = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)))
+
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump([self._encodeRecord(record) for record in records], f)
+
+            os.replace(fn, self.path)
+
+        except OSError:
+            os.unlink(fn)
+            raise error.PySnmpError(f"Could not write {self.path}: {sys.exc_info()[1]}")
+
+
+class SqliteEngineDiscoveryStore(AbstractEngineDiscoveryStore):
+    """Persistent store of discovered SNMPv3 engines in SQLite database.
+
+    Parameters
+    ----------
+    path : str
+        SQLite database file to keep records in.
+    maxAge : float
+        Records older than this, seconds, are not loaded.
+    """
+
+    COLUMNS = (
+        "transportDomain",
+        "transportAddress",
+        "securityEngineId",
+        "contextEngineId",
+        "contextName",
+        "snmpEngineBoots",
+        "snmpEngineTime",
+        "timestamp",
+    )
+
+    def __init__(self, path, maxAge=86400):
+        AbstractEngineDiscoveryStore.__init__(self, maxAge)
+        self.path = path
+
+        db = self.__connect()
+
+        try:
+            with db:
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS engines ("
+                    "transportDomain TEXT, transportAddress TEXT, "
+                    "securityEngineId TEXT, contextEngineId TEXT, contextName TEXT, "
+                    "snmpEngineBoots INTEGER, snmpEngineTime INTEGER, timestamp REAL, "
+                    "PRIMARY KEY (transportDomain, transportAddress))"
+                )
+
+        except sqlite3.Error:
+            raise error.PySnmpError(
+                f"Could not create {self.path}: {sys.exc_info()[1]}"
+            )
+
+        finally:
+            db.close()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.path!r})"
+
+    def __connect(self):
+        try:
+            return sqlite3.connect(self.path)
+
+        except sqlite3.Error:
+            raise error.PySnmpError(f"Could not open {self.path}: {sys.exc_info()[1]}")
+
+    def readRecords(self):
+        db = self.__connect()
+
+        try:
+            rows = db.execute(f"SELECT {', '.join(self.COLUMNS)} FROM engines")
+
+            return [
+                self._decodeRecord(
+                    dict(
+                        zip(self.COLUMNS, row),
+                        transportDomain=json.loads(row[0]),
+                        transportAddress=json.loads(row[1]),
+                    )
+                )
+                for row in rows
+            ]
+
+        except (sqlite3.Error, ValueError):
+            debug.logger & debug.FLAG_APP and debug.logger(
+                f"readRecords: could not read {self.path}: {sys.exc_info()[1]}"
+            )
+            return []
+
+        finally:
+            db.close()
+
+    def writeRecords(self, records):
+        db = self.__connect()
+
+        try:
+            with db:
+                db.execute("DELETE FROM engines")
+                db.executemany(
+                    f"INSERT INTO engines VALUES ({', '.join('?' * len(self.COLUMNS))})",
+                    [
+                        (
+                            json.dumps(record["transportDomain"]),
+                            json.dumps(record["transportAddress"]),
+                        )
+                        + tuple(
+                            self._encodeRecord(record)[column]
+                            for column in self.COLUMNS[2:]
+                        )
+                        for record in records
+                    ],
+                )
+
+        except sqlite3.Error:
+            raise error.PySnmpError(f"Could not write {self.path}: {sys.exc_info()[1]}")
+
+        finally:
+            db.close()
@@ -8,7 +8,7 @@ import os
 import shutil
 import sys
 import tempfile
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from pyasn1.compat.octets import str2octs
 from pysnmp.carrier.base import AbstractTransportAddress, AbstractTransportDispatcher
 from pysnmp.proto.rfc1902 import OctetString
@@ -25,6 +25,9 @@ from pysnmp.entity import observer
 from pysnmp import debug
 from pysnmp import error
 
+if TYPE_CHECKING:
+    from pysnmp.entity.discovery import AbstractEngineDiscoveryStore
+
 __all__ = ["SnmpEngine"]
 
 
@@ -50,6 +53,9 @@ class SnmpEngine:
         Unique and unambiguous identifier of an SNMP engine.
         If not given, `snmpEngineID` is autogenerated and stored on
         the filesystem. See :RFC:`3411#section-3.1.1`  for details.
+    engineDiscoveryStore : :py:class:`~pysnmp.entity.discovery.AbstractEngineDiscoveryStore`
+        Persistent store of discovered SNMPv3 engines loaded on SNMP
+        engine creation and updated on dispatcher closure.
 
     Examples
     --------
@@ -68,6 +74,7 @@ class SnmpEngine:
         snmpEngineID: "OctetString | None" = None,
         maxMessageSize: int = 65507,
         msgAndPduDsp: "MsgAndPduDispatcher | None" = None,
+        engineDiscoveryStore: "AbstractEngineDiscoveryStore | None" = None,
     ):
         self.cache = {}
 
@@ -94,6 +101,11 @@ class SnmpEngine:
 
         self.transportDispatcher = None
 
+        self.engineDiscoveryStore = engineDiscoveryStore
+
+        if engineDiscoveryStore is not None:
+            engineDiscoveryStore.load(self)
+
         if self.msgAndPduDsp.mibInstrumController is None:
             raise error.PySnmpError("MIB instrumentation does not yet exist")
         (
@@ -196,6 +208,9 @@ class SnmpEngine:
             self.transportDispatcher.closeDispatcher()
             self.unregisterTransportDispatcher()
 
+        if self.engineDiscoveryStore is not None:
+            self.engineDiscoveryStore.save(self)
+
     # Transport dispatcher bindings
 
     def __receiveMessageCbFun(
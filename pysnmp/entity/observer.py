@@ -21,6 +21,10 @@ class MetaObserver:
     It's important to realize that execution context is only guaranteed
     to exist to functions that are at the same or deeper level of invocation
     relative to execution point specified.
+
+    Execution context can be passed in as a callable returning the
+    variables. It is then only invoked once the context is actually
+    requested by a consumer or there are observers to notify.
     """
 
     def __init__(self):
@@ -50,10 +54,14 @@ class MetaObserver:
                     del self.__observers[execpoint]
 
     def storeExecutionContext(self, snmpEngine, execpoint, variables):
-        self.__execpoints[execpoint] = variables
         if execpoint in self.__observers:
+            if callable(variables):
+                variables = variables()
+            self.__execpoints[execpoint] = variables
             for cbFun in self.__observers[execpoint]:
                 cbFun(snmpEngine, execpoint, variables, self.__contexts[cbFun])
+        else:
+            self.__execpoints[execpoint] = variables
 
     def clearExecutionContext(self, snmpEngine, *execpoints):
         if execpoints:
@@ -63,4 +71,7 @@ class MetaObserver:
             self.__execpoints.clear()
 
     def getExecutionContext(self, execpoint):
-        return self.__execpoints[execpoint]
+        variables = self.__execpoints[execpoint]
+        if callable(variables):
+            variables = self.__execpoints[execpoint] = variables()
+        return variables
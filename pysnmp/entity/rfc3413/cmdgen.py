@@ -5,6 +5,7 @@
 # License: https://www.pysnmp.com/pysnmp/license.html
 #
 import sys
+import time
 from pysnmp.entity.engine import SnmpEngine
 from pysnmp.entity.rfc3413 import config
 from pysnmp.proto import rfc1905, errind
@@ -18,6 +19,8 @@ getNextHandle = nextid.Integer(0x7FFFFFFF)
 
 __null = univ.Null("")
 
+_TOO_BIG = rfc1905.errorStatus.clone("tooBig")
+
 
 def getNextVarBinds(varBinds, origVarBinds=None):
     errorIndication = None
@@ -89,10 +92,13 @@ class CommandGenerator:
             origRetryCount,
             origRetries,
             origDiscoveryRetries,
+            origSendTime,
         ) = self.__pendingReqs.pop(sendPduHandle)
 
         snmpEngine.transportDispatcher.jobFinished(id(self))
 
+        rttEstimator = snmpEngine.getUserContext("rttEstimator")
+
         # 3.1.3
         if statusInformation:
             debug.logger & debug.FLAG_APP and debug.logger(
@@ -101,6 +107,12 @@ class CommandGenerator:
 
             errorIndication = statusInformation["errorIndication"]
 
+            if rttEstimator is not None and errorIndication == errind.requestTimedOut:
+                rttEstimator.backoff(
+                    (origTransportDomain, origTransportAddress),
+                    self.__ticksToSeconds(snmpEngine, origTimeout),
+                )
+
             if errorIndication in (errind.notInTimeWindow, errind.unknownEngineID):
                 origDiscoveryRetries += 1
                 origRetries = 0
@@ -119,17 +131,18 @@ class CommandGenerator:
                 cbFun(snmpEngine, origSendRequestHandle, errorIndication, None, cbCtx)
                 return
 
-            # User-side API assumes SMIv2
-            if origMessageProcessingModel == 0:
-                reqPDU = rfc2576.v2ToV1(origPdu)
-                pduVersion = 0
-            else:
-                reqPDU = origPdu
-                pduVersion = 1
+            timeout = self.__getTimeout(
+                snmpEngine,
+                rttEstimator,
+                origTransportDomain,
+                origTransportAddress,
+                origTimeout,
+            )
 
             try:
-                sendPduHandle = snmpEngine.msgAndPduDsp.sendPdu(
+                sendPduHandle = snmpEngine.msgAndPduDsp.retryPdu(
                     snmpEngine,
+                    sendPduHandle,
                     origTransportDomain,
                     origTransportAddress,
                     origMessageProcessingModel,
@@ -138,10 +151,8 @@ class CommandGenerator:
                     origSecurityLevel,
                     origContextEngineId,
                     origContextName,
-                    pduVersion,
-                    reqPDU,
-                    True,
-                    origTimeout,
+                    origPdu,
+                    timeout,
                     self.processResponsePdu,
                     (origSendRequestHandle, cbFun, cbCtx),
                 )
@@ -163,6 +174,7 @@ class CommandGenerator:
                     origRetryCount,
                     origRetries,
                     origDiscoveryRetries,
+                    time.monotonic(),
                 )
                 return
 
@@ -213,8 +225,56 @@ class CommandGenerator:
             cbFun(snmpEngine, origSendRequestHandle, "badResponse", None, cbCtx)
             return
 
+        rtt = time.monotonic() - origSendTime
+
+        # Karn's algorithm: retransmitted requests give ambiguous samples
+        if rttEstimator is not None and not origRetries:
+            rttEstimator.addSample((origTransportDomain, origTransportAddress), rtt)
+
+        repetitionsEstimator = snmpEngine.getUserContext("repetitionsEstimator")
+
+        if (
+            repetitionsEstimator is not None
+            and origPdu.tagSet == v2c.GetBulkRequestPDU.tagSet
+        ):
+            (
+                snmpEngineMaxMessageSize,
+            ) = snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder.importSymbols(  # type: ignore
+                "__SNMP-FRAMEWORK-MIB", "snmpEngineMaxMessageSize"
+            )
+            wholeMsg = snmpEngine.observer.getExecutionContext(
+                "rfc3412.receiveMessage:response"
+            )["wholeMsg"]
+            repetitionsEstimator.addResponse(
+                (origTransportDomain, origTransportAddress),
+                origPdu,
+                PDU,
+                None if origRetries else rtt,
+                int(snmpEngineMaxMessageSize.syntax),
+                len(wholeMsg),
+            )
+
         cbFun(snmpEngine, origSendRequestHandle, None, PDU, cbCtx)
 
+    @staticmethod
+    def __ticksToSeconds(snmpEngine, timeout):
+        return timeout * snmpEngine.transportDispatcher.getTimerResolution()
+
+    def __getTimeout(
+        self, snmpEngine, rttEstimator, transportDomain, transportAddress, timeout
+    ):
+        # Adaptive timeouts take over configured ones if RTT is estimated
+        if rttEstimator is None:
+            return timeout
+
+        return (
+            rttEstimator.getTimeout(
+                (transportDomain, transportAddress),
+                self.__ticksToSeconds(snmpEngine, timeout),
+            )
+            / snmpEngine.transportDispatcher.getTimerResolution()
+        )
+
     def sendPdu(
         self,
         snmpEngine: SnmpEngine,
@@ -252,6 +312,21 @@ class CommandGenerator:
             contextEngineId = SnmpEngineID(contextEngineId)
         contextName = SnmpAdminString(contextName)
 
+        repetitionsEstimator = snmpEngine.getUserContext("repetitionsEstimator")
+
+        # Learned max-repetitions take over requested ones
+        if (
+            repetitionsEstimator is not None
+            and PDU.tagSet == v2c.GetBulkRequestPDU.tagSet
+        ):
+            v2c.apiBulkPDU.setMaxRepetitions(
+                PDU,
+                repetitionsEstimator.getMaxRepetitions(
+                    (transportDomain, transportAddress),
+                    int(v2c.apiBulkPDU.getMaxRepetitions(PDU)),
+                ),
+            )
+
         origPDU = PDU
 
         # User-side API assumes SMIv2
@@ -277,7 +352,13 @@ class CommandGenerator:
             pduVersion,
             PDU,
             True,
-            timeoutInTicks,
+            self.__getTimeout(
+                snmpEngine,
+                snmpEngine.getUserContext("rttEstimator"),
+                transportDomain,
+                transportAddress,
+                timeoutInTicks,
+            ),
             self.processResponsePdu,
             (sendRequestHandle, cbFun, cbCtx),
         )
@@ -299,6 +380,7 @@ class CommandGenerator:
             retryCount,
             0,
             0,
+            time.monotonic(),
         )
 
         debug.logger & debug.FLAG_APP and debug.logger(
@@ -509,9 +591,63 @@ class NextCommandGenerator(NextCommandGeneratorSingleRun):
 
 
 class BulkCommandGeneratorSingleRun(CommandGenerator):
+    def _resendTooBig(self, snmpEngine, sendRequestHandle, PDU, cbCtx):
+        """Re-send request with max-repetitions reduced on tooBig."""
+        repetitionsEstimator = snmpEngine.getUserContext("repetitionsEstimator")
+
+        if (
+            repetitionsEstimator is None
+            or v2c.apiBulkPDU.getErrorStatus(PDU) != _TOO_BIG
+        ):
+            return False
+
+        targetName, _, _, contextEngineId, contextName, reqPDU, _, _ = cbCtx
+
+        transportDomain, transportAddress = config.getTargetInfo(
+            snmpEngine, targetName
+        )[:2]
+
+        if repetitionsEstimator.getMaxRepetitions(
+            (transportDomain, transportAddress), 0
+        ) >= v2c.apiBulkPDU.getMaxRepetitions(reqPDU):
+            return False
+
+        v2c.apiBulkPDU.setRequestID(reqPDU, v2c.getNextRequestID())
+
+        try:
+            self.sendPdu(
+                snmpEngine,
+                targetName,
+                contextEngineId,
+                contextName,
+                reqPDU,
+                self.processResponseVarBinds,
+                cbCtx,
+            )
+
+        except StatusInformation:
+            debug.logger & debug.FLAG_APP and debug.logger(
+                "processResponseVarBinds: sendRequestHandle {}: _sendPdu() failed with {!r}".format(
+                    sendRequestHandle, sys.exc_info()[1]
+                )
+            )
+            return False
+
+        debug.logger & debug.FLAG_APP and debug.logger(
+            "processResponseVarBinds: sendRequestHandle %s, tooBig, retrying with fewer repetitions"
+            % sendRequestHandle
+        )
+
+        return True
+
     def processResponseVarBinds(
         self, snmpEngine, sendRequestHandle, errorIndication, PDU, cbCtx
     ):
+        if not errorIndication and self._resendTooBig(
+            snmpEngine, sendRequestHandle, PDU, cbCtx
+        ):
+            return
+
         (
             targetName,
             nonRepeaters,
@@ -577,6 +713,11 @@ class BulkCommandGenerator(BulkCommandGeneratorSingleRun):
     def processResponseVarBinds(
         self, snmpEngine, sendRequestHandle, errorIndication, PDU, cbCtx
     ):
+        if not errorIndication and self._resendTooBig(
+            snmpEngine, sendRequestHandle, PDU, cbCtx
+        ):
+            return
+
         (
             targetName,
             nonRepeaters,
@@ -4,6 +4,7 @@
 # Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysnmp/license.html
 #
+import asyncio
 import sys
 from pysnmp.proto import rfc1902, rfc1905, rfc3411, errind, error
 from pysnmp.proto.api import v2c  # backend is always SMIv2 compliant
@@ -17,6 +18,14 @@ class CommandResponderBase:
     ACM_ID = 3  # default MIB access control method to use
     SUPPORTED_PDU_TYPES = ()
 
+    # Let managed objects hooks be coroutines, serve requests concurrently
+    asyncInstrumentation = False
+    # Seconds managed objects may take to serve asynchronous read request,
+    # write requests are never interrupted half way through their commit
+    instrumentationTimeout = None
+    # concurrent.futures.Executor to run synchronous getValue hooks in
+    instrumentationExecutor = None
+
     SMI_ERROR_MAP = {
         pysnmp.smi.error.TooBigError: "tooBig",
         pysnmp.smi.error.NoSuchNameError: "noSuchName",
@@ -44,15 +53,23 @@ class CommandResponderBase:
         )
         self.snmpContext = snmpContext
         self.__pendingReqs = {}
+        self.__pendingTasks = set()
 
     def handleMgmtOperation(self, snmpEngine, stateReference, contextName, PDU, acInfo):
         pass
 
+    async def handleMgmtOperationAsync(
+        self, snmpEngine, stateReference, contextName, PDU, acInfo
+    ):
+        self.handleMgmtOperation(snmpEngine, stateReference, contextName, PDU, acInfo)
+
     def close(self, snmpEngine):
         snmpEngine.msgAndPduDsp.unregisterContextEngineId(
             self.snmpContext.contextEngineId, self.SUPPORTED_PDU_TYPES
         )
-        self.snmpContext = self.__pendingReqs = None
+        for task in self.__pendingTasks:
+            task.cancel()
+        self.snmpContext = self.__pendingReqs = self.__pendingTasks = None
 
     def sendVarBinds(
         self, snmpEngine, stateReference, errorStatus, errorIndex, varBinds
@@ -139,7 +156,7 @@ class CommandResponderBase:
     _counter64Type = rfc1902.Counter64.tagSet
 
     def releaseStateInformation(self, stateReference):
-        if stateReference in self.__pendingReqs:
+        if self.__pendingReqs and stateReference in self.__pendingReqs:
             del self.__pendingReqs[stateReference]
 
     def processPdu(
@@ -198,70 +215,130 @@ class CommandResponderBase:
             f"processPdu: stateReference {stateReference}, varBinds {varBinds}"
         )
 
-        try:
-            self.handleMgmtOperation(
+        acInfo = (
+            self.__verifyAccess,
+            (
                 snmpEngine,
-                stateReference,
+                securityModel,
+                securityName,
+                securityLevel,
                 contextName,
-                PDU,
-                (self.__verifyAccess, snmpEngine),
+                PDU.tagSet,
+            ),
+        )
+
+        if self.asyncInstrumentation:
+            task = asyncio.ensure_future(
+                self.__processPduAsync(
+                    snmpEngine, stateReference, contextName, PDU, acInfo
+                )
+            )
+            self.__pendingTasks.add(task)
+            task.add_done_callback(self.__pendingTasks.discard)
+            return
+
+        try:
+            self.handleMgmtOperation(
+                snmpEngine, stateReference, contextName, PDU, acInfo
             )
 
             return
 
         # SNMPv2 SMI exceptions
         except pysnmp.smi.error.SmiError:
-            errorIndication = sys.exc_info()[1]
+            self.__reportError(snmpEngine, stateReference, varBinds, sys.exc_info()[1])
 
+        except pysnmp.error.PySnmpError:
             debug.logger & debug.FLAG_APP and debug.logger(
-                f"processPdu: stateReference {stateReference}, errorIndication {errorIndication}"
+                "processPdu: stateReference %s, error "
+                "%s" % (stateReference, sys.exc_info()[1])
             )
-            if "oid" in errorIndication:
-                # Request REPORT generation
-                statusInformation["oid"] = errorIndication["oid"]
-                statusInformation["val"] = errorIndication["val"]
 
-            errorStatus = self.SMI_ERROR_MAP.get(errorIndication.__class__, "genErr")
+        self.releaseStateInformation(stateReference)
 
-            try:
-                errorIndex = errorIndication["idx"] + 1
+    async def __processPduAsync(
+        self, snmpEngine, stateReference, contextName, PDU, acInfo
+    ):
+        # cancelling write FSM would skip its undo and cleanup states
+        if PDU.tagSet in rfc3411.WRITE_CLASS_PDUS:
+            timeout = None
+        else:
+            timeout = self.instrumentationTimeout
 
-            except KeyError:
-                errorIndex = 1
+        try:
+            try:
+                await asyncio.wait_for(
+                    self.handleMgmtOperationAsync(
+                        snmpEngine, stateReference, contextName, PDU, acInfo
+                    ),
+                    timeout,
+                )
 
-            if len(varBinds) > errorIndex:
-                errorIndex = 1
+            except asyncio.TimeoutError:
+                debug.logger & debug.FLAG_APP and debug.logger(
+                    f"__processPduAsync: stateReference {stateReference}, timed out"
+                )
+                raise pysnmp.smi.error.GenError()
 
-            # rfc1905: 4.2.1.3
-            if errorStatus == "tooBig":
-                errorIndex = 0
-                varBinds = []
+            return
 
-            # Report error
-            self.sendVarBinds(
-                snmpEngine, stateReference, errorStatus, errorIndex, varBinds
+        # SNMPv2 SMI exceptions
+        except pysnmp.smi.error.SmiError:
+            self.__reportError(
+                snmpEngine,
+                stateReference,
+                v2c.apiPDU.getVarBinds(PDU),
+                sys.exc_info()[1],
             )
 
         except pysnmp.error.PySnmpError:
             debug.logger & debug.FLAG_APP and debug.logger(
-                "processPdu: stateReference %s, error "
+                "__processPduAsync: stateReference %s, error "
                 "%s" % (stateReference, sys.exc_info()[1])
             )
 
-        self.releaseStateInformation(stateReference)
+        finally:
+            self.releaseStateInformation(stateReference)
 
-    def __verifyAccess(self, name, syntax, idx, viewType, acCtx):
-        snmpEngine = acCtx
-        execCtx = snmpEngine.observer.getExecutionContext(
-            "rfc3412.receiveMessage:request"
-        )
-        (securityModel, securityName, securityLevel, contextName, pduType) = (
-            execCtx["securityModel"],
-            execCtx["securityName"],
-            execCtx["securityLevel"],
-            execCtx["contextName"],
-            execCtx["pdu"].getTagSet(),
+    def __reportError(self, snmpEngine, stateReference, varBinds, errorIndication):
+        statusInformation = self.__pendingReqs[stateReference][-1]
+
+        debug.logger & debug.FLAG_APP and debug.logger(
+            f"processPdu: stateReference {stateReference}, errorIndication {errorIndication}"
         )
+        if "oid" in errorIndication:
+            # Request REPORT generation
+            statusInformation["oid"] = errorIndication["oid"]
+            statusInformation["val"] = errorIndication["val"]
+
+        errorStatus = self.SMI_ERROR_MAP.get(errorIndication.__class__, "genErr")
+
+        try:
+            errorIndex = errorIndication["idx"] + 1
+
+        except KeyError:
+            errorIndex = 1
+
+        if len(varBinds) > errorIndex:
+            errorIndex = 1
+
+        # rfc1905: 4.2.1.3
+        if errorStatus == "tooBig":
+            errorIndex = 0
+            varBinds = []
+
+        # Report error
+        self.sendVarBinds(snmpEngine, stateReference, errorStatus, errorIndex, varBinds)
+
+    def __verifyAccess(self, name, syntax, idx, viewType, acCtx):
+        (
+            snmpEngine,
+            securityModel,
+            securityName,
+            securityLevel,
+            contextName,
+            pduType,
+        ) = acCtx
         try:
             snmpEngine.accessControlModel[self.ACM_ID].isAccessAllowed(
                 snmpEngine,
@@ -335,6 +412,25 @@ class GetCommandResponder(CommandResponderBase):
         )
         self.releaseStateInformation(stateReference)
 
+    async def handleMgmtOperationAsync(
+        self, snmpEngine, stateReference, contextName, PDU, acInfo
+    ):
+        (acFun, acCtx) = acInfo
+        # rfc1905: 4.2.1.1
+        mgmtFun = self.snmpContext.getMibInstrum(contextName).readVarsAsync
+        self.sendVarBinds(
+            snmpEngine,
+            stateReference,
+            0,
+            0,
+            await mgmtFun(
+                v2c.apiPDU.getVarBinds(PDU),
+                (acFun, acCtx),
+                executor=self.instrumentationExecutor,
+            ),
+        )
+        self.releaseStateInformation(stateReference)
+
 
 class NextCommandResponder(CommandResponderBase):
     SUPPORTED_PDU_TYPES = (rfc1905.GetNextRequestPDU.tagSet,)
@@ -356,6 +452,26 @@ class NextCommandResponder(CommandResponderBase):
                 break
         self.releaseStateInformation(stateReference)
 
+    async def handleMgmtOperationAsync(
+        self, snmpEngine, stateReference, contextName, PDU, acInfo
+    ):
+        (acFun, acCtx) = acInfo
+        # rfc1905: 4.2.2.1
+        mgmtFun = self.snmpContext.getMibInstrum(contextName).readNextVarsAsync
+        varBinds = v2c.apiPDU.getVarBinds(PDU)
+        while True:
+            rspVarBinds = await mgmtFun(
+                varBinds, (acFun, acCtx), executor=self.instrumentationExecutor
+            )
+            try:
+                self.sendVarBinds(snmpEngine, stateReference, 0, 0, rspVarBinds)
+            except error.StatusInformation:
+                idx = sys.exc_info()[1]["idx"]
+                varBinds[idx] = (rspVarBinds[idx][0], varBinds[idx][1])
+            else:
+                break
+        self.releaseStateInformation(stateReference)
+
 
 class BulkCommandResponder(CommandResponderBase):
     SUPPORTED_PDU_TYPES = (rfc1905.GetBulkRequestPDU.tagSet,)
@@ -403,6 +519,55 @@ class BulkCommandResponder(CommandResponderBase):
         else:
             raise pysnmp.smi.error.SmiError()
 
+    async def handleMgmtOperationAsync(
+        self, snmpEngine, stateReference, contextName, PDU, acInfo
+    ):
+        (acFun, acCtx) = acInfo
+        nonRepeaters = v2c.apiBulkPDU.getNonRepeaters(PDU)
+        if nonRepeaters < 0:
+            nonRepeaters = 0
+        maxRepetitions = v2c.apiBulkPDU.getMaxRepetitions(PDU)
+        if maxRepetitions < 0:
+            maxRepetitions = 0
+
+        reqVarBinds = v2c.apiPDU.getVarBinds(PDU)
+
+        N = min(int(nonRepeaters), len(reqVarBinds))
+        M = int(maxRepetitions)
+        R = max(len(reqVarBinds) - N, 0)
+
+        if R:
+            M = min(M, self.maxVarBinds // R)
+
+        debug.logger & debug.FLAG_APP and debug.logger(
+            "handleMgmtOperationAsync: N %d, M %d, R %d" % (N, M, R)
+        )
+
+        mgmtFun = self.snmpContext.getMibInstrum(contextName).readNextVarsAsync
+
+        if N:
+            rspVarBinds = await mgmtFun(
+                reqVarBinds[:N], (acFun, acCtx), executor=self.instrumentationExecutor
+            )
+        else:
+            rspVarBinds = []
+
+        varBinds = reqVarBinds[-R:]
+        while M and R:
+            rspVarBinds.extend(
+                await mgmtFun(
+                    varBinds, (acFun, acCtx), executor=self.instrumentationExecutor
+                )
+            )
+            varBinds = rspVarBinds[-R:]
+            M -= 1
+
+        if len(rspVarBinds):
+            self.sendVarBinds(snmpEngine, stateReference, 0, 0, rspVarBinds)
+            self.releaseStateInformation(stateReference)
+        else:
+            raise pysnmp.smi.error.SmiError()
+
 
 class SetCommandResponder(CommandResponderBase):
     SUPPORTED_PDU_TYPES = (rfc1905.SetRequestPDU.tagSet,)
@@ -428,3 +593,30 @@ class SetCommandResponder(CommandResponderBase):
             e = pysnmp.smi.error.NotWritableError()
             e.update(sys.exc_info()[1])
             raise e
+
+    async def handleMgmtOperationAsync(
+        self, snmpEngine, stateReference, contextName, PDU, acInfo
+    ):
+        (acFun, acCtx) = acInfo
+        mgmtFun = self.snmpContext.getMibInstrum(contextName).writeVarsAsync
+        # rfc1905: 4.2.5.1-13
+        try:
+            self.sendVarBinds(
+                snmpEngine,
+                stateReference,
+                0,
+                0,
+                await mgmtFun(
+                    v2c.apiPDU.getVarBinds(PDU),
+                    (acFun, acCtx),
+                    executor=self.instrumentationExecutor,
+                ),
+            )
+            self.releaseStateInformation(stateReference)
+        except (
+            pysnmp.smi.error.NoSuchObjectError,
+            pysnmp.smi.error.NoSuchInstanceError,
+        ):
+            e = pysnmp.smi.error.NotWritableError()
+            e.update(sys.exc_info()[1])
+            raise e
@@ -11,6 +11,18 @@ from pysnmp.smi.error import SmiError, NoSuchInstanceError
 from pysnmp.entity import config
 
 
+def __invalidateRows(cache, mapName, tableEntry):
+    # Drop cached values derived from table rows modified since last call
+    changedRows = tableEntry.getChangedRowsSince(cache["id"])
+    if changedRows is None:
+        cache[mapName] = {}
+    else:
+        for instId in changedRows:
+            cache[mapName].pop(instId, None)
+
+    cache["id"] = tableEntry.branchVersionId
+
+
 def getTargetAddr(snmpEngine: SnmpEngine, snmpTargetAddrName):
     mibBuilder = snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder
 
@@ -20,15 +32,17 @@ def getTargetAddr(snmpEngine: SnmpEngine, snmpTargetAddrName):
 
     cache: "dict[str, Any] | None" = snmpEngine.getUserContext("getTargetAddr")
     if cache is None:
-        cache = {"id": -1}
+        cache = {"id": -1, "nameToTargetMap": {}}
         snmpEngine.setUserContext(getTargetAddr=cache)
 
     if cache["id"] != snmpTargetAddrEntry.branchVersionId:
-        cache["nameToTargetMap"] = {}
+        __invalidateRows(cache, "nameToTargetMap", snmpTargetAddrEntry)
 
     nameToTargetMap = cache["nameToTargetMap"]
 
-    if snmpTargetAddrName not in nameToTargetMap:
+    tblIdx = snmpTargetAddrEntry.getInstIdFromIndices(snmpTargetAddrName)
+
+    if tblIdx not in nameToTargetMap:
         (
             snmpTargetAddrTDomain,
             snmpTargetAddrTAddress,
@@ -45,8 +59,6 @@ def getTargetAddr(snmpEngine: SnmpEngine, snmpTargetAddrName):
         )
         (snmpSourceAddrTAddress,) = mibBuilder.importSymbols("PYSNMP-SOURCE-MIB", "snmpSourceAddrTAddress")  # type: ignore
 
-        tblIdx = snmpTargetAddrEntry.getInstIdFromIndices(snmpTargetAddrName)
-
         try:
             snmpTargetAddrTDomain = snmpTargetAddrTDomain.getNode(
                 snmpTargetAddrTDomain.name + tblIdx
@@ -97,7 +109,7 @@ def getTargetAddr(snmpEngine: SnmpEngine, snmpTargetAddrName):
         ):
             addr = transport.ADDRESS_TYPE(snmpTargetAddrTAddress)  # type: ignore
 
-        nameToTargetMap[snmpTargetAddrName] = (
+        nameToTargetMap[tblIdx] = (
             snmpTargetAddrTDomain,
             addr,
             snmpTargetAddrTimeout,
@@ -105,9 +117,7 @@ def getTargetAddr(snmpEngine: SnmpEngine, snmpTargetAddrName):
             snmpTargetAddrParams,
         )
 
-        cache["id"] = snmpTargetAddrEntry.branchVersionId
-
-    return nameToTargetMap[snmpTargetAddrName]
+    return nameToTargetMap[tblIdx]
 
 
 def getTargetParams(snmpEngine: SnmpEngine, paramsName):
@@ -119,15 +129,17 @@ def getTargetParams(snmpEngine: SnmpEngine, paramsName):
 
     cache: "dict[str, Any] | None" = snmpEngine.getUserContext("getTargetParams")
     if cache is None:
-        cache = {"id": -1}
+        cache = {"id": -1, "nameToParamsMap": {}}
         snmpEngine.setUserContext(getTargetParams=cache)
 
     if cache["id"] != snmpTargetParamsEntry.branchVersionId:
-        cache["nameToParamsMap"] = {}
+        __invalidateRows(cache, "nameToParamsMap", snmpTargetParamsEntry)
 
     nameToParamsMap = cache["nameToParamsMap"]
 
-    if paramsName not in nameToParamsMap:
+    tblIdx = snmpTargetParamsEntry.getInstIdFromIndices(paramsName)
+
+    if tblIdx not in nameToParamsMap:
         (
             snmpTargetParamsMPModel,
             snmpTargetParamsSecurityModel,
@@ -141,8 +153,6 @@ def getTargetParams(snmpEngine: SnmpEngine, paramsName):
             "snmpTargetParamsSecurityLevel",
         )
 
-        tblIdx = snmpTargetParamsEntry.getInstIdFromIndices(paramsName)
-
         try:
             snmpTargetParamsMPModel = snmpTargetParamsMPModel.getNode(
                 snmpTargetParamsMPModel.name + tblIdx
@@ -159,16 +169,14 @@ def getTargetParams(snmpEngine: SnmpEngine, paramsName):
         except NoSuchInstanceError:
             raise SmiError("Parameters %s not configured at LCD" % paramsName)
 
-        nameToParamsMap[paramsName] = (
+        nameToParamsMap[tblIdx] = (
             snmpTargetParamsMPModel,
             snmpTargetParamsSecurityModel,
             snmpTargetParamsSecurityName,
             snmpTargetParamsSecurityLevel,
         )
 
-        cache["id"] = snmpTargetParamsEntry.branchVersionId
-
-    return nameToParamsMap[paramsName]
+    return nameToParamsMap[tblIdx]
 
 
 def getTargetInfo(snmpEngine: SnmpEngine, snmpTargetAddrName):
@@ -250,13 +258,7 @@ def getTargetNames(snmpEngine: SnmpEngine, tag):
         cache = {"id": -1}
         snmpEngine.setUserContext(getTargetNames=cache)
 
-    if cache["id"] == snmpTargetAddrEntry.branchVersionId:
-        tagToTargetsMap = cache["tagToTargetsMap"]
-    else:
-        cache["tagToTargetsMap"] = {}
-
-        tagToTargetsMap = cache["tagToTargetsMap"]
-
+    if cache["id"] != snmpTargetAddrEntry.branchVersionId:
         (
             SnmpTagValue,
             snmpTargetAddrName,
@@ -267,27 +269,70 @@ def getTargetNames(snmpEngine: SnmpEngine, tag):
             "snmpTargetAddrName",
             "snmpTargetAddrTagList",
         )
-        mibNode = snmpTargetAddrTagList
-        while True:
-            try:
-                mibNode = snmpTargetAddrTagList.getNextNode(mibNode.name)
-            except NoSuchInstanceError:
-                break
 
-            idx = mibNode.name[len(snmpTargetAddrTagList.name) :]
+        changedRows = snmpTargetAddrEntry.getChangedRowsSince(cache["id"])
 
-            _snmpTargetAddrName = snmpTargetAddrName.getNode(
-                snmpTargetAddrName.name + idx
-            ).syntax
+        if changedRows is None:
+            cache["tagToTargetsMap"] = {}
+            cache["tagToRowsMap"] = {}
+            cache["rowToTagsMap"] = {}
+
+            changedRows = []
+
+            mibNode = snmpTargetAddrTagList
+            while True:
+                try:
+                    mibNode = snmpTargetAddrTagList.getNextNode(mibNode.name)
+                except NoSuchInstanceError:
+                    break
 
-            for _tag in mibNode.syntax.asOctets().split():
-                _tag = SnmpTagValue(_tag)
-                if _tag not in tagToTargetsMap:
-                    tagToTargetsMap[_tag] = []
-                tagToTargetsMap[_tag].append(_snmpTargetAddrName)
+                changedRows.append(mibNode.name[len(snmpTargetAddrTagList.name) :])
+
+        tagToTargetsMap = cache["tagToTargetsMap"]
+        tagToRowsMap = cache["tagToRowsMap"]
+        rowToTagsMap = cache["rowToTagsMap"]
+
+        changedTags = set()
+
+        for idx in changedRows:
+            for _tag in rowToTagsMap.pop(idx, ()):
+                del tagToRowsMap[_tag][idx]
+                changedTags.add(_tag)
+
+            try:
+                _snmpTargetAddrTagList = snmpTargetAddrTagList.getNode(
+                    snmpTargetAddrTagList.name + idx
+                ).syntax
+                _snmpTargetAddrName = snmpTargetAddrName.getNode(
+                    snmpTargetAddrName.name + idx
+                ).syntax
+            except NoSuchInstanceError:
+                continue  # row is gone
+
+            rowToTagsMap[idx] = {
+                SnmpTagValue(_tag) for _tag in _snmpTargetAddrTagList.asOctets().split()
+            }
+
+            for _tag in rowToTagsMap[idx]:
+                if _tag not in tagToRowsMap:
+                    tagToRowsMap[_tag] = {}
+                tagToRowsMap[_tag][idx] = _snmpTargetAddrName
+                changedTags.add(_tag)
+
+        # Keep targets in table order
+        for _tag in changedTags:
+            if tagToRowsMap[_tag]:
+                tagToTargetsMap[_tag] = [
+                    tagToRowsMap[_tag][idx] for idx in sorted(tagToRowsMap[_tag])
+                ]
+            else:
+                del tagToRowsMap[_tag]
+                tagToTargetsMap.pop(_tag, None)
 
         cache["id"] = snmpTargetAddrEntry.branchVersionId
 
+    tagToTargetsMap = cache["tagToTargetsMap"]
+
     if tag not in tagToTargetsMap:
         raise SmiError("Transport tag %s not configured at LCD" % tag)
 
@@ -100,18 +100,11 @@ class NotificationOriginator:
                 / snmpEngine.transportDispatcher.getTimerResolution()
             )
 
-            # User-side API assumes SMIv2
-            if messageProcessingModel == 0:
-                reqPDU = rfc2576.v2ToV1(origPdu)
-                pduVersion = 0
-            else:
-                reqPDU = origPdu
-                pduVersion = 1
-
             # 3.3.6a
             try:
-                sendPduHandle = snmpEngine.msgAndPduDsp.sendPdu(
+                sendPduHandle = snmpEngine.msgAndPduDsp.retryPdu(
                     snmpEngine,
+                    sendPduHandle,
                     origTransportDomain,
                     origTransportAddress,
                     origMessageProcessingModel,
@@ -120,9 +113,7 @@ class NotificationOriginator:
                     origSecurityLevel,
                     origContextEngineId,
                     origContextName,
-                    pduVersion,
-                    reqPDU,
-                    True,
+                    origPdu,
                     timeoutInTicks,
                     self.processResponsePdu,
                     (sendRequestHandle, cbFun, cbCtx),
@@ -4,12 +4,16 @@
 # Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysnmp/license.html
 #
+import asyncio
 import sys
+import time
+from collections import deque
 from pyasn1.compat.octets import null
 from pysnmp.proto import rfc3411, error
 from pysnmp.proto.api import v1, v2c  # backend is always SMIv2 compliant
 from pysnmp.proto.proxy import rfc2576
 from pysnmp import debug
+from pysnmp.error import PySnmpError
 
 
 # 3.4
@@ -157,3 +161,218 @@ class NotificationReceiver:
                     varBinds,
                     self.__cbCtx,
                 )
+
+
+class NotificationQueue:
+    """Bounded queue of received notifications consumed in batches.
+
+    Decouples notification reception from their processing: the `put`
+    method is meant to serve as :py:class:`NotificationReceiver` callback,
+    it only queues notification and returns, while consumers pick up
+    notifications in batches asynchronously:
+
+    >>> ntfQueue = NotificationQueue(maxSize=10000, batchSize=100)
+    >>> NotificationReceiver(snmpEngine, ntfQueue.put)
+    >>> async for batch in ntfQueue:
+    ...     for transportDomain, transportAddress, contextEngineId, contextName, varBinds in batch:
+    ...         ...
+
+    Batch is handed out once `batchSize` notifications are queued or
+    `batchTimeout` has passed since the oldest of them was received,
+    whichever comes first. Slow consumers never stall reception, once
+    queue is full new notifications are handled by `overflowPolicy`:
+
+    * `drop` - new notification is dropped
+    * `oldest` - oldest queued notification is dropped to make room
+    * `sample` - every `sampleRate`-th notification replaces the oldest
+      queued one, others are dropped
+
+    Parameters
+    ----------
+    maxSize : int
+        Largest number of notifications to keep queued.
+    batchSize : int
+        Largest number of notifications handed out at once.
+    batchTimeout : float
+        Longest time, seconds, queued notification waits for the batch
+        to fill up.
+    overflowPolicy : str
+        What to do with notifications received while queue is full.
+    sampleRate : int
+        Overflowing notifications admission rate for `sample` policy.
+    """
+
+    OVERFLOW_POLICIES = ("drop", "oldest", "sample")
+
+    def __init__(
+        self,
+        maxSize=10000,
+        batchSize=100,
+        batchTimeout=0.1,
+        overflowPolicy="drop",
+        sampleRate=10,
+    ):
+        if not 0 < batchSize <= maxSize or batchTimeout < 0:
+            raise PySnmpError("Bad notification queue batch parameters")
+        if overflowPolicy not in self.OVERFLOW_POLICIES or sampleRate < 1:
+            raise PySnmpError("Bad notification queue overflow policy")
+
+        self.maxSize = maxSize
+        self.batchSize = batchSize
+        self.batchTimeout = batchTimeout
+        self.overflowPolicy = overflowPolicy
+        self.sampleRate = sampleRate
+
+        # (reception time, notification) pairs
+        self.__queue = deque()
+        # created on first use to bind to the running event loop
+        self.__event = None
+        self.__closed = False
+        self.__overflows = 0
+
+        self.__received = self.__delivered = self.__dropped = 0
+        self.__latency = self.__maxLatency = 0.0
+
+    def __len__(self):
+        return len(self.__queue)
+
+    def __getEvent(self):
+        if self.__event is None:
+            self.__event = asyncio.Event()
+
+        return self.__event
+
+    def put(
+        self, snmpEngine, stateReference, contextEngineId, contextName, varBinds, cbCtx
+    ):
+        """Queue notification, meant to serve as notification receiver callback."""
+        self.__received += 1
+
+        try:
+            (
+                transportDomain,
+                transportAddress,
+            ) = snmpEngine.msgAndPduDsp.getTransportInfo(stateReference)
+
+        except error.ProtocolError:
+            transportDomain = transportAddress = None
+
+        if len(self.__queue) >= self.maxSize:
+            self.__overflows += 1
+
+            if self.overflowPolicy == "drop" or (
+                self.overflowPolicy == "sample" and self.__overflows % self.sampleRate
+            ):
+                self.__dropped += 1
+
+                debug.logger & debug.FLAG_APP and debug.logger(
+                    f"put: queue full, notification from {transportAddress} dropped"
+                )
+                return
+
+            self.__queue.popleft()
+            self.__dropped += 1
+
+        else:
+            self.__overflows = 0
+
+        self.__queue.append(
+            (
+                time.monotonic(),
+                (
+                    transportDomain,
+                    transportAddress,
+                    contextEngineId,
+                    contextName,
+                    varBinds,
+                ),
+            )
+        )
+
+        if self.__event is not None:
+            self.__event.set()
+
+    async def getBatch(self):
+        """Wait for and return a batch of queued notifications.
+
+        Returns
+        -------
+        list
+            List of `(transportDomain, transportAddress, contextEngineId,
+            contextName, varBinds)` tuples, empty once queue is closed
+            and drained.
+        """
+        event = self.__getEvent()
+
+        while not self.__queue:
+            if self.__closed:
+                return []
+
+            event.clear()
+            await event.wait()
+
+        if len(self.__queue) < self.batchSize:
+            deadline = self.__queue[0][0] + self.batchTimeout
+
+            while len(self.__queue) < self.batchSize and not self.__closed:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+
+                event.clear()
+
+                try:
+                    await asyncio.wait_for(event.wait(), timeout)
+
+                except asyncio.TimeoutError:
+                    break
+
+        now = time.monotonic()
+
+        batch = []
+
+        while self.__queue and len(batch) < self.batchSize:
+            receivedAt, notification = self.__queue.popleft()
+            latency = now - receivedAt
+            self.__latency += latency
+            self.__maxLatency = max(self.__maxLatency, latency)
+            batch.append(notification)
+
+        self.__delivered += len(batch)
+
+        return batch
+
+    def close(self):
+        """Stop handing out batches once queue is drained."""
+        self.__closed = True
+        if self.__event is not None:
+            self.__event.set()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        batch = await self.getBatch()
+        if not batch:
+            raise StopAsyncIteration
+
+        return batch
+
+    def getStatistics(self):
+        """Return queue depth and notification counters.
+
+        Returns
+        -------
+        dict
+            `depth`, `received`, `delivered` and `dropped` notifications
+            counts, average and maximum time, seconds, notifications
+            spent queued as `latency` and `maxLatency`.
+        """
+        return {
+            "depth": len(self.__queue),
+            "received": self.__received,
+            "delivered": self.__delivered,
+            "dropped": self.__dropped,
+            "latency": self.__latency / self.__delivered if self.__delivered else 0.0,
+            "maxLatency": self.__maxLatency,
+        }
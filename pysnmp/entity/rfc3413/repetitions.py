@@ -0,0 +1,233 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+from pysnmp import debug, error
+from pysnmp.proto import ber, rfc1905
+from pysnmp.proto.api import v2c
+
+__all__ = ["RepetitionsEstimator"]
+
+_TOO_BIG = rfc1905.errorStatus.clone("tooBig")
+
+
+class RepetitionsEstimator:
+    """Per-peer GETBULK max-repetitions estimator.
+
+    Learns how many repetitions to request from each
+    `(transportDomain, transportAddress)` pair for responses to be as
+    large as still fits `maxMessageSize`. Repetitions are re-estimated
+    from the observed response size per row, growing by at most
+    `growthFactor` at a time. Responses reporting `tooBig` halve the
+    repetitions, and so do responses slower than `maxLatency`. Responses
+    truncated by the agent cap repetitions at the number of rows it
+    returned. Once `probeInterval` responses went by without hitting
+    the cap, it is raised again in case the limiting condition was
+    transient.
+
+    Command generator applications switch from fixed max-repetitions to
+    learned ones once estimator is attached to SNMP engine:
+
+    >>> snmpEngine.setUserContext(repetitionsEstimator=RepetitionsEstimator())
+
+    Max-repetitions passed by application is then only used for peers
+    not yet measured. GETBULK requests answered with `tooBig` are sent
+    again with fewer repetitions.
+
+    Parameters
+    ----------
+    minRepetitions : int
+        Lower bound of max-repetitions.
+    maxRepetitions : int
+        Upper bound of max-repetitions.
+    maxMessageSize : int
+        Largest response message wanted, octets. Defaults to what fits
+        into an Ethernet frame without fragmentation.
+    maxLatency : float
+        Response time, seconds, beyond which repetitions are reduced.
+        No latency limit if `None`.
+    growthFactor : float
+        Largest max-repetitions multiplier applied on each response.
+    probeInterval : int
+        Number of successful responses after which repetitions cap is
+        lifted by `growthFactor`. Cap is never lifted if `0`.
+    """
+
+    ALPHA = 0.25
+    # room for message header and security parameters
+    HEADROOM = 128
+
+    def __init__(
+        self,
+        minRepetitions=1,
+        maxRepetitions=256,
+        maxMessageSize=1452,
+        maxLatency=None,
+        growthFactor=2.0,
+        probeInterval=32,
+    ):
+        if not 0 < minRepetitions <= maxRepetitions:
+            raise error.PySnmpError("Bad repetitions estimator repetitions bounds")
+        if maxMessageSize <= self.HEADROOM or growthFactor < 1 or probeInterval < 0:
+            raise error.PySnmpError("Bad repetitions estimator growth parameters")
+
+        self.minRepetitions = minRepetitions
+        self.maxRepetitions = maxRepetitions
+        self.maxMessageSize = maxMessageSize
+        self.maxLatency = maxLatency
+        self.growthFactor = growthFactor
+        self.probeInterval = probeInterval
+        # peer -> [repetitions, repetitions limit, row size, samples count,
+        #          samples since limit was last set]
+        self.__peers = {}
+
+    def __clamp(self, repetitions):
+        return min(max(repetitions, self.minRepetitions), self.maxRepetitions)
+
+    def getMaxRepetitions(self, peer, maxRepetitions):
+        """Return max-repetitions for the next GETBULK request to `peer`.
+
+        Parameters
+        ----------
+        peer : tuple
+            `(transportDomain, transportAddress)` pair.
+        maxRepetitions : int
+            Requested max-repetitions, used for unmeasured peers.
+        """
+        if peer in self.__peers:
+            return self.__peers[peer][0]
+
+        return self.__clamp(maxRepetitions)
+
+    def addResponse(
+        self, peer, reqPDU, rspPDU, rtt=None, maxMessageSize=None, messageSize=None
+    ):
+        """Update `peer` estimates with GETBULK request outcome.
+
+        Parameters
+        ----------
+        peer : tuple
+            `(transportDomain, transportAddress)` pair.
+        reqPDU : :py:class:`~pysnmp.proto.rfc1905.GetBulkRequestPDU`
+            Request as sent to `peer`.
+        rspPDU : :py:class:`~pysnmp.proto.rfc1905.ResponsePDU`
+            Response received from `peer`.
+        rtt : float
+            Response time, seconds, or `None` if not measured.
+        maxMessageSize : int
+            Further limit response size, octets, e.g. to local
+            snmpEngineMaxMessageSize.
+        messageSize : int
+            Size of response message as received, octets. Estimated by
+            encoding `rspPDU` if not given.
+        """
+        requested = int(v2c.apiBulkPDU.getMaxRepetitions(reqPDU))
+
+        state = self.__peers.get(peer)
+
+        if state is None:
+            state = [self.__clamp(requested), self.maxRepetitions, None, 0, 0]
+
+        repetitions, limit, rowSize, samples, probeSamples = state
+
+        errorStatus = v2c.apiBulkPDU.getErrorStatus(rspPDU)
+
+        if errorStatus == _TOO_BIG:
+            repetitions = limit = self.__clamp(min(repetitions, requested) // 2)
+            probeSamples = 0
+
+        elif errorStatus:
+            return
+
+        else:
+            reqVarBinds = v2c.apiBulkPDU.getVarBinds(reqPDU)
+            nonRepeaters = min(
+                int(v2c.apiBulkPDU.getNonRepeaters(reqPDU)), len(reqVarBinds)
+            )
+
+            # repetitions do not matter without repeaters
+            if nonRepeaters == len(reqVarBinds):
+                return
+
+            varBindTable = v2c.apiBulkPDU.getVarBindTable(reqPDU, rspPDU)
+
+            if not varBindTable:
+                return
+
+            rows = len(varBindTable)
+
+            ended = any(
+                val.tagSet == rfc1905.endOfMibView.tagSet
+                for _, val in varBindTable[-1][nonRepeaters:]
+            )
+
+            # agent returned fewer rows than there are
+            if rows < requested and not ended:
+                limit = self.__clamp(rows)
+                probeSamples = 0
+
+            else:
+                probeSamples += 1
+
+                # see if whatever capped repetitions has gone away
+                if self.probeInterval and probeSamples >= self.probeInterval:
+                    limit = self.__clamp(max(limit + 1, int(limit * self.growthFactor)))
+                    probeSamples = 0
+
+            if messageSize is None:
+                messageSize = len(ber.encode(rspPDU))
+
+            size = messageSize / rows
+
+            if rowSize is None:
+                rowSize = size
+            else:
+                rowSize = (1 - self.ALPHA) * rowSize + self.ALPHA * size
+
+            if maxMessageSize:
+                maxMessageSize = min(maxMessageSize, self.maxMessageSize)
+            else:
+                maxMessageSize = self.maxMessageSize
+
+            fitting = int((maxMessageSize - self.HEADROOM) // rowSize)
+
+            # only grow on full responses
+            if rows >= requested:
+                repetitions = min(fitting, int(repetitions * self.growthFactor))
+            else:
+                repetitions = min(fitting, repetitions)
+
+            if (
+                self.maxLatency is not None
+                and rtt is not None
+                and rtt > self.maxLatency
+            ):
+                repetitions = min(repetitions, state[0] // 2)
+
+            repetitions = self.__clamp(min(repetitions, limit))
+
+        self.__peers[peer] = [repetitions, limit, rowSize, samples + 1, probeSamples]
+
+        debug.logger & debug.FLAG_APP and debug.logger(
+            f"addResponse: peer {peer}, requested {requested}, repetitions {repetitions}, limit {limit}"
+        )
+
+    def getPeerInfo(self, peer):
+        """Return `(repetitions, limit, rowSize, samples)` estimates for `peer`.
+
+        Row size is `None` until first successful response is received.
+        """
+        try:
+            return tuple(self.__peers[peer][:4])
+        except KeyError:
+            raise error.PySnmpError(f"No repetitions estimates for peer {peer}")
+
+    def getPeers(self):
+        """Return a list of peers having repetitions estimates."""
+        return list(self.__peers)
+
+    def forgetPeer(self, peer):
+        """Drop `peer` estimates."""
+        self.__peers.pop(peer, None)
@@ -0,0 +1,175 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+import random
+import time
+from collections import OrderedDict
+from pysnmp import debug, error
+
+__all__ = ["RttEstimator"]
+
+
+class RttEstimator:
+    """Per-peer round-trip time estimator driving request timeouts.
+
+    Keeps smoothed round-trip time (SRTT) and its variation (RTTVAR) for
+    each `(transportDomain, transportAddress)` pair, deriving request
+    retransmission timeout (RTO) from them the way TCP does (:RFC:`6298`).
+    On timeout, RTO of the peer is multiplied by `backoffFactor` up to
+    `maxTimeout` until a fresh round-trip time sample is taken. Timeouts
+    of requests that were in flight at once count as one, RTO is backed
+    off at most once per RTO period. Responses to retransmitted requests
+    are never sampled.
+
+    Command generator applications switch from fixed timeouts configured
+    at LCD to adaptive ones once estimator is attached to SNMP engine:
+
+    >>> snmpEngine.setUserContext(rttEstimator=RttEstimator())
+
+    Configured timeout is then only used as RTO for peers not yet
+    measured.
+
+    Parameters
+    ----------
+    minTimeout : float
+        Lower bound of RTO, seconds.
+    maxTimeout : float
+        Upper bound of RTO, seconds.
+    backoffFactor : float
+        RTO multiplier applied on each timeout.
+    jitter : float
+        Randomly stretch or shrink every timeout by up to this fraction
+        of it to avoid synchronized retransmissions.
+    maxPeers : int
+        Largest number of peers to keep estimates for, least recently
+        updated ones are forgotten first.
+    """
+
+    ALPHA = 0.125
+    BETA = 0.25
+    K = 4
+
+    def __init__(
+        self,
+        minTimeout=0.05,
+        maxTimeout=60.0,
+        backoffFactor=2.0,
+        jitter=0.1,
+        maxPeers=16384,
+    ):
+        if not 0 < minTimeout <= maxTimeout:
+            raise error.PySnmpError("Bad RTT estimator timeout bounds")
+        if backoffFactor < 1 or not 0 <= jitter < 1:
+            raise error.PySnmpError("Bad RTT estimator backoff parameters")
+        if maxPeers < 1:
+            raise error.PySnmpError("Bad RTT estimator peers limit")
+
+        self.minTimeout = minTimeout
+        self.maxTimeout = maxTimeout
+        self.backoffFactor = backoffFactor
+        self.jitter = jitter
+        self.maxPeers = maxPeers
+        # peer -> [srtt, rttvar, rto, samples count, no backoff until]
+        self.__peers = OrderedDict()
+
+    def __clamp(self, timeout):
+        return min(max(timeout, self.minTimeout), self.maxTimeout)
+
+    def __store(self, peer, state):
+        self.__peers[peer] = state
+        self.__peers.move_to_end(peer)
+
+        while len(self.__peers) > self.maxPeers:
+            self.__peers.popitem(last=False)
+
+    def getTimeout(self, peer, timeout):
+        """Return timeout for the next request to `peer`.
+
+        Parameters
+        ----------
+        peer : tuple
+            `(transportDomain, transportAddress)` pair.
+        timeout : float
+            Configured timeout, seconds, used for unmeasured peers.
+        """
+        if peer in self.__peers:
+            timeout = self.__peers[peer][2]
+        else:
+            timeout = self.__clamp(timeout)
+
+        if self.jitter:
+            timeout *= 1 + random.uniform(-self.jitter, self.jitter)
+
+        return timeout
+
+    def addSample(self, peer, rtt):
+        """Update `peer` estimates with newly measured round-trip time."""
+        state = self.__peers.get(peer)
+
+        if state is None or state[0] is None:
+            srtt = rtt
+            rttvar = rtt / 2
+            samples = 0
+        else:
+            srtt, rttvar, _, samples, _ = state
+            rttvar = (1 - self.BETA) * rttvar + self.BETA * abs(srtt - rtt)
+            srtt = (1 - self.ALPHA) * srtt + self.ALPHA * rtt
+
+        rto = self.__clamp(srtt + self.K * rttvar)
+
+        self.__store(peer, [srtt, rttvar, rto, samples + 1, None])
+
+        debug.logger & debug.FLAG_APP and debug.logger(
+            f"addSample: peer {peer}, rtt {rtt:.4f}, srtt {srtt:.4f}, rttvar {rttvar:.4f}, rto {rto:.4f}"
+        )
+
+    def backoff(self, peer, timeout):
+        """Back off `peer` RTO on request timeout.
+
+        Parameters
+        ----------
+        peer : tuple
+            `(transportDomain, transportAddress)` pair.
+        timeout : float
+            Configured timeout, seconds, used for unmeasured peers.
+        """
+        state = self.__peers.get(peer)
+
+        if state is None:
+            state = [None, None, self.__clamp(timeout), 0, None]
+
+        now = time.monotonic()
+
+        # other requests timed out within the same RTO period
+        if state[4] is not None and now < state[4]:
+            return
+
+        state[4] = now + state[2]
+        state[2] = min(state[2] * self.backoffFactor, self.maxTimeout)
+
+        self.__store(peer, state)
+
+        debug.logger & debug.FLAG_APP and debug.logger(
+            f"backoff: peer {peer}, rto {state[2]:.4f}"
+        )
+
+    def getPeerInfo(self, peer):
+        """Return `(srtt, rttvar, rto, samples)` estimates for `peer`.
+
+        SRTT and RTTVAR are `None` until first sample is taken.
+        """
+        try:
+            return tuple(self.__peers[peer][:4])
+        except KeyError:
+            raise error.PySnmpError(f"No RTT estimates for peer {peer}")
+
+    def getPeers(self):
+        """Return a list of peers having RTT estimates."""
+        return list(self.__peers)
+
+    def forgetPeer(self, peer):
+        """Drop `peer` estimates."""
+        self.__peers.pop(peer, None)
@@ -0,0 +1,182 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+import asyncio
+import multiprocessing
+import os
+import platform
+import signal
+from typing import Callable
+
+from pysnmp.carrier.asyncio.dgram import udp
+from pysnmp.carrier.base import AbstractTransport
+from pysnmp.entity import config
+from pysnmp.entity.engine import SnmpEngine
+from pysnmp.proto.rfc1902 import OctetString
+from pysnmp import debug
+from pysnmp import error
+
+__all__ = ["SnmpEngineWorkers"]
+
+
+def _generateSnmpEngineID() -> OctetString:
+    # Same algorithm as SNMP-FRAMEWORK-MIB::SnmpEngineID default value,
+    # computed once by the parent so that every worker shares it
+    snmpEngineID = [128, 0, 79, 184, 5]
+    snmpEngineID += [ord(x) for x in platform.node()[:16]]
+    snmpEngineID += [os.getpid() >> 8 & 0xFF, os.getpid() & 0xFF]
+    snmpEngineID += list(os.urandom(2))
+    return OctetString(snmpEngineID)
+
+
+def _runWorker(
+    configFun: Callable,
+    iface: "tuple[str, int]",
+    snmpEngineID: bytes,
+    transportDomain: "tuple[int, ...]",
+    protoTransport: "type[AbstractTransport]",
+):
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    snmpEngine = SnmpEngine(snmpEngineID=OctetString(snmpEngineID))
+
+    config.addTransport(
+        snmpEngine,
+        transportDomain,
+        protoTransport(loop=loop).openServerMode(iface, reusePort=True),
+    )
+
+    # LCD and SNMP applications are set up identically in every worker
+    configFun(snmpEngine)
+
+    debug.logger & debug.FLAG_APP and debug.logger(
+        "_runWorker: pid %s serving %s" % (os.getpid(), iface)
+    )
+
+    snmpEngine.transportDispatcher.jobStarted(1)  # type: ignore
+
+    # SnmpEngineWorkers.stop() sends SIGTERM, wind the dispatcher down
+    # rather than dying with its timer task still pending
+    loop.add_signal_handler(signal.SIGTERM, loop.stop)
+
+    try:
+        snmpEngine.openDispatcher()
+    finally:
+        snmpEngine.transportDispatcher.jobFinished(1)  # type: ignore
+        snmpEngine.closeDispatcher()
+        # let the cancelled timer task complete
+        loop.run_until_complete(asyncio.sleep(0))
+        loop.close()
+
+
+class SnmpEngineWorkers:
+    """Run SNMP engines in several processes sharing the same UDP endpoint.
+
+    Each worker process binds its own `SO_REUSEPORT` socket to `iface`
+    and runs a separate :py:class:`~pysnmp.entity.engine.SnmpEngine`
+    on top of it, letting the kernel load-balance incoming datagrams
+    between workers. This way a command responder or a notification
+    receiver can make use of more than one CPU core.
+
+    All workers share the same SNMP engine ID and are configured by the
+    same `configFun` callable, which receives a freshly created
+    `SnmpEngine` and is expected to populate its LCD by means of
+    :py:mod:`pysnmp.entity.config` and register SNMP applications
+    (e.g. :py:class:`~pysnmp.entity.rfc3413.ntfrcv.NotificationReceiver`).
+
+    Parameters
+    ----------
+    configFun : callable
+        Engine configuration function, must be picklable if the
+        multiprocessing start method is not `fork`.
+    iface : tuple
+        Local address to bind workers to.
+    workers : int
+        Number of worker processes, defaults to the number of CPUs.
+    snmpEngineID : :py:class:`~pysnmp.proto.rfc1902.OctetString`
+        SNMP engine ID shared by all workers, autogenerated if not given.
+
+    Examples
+    --------
+    >>> def configure(snmpEngine):
+    ...     config.addV1System(snmpEngine, "my-area", "public")
+    ...     ntfrcv.NotificationReceiver(snmpEngine, cbFun)
+    ...
+    >>> workers = SnmpEngineWorkers(configure, ("0.0.0.0", 162))
+    >>> workers.start()
+    >>> workers.join()
+
+    """
+
+    def __init__(
+        self,
+        configFun: Callable[[SnmpEngine], None],
+        iface: "tuple[str, int]",
+        workers: "int | None" = None,
+        snmpEngineID: "OctetString | None" = None,
+        transportDomain: "tuple[int, ...]" = udp.DOMAIN_NAME,
+        protoTransport: "type[AbstractTransport]" = udp.UdpAsyncioTransport,
+    ):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise error.PySnmpError("At least one worker is required")
+
+        if snmpEngineID is None:
+            snmpEngineID = _generateSnmpEngineID()
+
+        self.configFun = configFun
+        self.iface = iface
+        self.workers = workers
+        self.snmpEngineID = snmpEngineID
+        self.transportDomain = transportDomain
+        self.protoTransport = protoTransport
+        self.__processes: "list[multiprocessing.Process]" = []
+
+    def __repr__(self):
+        return "{}({!r}, workers={!r}, snmpEngineID={!r})".format(
+            self.__class__.__name__, self.iface, self.workers, self.snmpEngineID
+        )
+
+    def start(self):
+        """Spawn worker processes."""
+        if self.__processes:
+            raise error.PySnmpError("Workers already started")
+
+        for _ in range(self.workers):
+            process = multiprocessing.Process(
+                target=_runWorker,
+                args=(
+                    self.configFun,
+                    self.iface,
+                    self.snmpEngineID.asOctets(),
+                    self.transportDomain,
+                    self.protoTransport,
+                ),
+                daemon=True,
+            )
+            process.start()
+            self.__processes.append(process)
+
+    def join(self, timeout: "float | None" = None):
+        """Wait for worker processes to terminate."""
+        for process in self.__processes:
+            process.join(timeout)
+
+    def stop(self):
+        """Terminate worker processes.
+
+        Workers receive `SIGTERM`, close their SNMP engines and exit.
+        """
+        for process in self.__processes:
+            process.terminate()
+        self.join()
+        self.__processes = []
+
+    @property
+    def pids(self) -> "list[int | None]":
+        return [process.pid for process in self.__processes]
@@ -32,6 +32,7 @@
 # THE POSSIBILITY OF SUCH DAMAGE.
 #
 import sys
+from array import array
 from typing import AsyncGenerator
 from pysnmp.entity.engine import SnmpEngine
 from pysnmp.hlapi.asyncio.transport import AbstractTransportTarget
@@ -44,8 +45,17 @@ from pysnmp.hlapi.asyncio.lcd import *
 from pysnmp.hlapi.asyncio.varbinds import *
 from pysnmp.hlapi.asyncio.transport import *
 from pysnmp.entity.rfc3413 import cmdgen
-from pysnmp.proto.rfc1902 import Integer32, Null
+from pysnmp.proto.rfc1902 import (
+    Counter32,
+    Counter64,
+    Gauge32,
+    Integer32,
+    Null,
+    TimeTicks,
+)
 from pysnmp.proto import errind
+from pysnmp.cache import Cache
+from pysnmp.error import PySnmpError
 
 import asyncio
 
@@ -58,6 +68,9 @@ __all__ = [
     "isEndOfMib",
     "walkCmd",
     "bulkWalkCmd",
+    "bulkTableCmd",
+    "pollCmd",
+    "bulkPollCmd",
 ]
 
 VB_PROCESSOR = CommandGeneratorVarBinds()
@@ -106,6 +119,10 @@ async def getCmd(
 
             * `lookupMib` - load MIB and resolve response MIB variables at
               the cost of slightly reduced performance. Default is `True`.
+            * `compactVarBinds` - return response MIB variables as
+              :py:class:`~pysnmp.hlapi.asyncio.varbinds.CompactVarBind`
+              objects carrying OID and value in native Python types,
+              skipping MIB lookup altogether. Default is `False`.
 
     Yields
     ------
@@ -155,12 +172,12 @@ async def getCmd(
         varBinds,
         cbCtx,
     ):
-        lookupMib, future = cbCtx
+        lookupMib, compact, future = cbCtx
         if future.cancelled():
             return
         try:
-            varBindsUnmade = VB_PROCESSOR.unmakeVarBinds(
-                snmpEngine, varBinds, lookupMib
+            varBindsUnmade = _unmakeResponseVarBinds(
+                snmpEngine, varBinds, lookupMib, compact
             )
         except Exception:
             ex = sys.exc_info()[1]
@@ -183,7 +200,11 @@ async def getCmd(
         contextData.contextName,
         VB_PROCESSOR.makeVarBinds(snmpEngine, varBinds),
         __cbFun,
-        (options.get("lookupMib", True), future),
+        (
+            options.get("lookupMib", True),
+            options.get("compactVarBinds", False),
+            future,
+        ),
     )
     return await future
 
@@ -228,6 +249,10 @@ async def setCmd(
 
             * `lookupMib` - load MIB and resolve response MIB variables at
               the cost of slightly reduced performance. Default is `True`.
+            * `compactVarBinds` - return response MIB variables as
+              :py:class:`~pysnmp.hlapi.asyncio.varbinds.CompactVarBind`
+              objects carrying OID and value in native Python types,
+              skipping MIB lookup altogether. Default is `False`.
 
     Yields
     ------
@@ -277,12 +302,12 @@ async def setCmd(
         varBinds,
         cbCtx,
     ):
-        lookupMib, future = cbCtx
+        lookupMib, compact, future = cbCtx
         if future.cancelled():
             return
         try:
-            varBindsUnmade = VB_PROCESSOR.unmakeVarBinds(
-                snmpEngine, varBinds, lookupMib
+            varBindsUnmade = _unmakeResponseVarBinds(
+                snmpEngine, varBinds, lookupMib, compact
             )
         except Exception:
             ex = sys.exc_info()[1]
@@ -305,7 +330,11 @@ async def setCmd(
         contextData.contextName,
         VB_PROCESSOR.makeVarBinds(snmpEngine, varBinds),
         __cbFun,
-        (options.get("lookupMib", True), future),
+        (
+            options.get("lookupMib", True),
+            options.get("compactVarBinds", False),
+            future,
+        ),
     )
     return await future
 
@@ -350,6 +379,10 @@ async def nextCmd(
 
             * `lookupMib` - load MIB and resolve response MIB variables at
               the cost of slightly reduced performance. Default is `True`.
+            * `compactVarBinds` - return response MIB variables as
+              :py:class:`~pysnmp.hlapi.asyncio.varbinds.CompactVarBind`
+              objects carrying OID and value in native Python types,
+              skipping MIB lookup altogether. Default is `False`.
             * `ignoreNonIncreasingOid` - continue iteration even if response
               MIB variables (OIDs) are not greater then request MIB variables.
               Be aware that setting it to `True` may cause infinite loop between
@@ -407,7 +440,7 @@ async def nextCmd(
         varBindTable,
         cbCtx,
     ):
-        lookupMib, future = cbCtx
+        lookupMib, compact, future = cbCtx
         if future.cancelled():
             return
         if (
@@ -418,7 +451,7 @@ async def nextCmd(
             errorIndication = None  # TODO: fix this
         try:
             varBindsUnmade = [
-                VB_PROCESSOR.unmakeVarBinds(snmpEngine, varBindTableRow, lookupMib)
+                _unmakeResponseVarBinds(snmpEngine, varBindTableRow, lookupMib, compact)
                 for varBindTableRow in varBindTable
             ]
         except Exception:
@@ -442,7 +475,11 @@ async def nextCmd(
         contextData.contextName,
         VB_PROCESSOR.makeVarBinds(snmpEngine, varBinds),
         __cbFun,
-        (options.get("lookupMib", True), future),
+        (
+            options.get("lookupMib", True),
+            options.get("compactVarBinds", False),
+            future,
+        ),
     )
     return await future
 
@@ -499,6 +536,10 @@ async def bulkCmd(
 
             * `lookupMib` - load MIB and resolve response MIB variables at
               the cost of slightly reduced performance. Default is `True`.
+            * `compactVarBinds` - return response MIB variables as
+              :py:class:`~pysnmp.hlapi.asyncio.varbinds.CompactVarBind`
+              objects carrying OID and value in native Python types,
+              skipping MIB lookup altogether. Default is `False`.
             * `ignoreNonIncreasingOid` - continue iteration even if response
               MIB variables (OIDs) are not greater then request MIB variables.
               Be aware that setting it to `True` may cause infinite loop between
@@ -575,7 +616,7 @@ async def bulkCmd(
         varBindTable,
         cbCtx,
     ):
-        lookupMib, future = cbCtx
+        lookupMib, compact, future = cbCtx
         if future.cancelled():
             return
         if (
@@ -586,7 +627,7 @@ async def bulkCmd(
             errorIndication = None  # TODO: fix here
         try:
             varBindsUnmade = [
-                VB_PROCESSOR.unmakeVarBinds(snmpEngine, varBindTableRow, lookupMib)
+                _unmakeResponseVarBinds(snmpEngine, varBindTableRow, lookupMib, compact)
                 for varBindTableRow in varBindTable
             ]
         except Exception:
@@ -612,7 +653,11 @@ async def bulkCmd(
         maxRepetitions,
         VB_PROCESSOR.makeVarBinds(snmpEngine, varBinds),
         __cbFun,
-        (options.get("lookupMib", True), future),
+        (
+            options.get("lookupMib", True),
+            options.get("compactVarBinds", False),
+            future,
+        ),
     )
     return await future
 
@@ -659,6 +704,10 @@ async def walkCmd(
 
             * `lookupMib` - load MIB and resolve response MIB variables at
               the cost of slightly reduced performance. Default is `True`.
+            * `compactVarBinds` - return response MIB variables as
+              :py:class:`~pysnmp.hlapi.asyncio.varbinds.CompactVarBind`
+              objects carrying OID and value in native Python types,
+              skipping MIB lookup altogether. Default is `False`.
             * `lexicographicMode` - walk SNMP agent's MIB till the end (if `True`),
               otherwise (if `False`) stop iteration when all response MIB
               variables leave the scope of initial MIB variables in
@@ -725,6 +774,8 @@ async def walkCmd(
     ignoreNonIncreasingOid = options.get("ignoreNonIncreasingOid", False)
     maxRows = options.get("maxRows", 0)
     maxCalls = options.get("maxCalls", 0)
+    compact = options.get("compactVarBinds", False)
+    lookupMib = options.get("lookupMib", True) and not compact
 
     vbProcessor = CommandGeneratorVarBinds()
 
@@ -741,7 +792,7 @@ async def walkCmd(
                 transportTarget,
                 contextData,
                 *[(x[0], Null("")) for x in varBinds],
-                **dict(lookupMib=options.get("lookupMib", True))
+                **dict(lookupMib=lookupMib)
             )
             if (
                 ignoreNonIncreasingOid
@@ -786,7 +837,15 @@ async def walkCmd(
             errorIndication = errorStatus = errorIndex = None
             varBinds = []
 
-        initialVarBinds = (yield errorIndication, errorStatus, errorIndex, varBinds)
+        # MIB lookup, if any, has already been done by nextCmd()
+        varBindsUnmade = _unmakeResponseVarBinds(snmpEngine, varBinds, False, compact)
+
+        initialVarBinds = (
+            yield errorIndication,
+            errorStatus,
+            errorIndex,
+            varBindsUnmade,
+        )
 
         if initialVarBinds:
             varBinds = initialVarBinds
@@ -853,6 +912,10 @@ async def bulkWalkCmd(
 
             * `lookupMib` - load MIB and resolve response MIB variables at
               the cost of slightly reduced performance. Default is `True`.
+            * `compactVarBinds` - return response MIB variables as
+              :py:class:`~pysnmp.hlapi.asyncio.varbinds.CompactVarBind`
+              objects carrying OID and value in native Python types,
+              skipping MIB lookup altogether. Default is `False`.
             * `lexicographicMode` - walk SNMP agent's MIB till the end (if `True`),
               otherwise (if `False`) stop iteration when all response MIB
               variables leave the scope of initial MIB variables in
@@ -865,6 +928,14 @@ async def bulkWalkCmd(
               `maxRows` of SNMP conceptual table. Default is `0` (no limit).
             * `maxCalls` - stop iteration once this generator instance processed
               `maxCalls` responses. Default is 0 (no limit).
+            * `maxConcurrency` - keep up to this many SNMP GETBULK requests
+              in flight by splitting the walked OID range among them.
+              Responses are still yielded in lexicographic order. In this
+              mode every yielded `varBinds` carries a single MIB variable,
+              MIB variables in `varBinds` are walked one after another,
+              `nonRepeaters` must be `0`, `maxCalls` and
+              `ignoreNonIncreasingOid` are not supported and new `varBinds`
+              can not be sent into running generator. Default is `1`.
 
     Yields
     ------
@@ -920,10 +991,35 @@ async def bulkWalkCmd(
     (None, 0, 0, [(ObjectName('1.3.6.1.2.1.2.2.1.10.1'), Counter32(284817787))])
     """
 
+    if options.get("maxConcurrency", 1) > 1:
+        if nonRepeaters:
+            raise PySnmpError("nonRepeaters are not supported by parallel walk")
+
+        # responses arrive out of order and cursors stop at non-increasing
+        # OIDs, so neither option could be honoured consistently
+        for option in ("maxCalls", "ignoreNonIncreasingOid"):
+            if options.get(option):
+                raise PySnmpError("%s is not supported by parallel walk" % option)
+
+        async for result in _parallelBulkWalk(
+            snmpEngine,
+            authData,
+            transportTarget,
+            contextData,
+            maxRepetitions,
+            varBinds,
+            options,
+        ):
+            yield result
+
+        return
+
     lexicographicMode = options.get("lexicographicMode", True)
     ignoreNonIncreasingOid = options.get("ignoreNonIncreasingOid", False)
     maxRows = options.get("maxRows", 0)
     maxCalls = options.get("maxCalls", 0)
+    compact = options.get("compactVarBinds", False)
+    lookupMib = options.get("lookupMib", True) and not compact
 
     vbProcessor = CommandGeneratorVarBinds()
 
@@ -947,7 +1043,7 @@ async def bulkWalkCmd(
             nonRepeaters,
             maxRepetitions,
             *[(x[0], Null("")) for x in varBinds],
-            **dict(lookupMib=options.get("lookupMib", True))
+            **dict(lookupMib=lookupMib)
         )
 
         if (
@@ -1017,6 +1113,11 @@ async def bulkWalkCmd(
             varBinds = varBindTable and varBindTable[-1] or []
 
             for varBindRow in varBindTable:
+                # MIB lookup, if any, has already been done by bulkCmd()
+                varBindRow = _unmakeResponseVarBinds(
+                    snmpEngine, varBindRow, False, compact
+                )
+
                 initialVarBinds = (
                     yield errorIndication,
                     errorStatus,
@@ -1030,3 +1131,823 @@ async def bulkWalkCmd(
                         x[0] for x in vbProcessor.makeVarBinds(snmpEngine, varBinds)
                     ]
                     nullVarBinds = [False] * len(initialVars)
+
+
+async def bulkTableCmd(
+    snmpEngine: SnmpEngine,
+    authData: "CommunityData | UsmUserData",
+    transportTarget: AbstractTransportTarget,
+    contextData: ContextData,
+    maxRepetitions: int,
+    *varBinds,
+    **options
+) -> "tuple[errind.ErrorIndication, Integer32 | int, Integer32 | int, list[tuple[int, ...]], list]":
+    r"""Fetch columns of SNMP conceptual table by means of SNMP GETBULK queries.
+
+    Each table column is walked on its own with a series of SNMP GETBULK
+    requests (:RFC:`1905#section-4.2.3`), all columns being walked
+    concurrently. Column walk stops as soon as the column is exhausted
+    regardless of other columns. Fetched values are pivoted into one
+    sequence per column aligned with the common list of table indices.
+
+    Parameters
+    ----------
+    snmpEngine : :py:class:`~pysnmp.hlapi.SnmpEngine`
+        Class instance representing SNMP engine.
+
+    authData : :py:class:`~pysnmp.hlapi.CommunityData` or :py:class:`~pysnmp.hlapi.UsmUserData`
+        Class instance representing SNMP credentials.
+
+    transportTarget : :py:class:`~pysnmp.hlapi.asyncio.UdpTransportTarget` or :py:class:`~pysnmp.hlapi.asyncio.Udp6TransportTarget`
+        Class instance representing transport type along with SNMP peer address.
+
+    contextData : :py:class:`~pysnmp.hlapi.ContextData`
+        Class instance representing SNMP ContextEngineId and ContextName values.
+
+    maxRepetitions : int
+        Number of table rows requested in every SNMP GETBULK request.
+        Remote SNMP engine may choose lesser value than requested.
+
+    \*varBinds : :py:class:`~pysnmp.smi.rfc1902.ObjectType`
+        One or more class instances representing table columns to fetch.
+
+    Other Parameters
+    ----------------
+    \*\*options :
+        Request options:
+
+            * `maxRows` - return at most this number of table rows, those
+              with the lowest indices. Default is `0` (no limit).
+
+    Returns
+    -------
+    errorIndication : :py:class:`~pysnmp.proto.errind.ErrorIndication`
+        True value indicates SNMP engine error.
+    errorStatus : str
+        True value indicates SNMP PDU error.
+    errorIndex : int
+        Non-zero value refers to `varBinds[errorIndex-1]`
+    indices : list
+        Sorted table row indices, each being a tuple of OID sub-identifiers
+        following the column OID.
+    columns : list
+        A sequence per column in `varBinds` order, each holding column
+        values in `indices` order. Fully populated Counter32, Gauge32,
+        TimeTicks, Counter64 and Integer32 columns are represented by
+        :py:class:`array.array` of integers, other columns by lists of
+        native Python values (see
+        :py:class:`~pysnmp.hlapi.asyncio.varbinds.CompactVarBind`) with
+        `None` standing for missing values.
+
+    Raises
+    ------
+    PySnmpError
+        Or its derivative indicating that an error occurred while
+        performing SNMP operation.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from pysnmp.hlapi.asyncio import *
+    >>>
+    >>> async def run():
+    ...     errorIndication, errorStatus, errorIndex, indices, columns = await bulkTableCmd(
+    ...         SnmpEngine(),
+    ...         CommunityData('public'),
+    ...         UdpTransportTarget(('demo.pysnmp.com', 161)),
+    ...         ContextData(),
+    ...         50,
+    ...         ObjectType(ObjectIdentity('IF-MIB', 'ifDescr')),
+    ...         ObjectType(ObjectIdentity('IF-MIB', 'ifInOctets'))
+    ...     )
+    ...     print(indices, columns)
+    >>>
+    >>> asyncio.run(run())
+    [(1,), (2,)] [[b'lo', b'eth0'], array('L', [4137, 6715312])]
+    >>>
+
+    """
+    maxRows = options.get("maxRows", 0)
+
+    columnOids = [
+        x[0].asTuple() for x in VB_PROCESSOR.makeVarBinds(snmpEngine, varBinds)
+    ]
+
+    # column -> {index: value}
+    columnCells = [{} for _ in columnOids]
+
+    def __cbFun(
+        snmpEngine: SnmpEngine,
+        sendRequestHandle,
+        errorIndication: errind.ErrorIndication,
+        errorStatus: "Integer32 | int",
+        errorIndex: "Integer32 | int",
+        varBindTable,
+        cbCtx,
+    ):
+        col, future = cbCtx
+        if future.cancelled():
+            return
+
+        if errorIndication or errorStatus:
+            future.set_result(
+                (errorIndication, errorStatus, errorIndex and col + 1 or 0)
+            )
+            return
+
+        columnOid = columnOids[col]
+        prefixLen = len(columnOid)
+        cells = columnCells[col]
+
+        for varBindRow in varBindTable:
+            name, value = varBindRow[0]
+            name = name.asTuple()
+
+            if name[:prefixLen] != columnOid or isinstance(value, EndOfMibView):
+                break
+
+            # overlapping responses just overwrite the same cells
+            cells[name[prefixLen:]] = value
+
+            if maxRows and len(cells) >= maxRows:
+                break
+
+        else:
+            return True  # carry on walking the column
+
+        future.set_result((None, 0, 0))
+
+    addrName, paramsName = LCD.configure(
+        snmpEngine, authData, transportTarget, contextData.contextName
+    )
+
+    loop = asyncio.get_running_loop()
+
+    commandGenerator = cmdgen.BulkCommandGenerator()
+
+    futures = []
+
+    for col, columnOid in enumerate(columnOids):
+        future = loop.create_future()
+
+        commandGenerator.sendVarBinds(
+            snmpEngine,
+            addrName,
+            contextData.contextEngineId,
+            contextData.contextName,
+            0,
+            maxRepetitions,
+            [(columnOid, Null(""))],
+            __cbFun,
+            (col, future),
+        )
+
+        futures.append(future)
+
+    errorIndication, errorStatus, errorIndex = None, 0, 0
+
+    for future in futures:
+        errorIndication, errorStatus, errorIndex = await future
+        if errorIndication or errorStatus:
+            for future in futures:
+                future.cancel()
+            break
+
+    indices = sorted(set().union(*columnCells))
+
+    # each column stops at its own first maxRows rows, sparse columns
+    # may add up to more distinct rows than that
+    if maxRows and len(indices) > maxRows:
+        del indices[maxRows:]
+
+        for cells in columnCells:
+            for index in [x for x in cells if x > indices[-1]]:
+                del cells[index]
+
+    columns = [_makeTableColumn(indices, cells) for cells in columnCells]
+
+    return errorIndication, errorStatus, errorIndex, indices, columns
+
+
+# column value type -> array type code
+_TABLE_COLUMN_TYPE_CODES = {
+    Counter32.tagSet: "L",
+    Gauge32.tagSet: "L",
+    TimeTicks.tagSet: "L",
+    Counter64.tagSet: "Q",
+    Integer32.tagSet: "l",
+}
+
+
+def _makeTableColumn(indices, cells):
+    if cells and len(cells) == len(indices):
+        typeCodes = {
+            _TABLE_COLUMN_TYPE_CODES.get(value.tagSet) for value in cells.values()
+        }
+
+        if len(typeCodes) == 1 and None not in typeCodes:
+            return array(typeCodes.pop(), [int(cells[index]) for index in indices])
+
+    return [
+        VB_PROCESSOR.makeNativeValue(cells[index]) if index in cells else None
+        for index in indices
+    ]
+
+
+class _WalkCursor:
+    # Walks (start, end] OID range, open-ended if end is None
+    __slots__ = ("end", "varBinds", "finished", "cancelled", "splitPoint")
+
+    def __init__(self):
+        self.end = None
+        self.varBinds = []
+        self.finished = False
+        self.cancelled = False
+        # (OID prefix, sub-identifier, stride) to split the range further at
+        self.splitPoint = None
+
+
+async def _parallelBulkWalk(
+    snmpEngine,
+    authData,
+    transportTarget,
+    contextData,
+    maxRepetitions,
+    varBinds,
+    options,
+):
+    lexicographicMode = options.get("lexicographicMode", True)
+    maxRows = options.get("maxRows", 0)
+    maxConcurrency = options.get("maxConcurrency", 1)
+    compact = options.get("compactVarBinds", False)
+    lookupMib = options.get("lookupMib", True)
+
+    objectIdentities = Cache(maxSize=16384)
+
+    rootOids = [x[0].asTuple() for x in VB_PROCESSOR.makeVarBinds(snmpEngine, varBinds)]
+
+    addrName, paramsName = LCD.configure(
+        snmpEngine, authData, transportTarget, contextData.contextName
+    )
+
+    commandGenerator = cmdgen.BulkCommandGenerator()
+
+    totalRows = 0
+
+    for rootOid in rootOids:
+        # cursors walking adjacent OID ranges in lexicographic order
+        cursors = []
+        events = asyncio.Queue()
+        exhausted = False
+
+        def __cbFun(
+            snmpEngine: SnmpEngine,
+            sendRequestHandle,
+            errorIndication: errind.ErrorIndication,
+            errorStatus: "Integer32 | int",
+            errorIndex: "Integer32 | int",
+            varBindTable,
+            cursor,
+        ):
+            nonlocal exhausted
+
+            if cursor.cancelled:
+                return
+
+            if errorIndication or errorStatus:
+                cursor.finished = True
+                events.put_nowait((errorIndication, errorStatus, errorIndex))
+                return
+
+            oids = []
+
+            for varBindRow in varBindTable:
+                name, value = varBindRow[0]
+                oid = name.asTuple()
+
+                if isinstance(value, EndOfMibView) or (
+                    not lexicographicMode and oid[: len(rootOid)] != rootOid
+                ):
+                    # nothing to walk past this point
+                    cursor.finished = exhausted = True
+                    break
+
+                if cursor.end is not None and oid > cursor.end:
+                    cursor.finished = True
+                    break
+
+                cursor.varBinds.append(varBindRow[0])
+                oids.append(oid)
+
+            if oids:
+                cursor.splitPoint = _getWalkSplitPoint(oids, maxRepetitions)
+
+            events.put_nowait(None)
+
+            if not cursor.finished:
+                return True  # carry on walking the range
+
+        def __startCursor(startOid, cursor):
+            cursors.append(cursor)
+
+            commandGenerator.sendVarBinds(
+                snmpEngine,
+                addrName,
+                contextData.contextEngineId,
+                contextData.contextName,
+                0,
+                maxRepetitions,
+                [(startOid, Null(""))],
+                __cbFun,
+                cursor,
+            )
+
+        def __splitTail():
+            # Hand over the far end of the open-ended range to new cursors
+            activeCursors = len([x for x in cursors if not x.finished])
+
+            while activeCursors < maxConcurrency and not exhausted:
+                tail = cursors[-1]
+
+                if tail.finished or tail.splitPoint is None:
+                    break
+
+                prefix, subId, stride = tail.splitPoint
+
+                splitOid = prefix + (subId + stride,)
+
+                if not lexicographicMode and splitOid[: len(rootOid)] != rootOid:
+                    break
+
+                cursor = _WalkCursor()
+                cursor.splitPoint = prefix, subId + stride, stride
+
+                tail.end = splitOid
+
+                __startCursor(splitOid, cursor)
+
+                activeCursors += 1
+
+        __startCursor(rootOid, _WalkCursor())
+
+        head = 0
+
+        try:
+            while head < len(cursors):
+                error = await events.get()
+
+                if error:
+                    errorIndication, errorStatus, errorIndex = error
+                    yield errorIndication, errorStatus, errorIndex, []
+                    return
+
+                __splitTail()
+
+                while head < len(cursors):
+                    cursor = cursors[head]
+
+                    varBindRows, cursor.varBinds = cursor.varBinds, []
+
+                    for varBind in varBindRows:
+                        varBindRow = _unmakeResponseVarBinds(
+                            snmpEngine, [varBind], lookupMib, compact, objectIdentities
+                        )
+
+                        yield None, 0, 0, varBindRow
+
+                        totalRows += 1
+
+                        if maxRows and totalRows >= maxRows:
+                            return
+
+                    if not cursor.finished:
+                        break
+
+                    head += 1
+
+        finally:
+            for cursor in cursors:
+                cursor.cancelled = True
+
+
+def _getWalkSplitPoint(oids, maxRepetitions):
+    # Guess where the next chunk of MIB variables, about one response
+    # worth, begins judging by how sparse the last response was
+    first, last = oids[0], oids[-1]
+
+    pos = 0
+
+    while pos < len(last) - 1 and pos < len(first) and first[pos] == last[pos]:
+        pos += 1
+
+    span = pos < len(first) and last[pos] - first[pos] or 0
+
+    stride = max(1, span * maxRepetitions // max(1, len(oids) - 1))
+
+    return last[:pos], last[pos], stride
+
+
+def _unmakeVarBinds(snmpEngine, varBinds, objectIdentities, lookupMib=True):
+    # Same as VB_PROCESSOR.unmakeVarBinds(), but MIB names resolved once
+    # are reused for all subsequent responses carrying the same OIDs
+    if not lookupMib:
+        return varBinds
+
+    mibViewController = VB_PROCESSOR.getMibViewController(snmpEngine)
+
+    varBindsUnmade = []
+
+    for name, value in varBinds:
+        if name in objectIdentities:
+            objectIdentity = objectIdentities[name]
+        else:
+            objectIdentity = ObjectIdentity(name).resolveWithMib(mibViewController)
+            objectIdentities[name] = objectIdentity
+
+        varBindsUnmade.append(
+            ObjectType(objectIdentity, value).resolveWithMib(mibViewController)
+        )
+
+    return varBindsUnmade
+
+
+def _unmakeResponseVarBinds(
+    snmpEngine, varBinds, lookupMib, compact, objectIdentities=None
+):
+    # Turn response variable-bindings into whatever the caller asked for
+    if compact:
+        return VB_PROCESSOR.compactVarBinds(varBinds)
+
+    if objectIdentities is None:
+        return VB_PROCESSOR.unmakeVarBinds(snmpEngine, varBinds, lookupMib)
+
+    return _unmakeVarBinds(snmpEngine, varBinds, objectIdentities, lookupMib)
+
+
+async def _pollTargets(
+    snmpEngine, authData, transportTargets, contextData, sendFun, unmakeFun, options
+):
+    maxConcurrency = options.get("maxConcurrency", 100)
+    maxRate = options.get("maxRate")
+
+    if maxConcurrency < 1:
+        raise PySnmpError("maxConcurrency must be positive")
+
+    loop = asyncio.get_running_loop()
+
+    results = asyncio.Queue()
+    nextSendTimes = {}
+    targets = iter(transportTargets)
+
+    def __cbFun(
+        snmpEngine: SnmpEngine,
+        sendRequestHandle,
+        errorIndication: errind.ErrorIndication,
+        errorStatus: "Integer32 | int",
+        errorIndex: "Integer32 | int",
+        varBinds,
+        future,
+    ):
+        if not future.cancelled():
+            future.set_result((errorIndication, errorStatus, errorIndex, varBinds))
+
+    async def __pollTarget(targetAuthData, transportTarget):
+        if maxRate:
+            # spread requests to the same peer at least 1/maxRate apart
+            now = loop.time()
+            sendTime = max(now, nextSendTimes.get(transportTarget.transportAddr, now))
+            nextSendTimes[transportTarget.transportAddr] = sendTime + 1 / maxRate
+            if sendTime > now:
+                await asyncio.sleep(sendTime - now)
+
+        addrName, paramsName = LCD.configure(
+            snmpEngine, targetAuthData, transportTarget, contextData.contextName
+        )
+
+        future = loop.create_future()
+
+        sendFun(addrName, __cbFun, future)
+
+        errorIndication, errorStatus, errorIndex, varBinds = await future
+
+        return (
+            transportTarget,
+            errorIndication,
+            errorStatus,
+            errorIndex,
+            unmakeFun(varBinds),
+        )
+
+    async def __worker():
+        try:
+            for target in targets:
+                if isinstance(target, AbstractTransportTarget):
+                    result = await __pollTarget(authData, target)
+                else:
+                    result = await __pollTarget(*target)
+
+                await results.put(result)
+
+        except Exception:
+            await results.put(sys.exc_info()[1])
+
+        else:
+            await results.put(None)
+
+    workers = [asyncio.ensure_future(__worker()) for _ in range(maxConcurrency)]
+
+    try:
+        runningWorkers = len(workers)
+
+        while runningWorkers:
+            result = await results.get()
+
+            if result is None:
+                runningWorkers -= 1
+
+            elif isinstance(result, Exception):
+                raise result
+
+            else:
+                yield result
+
+    finally:
+        for worker in workers:
+            worker.cancel()
+
+
+async def pollCmd(
+    snmpEngine: SnmpEngine,
+    authData: "CommunityData | UsmUserData | None",
+    transportTargets,
+    contextData: ContextData,
+    *varBinds,
+    **options
+) -> AsyncGenerator[
+    "tuple[AbstractTransportTarget, errind.ErrorIndication, Integer32 | int, Integer32 | int, tuple[ObjectType]]",
+    None,
+]:
+    r"""Creates a generator to perform SNMP GET queries against many targets.
+
+    The same SNMP GET request (:RFC:`1905#section-4.2.1`) is sent to every
+    target, keeping at most `maxConcurrency` requests in flight. Responses
+    are yielded in the order they arrive.
+
+    MIB variables are resolved only once for all targets, LCD entries are
+    reused across targets and between calls.
+
+    Parameters
+    ----------
+    snmpEngine : :py:class:`~pysnmp.hlapi.SnmpEngine`
+        Class instance representing SNMP engine.
+
+    authData : :py:class:`~pysnmp.hlapi.CommunityData` or :py:class:`~pysnmp.hlapi.UsmUserData`
+        Class instance representing SNMP credentials shared by targets.
+
+    transportTargets : iterable
+        Sequence of :py:class:`~pysnmp.hlapi.asyncio.UdpTransportTarget` or
+        :py:class:`~pysnmp.hlapi.asyncio.Udp6TransportTarget` class instances.
+        An item can also be an `(authData, transportTarget)` tuple to use
+        target-specific credentials.
+
+    contextData : :py:class:`~pysnmp.hlapi.ContextData`
+        Class instance representing SNMP ContextEngineId and ContextName values.
+
+    \*varBinds : :py:class:`~pysnmp.smi.rfc1902.ObjectType`
+        One or more class instances representing MIB variables to place
+        into SNMP request.
+
+    Other Parameters
+    ----------------
+    \*\*options :
+        Request options:
+
+            * `lookupMib` - load MIB and resolve response MIB variables at
+              the cost of slightly reduced performance. Default is `True`.
+            * `compactVarBinds` - return response MIB variables as
+              :py:class:`~pysnmp.hlapi.asyncio.varbinds.CompactVarBind`
+              objects carrying OID and value in native Python types,
+              skipping MIB lookup altogether. Default is `False`.
+            * `maxConcurrency` - maximum number of outstanding requests.
+              Default is `100`.
+            * `maxRate` - maximum number of requests per second sent to
+              the same transport address. Default is no limit.
+
+    Yields
+    ------
+    transportTarget : :py:class:`~pysnmp.hlapi.asyncio.UdpTransportTarget` or :py:class:`~pysnmp.hlapi.asyncio.Udp6TransportTarget`
+        Target the response belongs to.
+    errorIndication : :py:class:`~pysnmp.proto.errind.ErrorIndication`
+        True value indicates SNMP engine error.
+    errorStatus : str
+        True value indicates SNMP PDU error.
+    errorIndex : int
+        Non-zero value refers to `varBinds[errorIndex-1]`
+    varBinds : tuple
+        A sequence of :py:class:`~pysnmp.smi.rfc1902.ObjectType` class
+        instances representing MIB variables returned in SNMP response.
+
+    Raises
+    ------
+    PySnmpError
+        Or its derivative indicating that an error occurred while
+        performing SNMP operation.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from pysnmp.hlapi.asyncio import *
+    >>>
+    >>> async def run():
+    ...     targets = [UdpTransportTarget((host, 161)) for host in hosts]
+    ...     async for (transportTarget, errorIndication, errorStatus,
+    ...                errorIndex, varBinds) in pollCmd(
+    ...         SnmpEngine(),
+    ...         CommunityData('public'),
+    ...         targets,
+    ...         ContextData(),
+    ...         ObjectType(ObjectIdentity('SNMPv2-MIB', 'sysUpTime', 0)),
+    ...         maxConcurrency=500
+    ...     ):
+    ...         print(transportTarget, errorIndication, varBinds)
+    >>>
+    >>> asyncio.run(run())
+
+    """
+    lookupMib = options.get("lookupMib", True)
+    compact = options.get("compactVarBinds", False)
+    objectIdentities = Cache(maxSize=16384)
+
+    varBinds = VB_PROCESSOR.makeVarBinds(snmpEngine, varBinds)
+
+    commandGenerator = cmdgen.GetCommandGenerator()
+
+    def sendFun(addrName, cbFun, cbCtx):
+        commandGenerator.sendVarBinds(
+            snmpEngine,
+            addrName,
+            contextData.contextEngineId,
+            contextData.contextName,
+            varBinds,
+            cbFun,
+            cbCtx,
+        )
+
+    def unmakeFun(varBinds):
+        return _unmakeResponseVarBinds(
+            snmpEngine, varBinds, lookupMib, compact, objectIdentities
+        )
+
+    async for result in _pollTargets(
+        snmpEngine, authData, transportTargets, contextData, sendFun, unmakeFun, options
+    ):
+        yield result
+
+
+async def bulkPollCmd(
+    snmpEngine: SnmpEngine,
+    authData: "CommunityData | UsmUserData | None",
+    transportTargets,
+    contextData: ContextData,
+    nonRepeaters: int,
+    maxRepetitions: int,
+    *varBinds,
+    **options
+) -> AsyncGenerator[
+    "tuple[AbstractTransportTarget, errind.ErrorIndication, Integer32 | int, Integer32 | int, tuple[tuple[ObjectType, ...], ...]]",
+    None,
+]:
+    r"""Creates a generator to perform SNMP GETBULK queries against many targets.
+
+    The same SNMP GETBULK request (:RFC:`1905#section-4.2.3`) is sent to
+    every target, keeping at most `maxConcurrency` requests in flight.
+    Responses are yielded in the order they arrive.
+
+    MIB variables are resolved only once for all targets, LCD entries are
+    reused across targets and between calls.
+
+    Parameters
+    ----------
+    snmpEngine : :py:class:`~pysnmp.hlapi.SnmpEngine`
+        Class instance representing SNMP engine.
+
+    authData : :py:class:`~pysnmp.hlapi.CommunityData` or :py:class:`~pysnmp.hlapi.UsmUserData`
+        Class instance representing SNMP credentials shared by targets.
+
+    transportTargets : iterable
+        Sequence of :py:class:`~pysnmp.hlapi.asyncio.UdpTransportTarget` or
+        :py:class:`~pysnmp.hlapi.asyncio.Udp6TransportTarget` class instances.
+        An item can also be an `(authData, transportTarget)` tuple to use
+        target-specific credentials.
+
+    contextData : :py:class:`~pysnmp.hlapi.ContextData`
+        Class instance representing SNMP ContextEngineId and ContextName values.
+
+    nonRepeaters : int
+        One MIB variable is requested in response for the first
+        `nonRepeaters` MIB variables in request.
+
+    maxRepetitions : int
+        `maxRepetitions` MIB variables are requested in response for each
+        of the remaining MIB variables in the request (e.g. excluding
+        `nonRepeaters`). Remote SNMP engine may choose lesser value than
+        requested.
+
+    \*varBinds : :py:class:`~pysnmp.smi.rfc1902.ObjectType`
+        One or more class instances representing MIB variables to place
+        into SNMP request.
+
+    Other Parameters
+    ----------------
+    \*\*options :
+        Request options:
+
+            * `lookupMib` - load MIB and resolve response MIB variables at
+              the cost of slightly reduced performance. Default is `True`.
+            * `compactVarBinds` - return response MIB variables as
+              :py:class:`~pysnmp.hlapi.asyncio.varbinds.CompactVarBind`
+              objects carrying OID and value in native Python types,
+              skipping MIB lookup altogether. Default is `False`.
+            * `maxConcurrency` - maximum number of outstanding requests.
+              Default is `100`.
+            * `maxRate` - maximum number of requests per second sent to
+              the same transport address. Default is no limit.
+
+    Yields
+    ------
+    transportTarget : :py:class:`~pysnmp.hlapi.asyncio.UdpTransportTarget` or :py:class:`~pysnmp.hlapi.asyncio.Udp6TransportTarget`
+        Target the response belongs to.
+    errorIndication : :py:class:`~pysnmp.proto.errind.ErrorIndication`
+        True value indicates SNMP engine error.
+    errorStatus : str
+        True value indicates SNMP PDU error.
+    errorIndex : int
+        Non-zero value refers to `varBinds[errorIndex-1]`
+    varBindTable : tuple
+        A sequence of sequences (e.g. 2-D array) of
+        :py:class:`~pysnmp.smi.rfc1902.ObjectType` class instances
+        representing a table of MIB variables returned in SNMP response,
+        same as :py:func:`~pysnmp.hlapi.asyncio.bulkCmd` returns.
+
+    Raises
+    ------
+    PySnmpError
+        Or its derivative indicating that an error occurred while
+        performing SNMP operation.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from pysnmp.hlapi.asyncio import *
+    >>>
+    >>> async def run():
+    ...     targets = [UdpTransportTarget((host, 161)) for host in hosts]
+    ...     async for (transportTarget, errorIndication, errorStatus,
+    ...                errorIndex, varBindTable) in bulkPollCmd(
+    ...         SnmpEngine(),
+    ...         CommunityData('public'),
+    ...         targets,
+    ...         ContextData(),
+    ...         0, 25,
+    ...         ObjectType(ObjectIdentity('IF-MIB', 'ifInOctets')),
+    ...         maxConcurrency=500,
+    ...         maxRate=10
+    ...     ):
+    ...         print(transportTarget, errorIndication, varBindTable)
+    >>>
+    >>> asyncio.run(run())
+
+    """
+    lookupMib = options.get("lookupMib", True)
+    compact = options.get("compactVarBinds", False)
+    objectIdentities = Cache(maxSize=16384)
+
+    varBinds = VB_PROCESSOR.makeVarBinds(snmpEngine, varBinds)
+
+    commandGenerator = cmdgen.BulkCommandGenerator()
+
+    def sendFun(addrName, cbFun, cbCtx):
+        commandGenerator.sendVarBinds(
+            snmpEngine,
+            addrName,
+            contextData.contextEngineId,
+            contextData.contextName,
+            nonRepeaters,
+            maxRepetitions,
+            varBinds,
+            cbFun,
+            cbCtx,
+        )
+
+    def unmakeFun(varBindTable):
+        return [
+            _unmakeResponseVarBinds(
+                snmpEngine, varBindTableRow, lookupMib, compact, objectIdentities
+            )
+            for varBindTableRow in varBindTable
+        ]
+
+    async for result in _pollTargets(
+        snmpEngine, authData, transportTargets, contextData, sendFun, unmakeFun, options
+    ):
+        yield result
@@ -4,13 +4,130 @@
 # Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysnmp/license.html
 #
+import socket
+from pyasn1.type import univ
+from pysnmp.proto import rfc1902, rfc1905
 from pysnmp.smi import view
 from pysnmp.smi.rfc1902 import *
 
-__all__ = ["CommandGeneratorVarBinds", "NotificationOriginatorVarBinds"]
+__all__ = [
+    "CompactVarBind",
+    "CommandGeneratorVarBinds",
+    "NotificationOriginatorVarBinds",
+]
+
+
+class CompactVarBind:
+    """Bare MIB variable carrying OID and value in native Python types.
+
+    Lightweight alternative to :py:class:`~pysnmp.smi.rfc1902.ObjectType`
+    for applications that do not need MIB information or ASN.1 types,
+    such as data collectors. Unpacks into `(name, value)` pair just like
+    SNMP variable-binding does.
+
+    Parameters
+    ----------
+    name : tuple
+        MIB variable OID.
+    value : int, bytes, str, tuple or None
+        MIB variable value. INTEGER-based types turn into `int`, OCTET
+        STRING-based types into `bytes`, except for IpAddress that turns
+        into dotted notation `str`, OBJECT IDENTIFIER into `tuple` and
+        NULL into `None`. SNMP exception values are kept as they are, as
+        :py:class:`~pysnmp.proto.rfc1905.NoSuchObject`,
+        :py:class:`~pysnmp.proto.rfc1905.NoSuchInstance` and
+        :py:class:`~pysnmp.proto.rfc1905.EndOfMibView` objects, for them
+        not to be confused with NULL or with each other.
+    """
+
+    __slots__ = ("name", "value")
+
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+
+    def __getitem__(self, i):
+        return (self.name, self.value)[i]
+
+    def __iter__(self):
+        return iter((self.name, self.value))
+
+    def __len__(self):
+        return 2
+
+    def __eq__(self, other):
+        try:
+            if len(other) != 2:
+                return NotImplemented
+
+            return (self.name, self.value) == tuple(other)
+
+        except TypeError:
+            return NotImplemented
+
+    def __hash__(self):
+        return hash((self.name, self.value))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.name!r}, {self.value!r})"
+
+
+_EXCEPTION_TAG_SETS = (
+    rfc1905.NoSuchObject.tagSet,
+    rfc1905.NoSuchInstance.tagSet,
+    rfc1905.EndOfMibView.tagSet,
+)
+
+
+def _ipAddressToNative(value):
+    octets = value.asOctets()
+    try:
+        return socket.inet_ntoa(octets)
+
+    except OSError:
+        # malformed IpAddress, leave it for the application to judge
+        return octets
+
+
+def _getNativeValueConverter(value):
+    # SNMP exception values are Null-based
+    if value.tagSet in _EXCEPTION_TAG_SETS:
+        return lambda x: x
+    elif isinstance(value, univ.Null):
+        return lambda x: None
+    elif isinstance(value, univ.Integer):
+        return int
+    elif isinstance(value, univ.OctetString):
+        if value.tagSet == rfc1902.IpAddress.tagSet:
+            return _ipAddressToNative
+        return lambda x: x.asOctets()
+    elif isinstance(value, univ.ObjectIdentifier):
+        return lambda x: x.asTuple()
+    else:
+        return lambda x: x
 
 
 class AbstractVarBinds:
+    # value class -> native value converter
+    _nativeValueConverters = {}
+
+    @classmethod
+    def makeNativeValue(cls, value):
+        try:
+            converter = cls._nativeValueConverters[value.__class__]
+        except KeyError:
+            converter = _getNativeValueConverter(value)
+            cls._nativeValueConverters[value.__class__] = converter
+
+        return converter(value)
+
+    @classmethod
+    def compactVarBinds(cls, varBinds):
+        return [
+            CompactVarBind(name.asTuple(), cls.makeNativeValue(value))
+            for name, value in varBinds
+        ]
+
     @staticmethod
     def getMibViewController(snmpEngine):
         mibViewController = snmpEngine.getUserContext("mibViewController")
@@ -10,7 +10,41 @@ from pyasn1.error import PyAsn1Error
 from pysnmp.proto.error import ProtocolError
 
 
+def _peekMessageVersion(wholeMsg):
+    # SNMP messages open with a SEQUENCE header followed by a short
+    # INTEGER, pick it up without engaging pyasn1 decoder
+    if len(wholeMsg) < 5 or wholeMsg[0] != 0x30:
+        return
+
+    length = wholeMsg[1]
+    pos = 2
+
+    if length & 0x80:
+        size = length & 0x7F
+        if not 0 < size <= 4:
+            return
+        length = int.from_bytes(wholeMsg[pos : pos + size], "big")
+        pos += size
+
+    end = pos + length
+
+    if end > len(wholeMsg) or pos + 3 > end or wholeMsg[pos] != 0x02:
+        return
+
+    size = wholeMsg[pos + 1]
+    pos += 2
+
+    if not 0 < size < 0x80 or pos + size > end:
+        return
+
+    return int.from_bytes(wholeMsg[pos : pos + size], "big", signed=True)
+
+
 def decodeMessageVersion(wholeMsg):
+    ver = _peekMessageVersion(wholeMsg)
+    if ver is not None:
+        return univ.Integer(ver)
+
     try:
         seq, wholeMsg = decoder.decode(
             wholeMsg,
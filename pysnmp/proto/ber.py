@@ -0,0 +1,453 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysnmp/license.html
+#
+# BER codec specialized for SNMP messages.
+#
+# SNMP messages only use a handful of ASN.1 types, definite lengths and
+# low tag numbers, so they can be serialized and parsed much faster than
+# pyasn1 codecs do it for arbitrary ASN.1. Anything beyond that is
+# handed over to pyasn1.
+#
+from pyasn1.codec.ber import decoder, encoder
+from pyasn1.error import PyAsn1Error
+from pyasn1.type import univ
+from pysnmp import cache
+
+__all__ = ["encode", "decode", "locate"]
+
+# kinds of ASN.1 types handled here
+(
+    _INTEGER,
+    _OCTET_STRING,
+    _NULL,
+    _OBJECT_IDENTIFIER,
+    _SEQUENCE,
+    _SEQUENCE_OF,
+    _CHOICE,
+    _UNSUPPORTED,
+) = range(8)
+
+_typeKinds = {}
+_tagOctets = cache.Cache(maxSize=1024)
+_choiceMaps = {}
+
+_oidEncodings = cache.Cache(maxSize=8192)
+_oidDecodings = cache.Cache(maxSize=8192)
+
+
+class _Unsupported(Exception):
+    """Value or substrate is beyond what this codec handles."""
+
+
+def _getKind(asn1Object):
+    cls = asn1Object.__class__
+    try:
+        return _typeKinds[cls]
+    except KeyError:
+        pass
+
+    if isinstance(asn1Object, univ.Integer):
+        kind = _INTEGER
+    elif isinstance(asn1Object, univ.Null):
+        kind = _NULL
+    elif isinstance(asn1Object, univ.OctetString):
+        kind = _OCTET_STRING
+    elif isinstance(asn1Object, univ.ObjectIdentifier):
+        kind = _OBJECT_IDENTIFIER
+    elif isinstance(asn1Object, univ.Choice):
+        kind = asn1Object.tagSet and _UNSUPPORTED or _CHOICE
+    elif isinstance(asn1Object, univ.SequenceOf):
+        kind = _SEQUENCE_OF
+    elif isinstance(asn1Object, univ.Sequence):
+        if asn1Object.componentType.hasOptionalOrDefault:
+            kind = _UNSUPPORTED
+        else:
+            kind = _SEQUENCE
+    else:
+        kind = _UNSUPPORTED
+
+    _typeKinds[cls] = kind
+
+    return kind
+
+
+def _getTagOctet(tagSet):
+    # tags of different formats compare equal, hence identity lookup
+    try:
+        return _tagOctets[id(tagSet)][1]
+    except KeyError:
+        pass
+
+    # Only single low-numbered tags fit into one octet
+    if len(tagSet.superTags) == 1 and tagSet[0].tagId < 31:
+        tag = tagSet[0]
+        tagOctet = tag.tagClass | tag.tagFormat | tag.tagId
+    else:
+        tagOctet = None
+
+    # keep TagSet object alive for its id() to stay unique
+    _tagOctets[id(tagSet)] = tagSet, tagOctet
+
+    return tagOctet
+
+
+def _encodeLength(length):
+    if length < 0x80:
+        return bytes((length,))
+
+    octets = length.to_bytes((length.bit_length() + 7) // 8, "big")
+
+    return bytes((0x80 | len(octets),)) + octets
+
+
+def _encodeOid(arcs):
+    try:
+        return _oidEncodings[arcs]
+    except KeyError:
+        pass
+
+    if len(arcs) < 2:
+        raise _Unsupported()
+
+    first, second = arcs[:2]
+
+    if first > 2 or first < 2 and not 0 <= second <= 39:
+        raise _Unsupported()
+
+    octets = bytearray()
+
+    for subId in (first * 40 + second,) + arcs[2:]:
+        if subId < 0:
+            raise _Unsupported()
+        elif subId < 0x80:
+            octets.append(subId)
+        else:
+            chunk = [subId & 0x7F]
+            subId >>= 7
+            while subId:
+                chunk.append(0x80 | subId & 0x7F)
+                subId >>= 7
+            chunk.reverse()
+            octets.extend(chunk)
+
+    octets = _oidEncodings[arcs] = bytes(octets)
+
+    return octets
+
+
+def _encodeValue(value):
+    kind = _getKind(value)
+
+    if kind == _CHOICE:
+        return _encodeValue(value.getComponent())
+
+    tagOctet = _getTagOctet(value.tagSet)
+
+    if tagOctet is None or kind == _UNSUPPORTED:
+        raise _Unsupported()
+
+    if kind == _INTEGER:
+        number = int(value)
+        content = number.to_bytes(
+            (number + (number < 0)).bit_length() // 8 + 1, "big", signed=True
+        )
+
+    elif kind == _OCTET_STRING:
+        content = value.asOctets()
+
+    elif kind == _OBJECT_IDENTIFIER:
+        content = _encodeOid(value.asTuple())
+
+    elif kind == _NULL:
+        content = b""
+
+    elif kind == _SEQUENCE:
+        content = b"".join(
+            [
+                _encodeValue(value.getComponentByPosition(idx))
+                for idx in range(len(value.componentType))
+            ]
+        )
+
+    else:
+        content = b"".join([_encodeValue(component) for component in value])
+
+    return bytes((tagOctet,)) + _encodeLength(len(content)) + content
+
+
+def encode(value):
+    """Serialize SNMP message or its part into BER.
+
+    Falls back to pyasn1 BER encoder for values this codec does not
+    support. Produces the same octets as pyasn1 does.
+
+    Parameters
+    ----------
+    value : pyasn1 object
+        Value to serialize.
+
+    Returns
+    -------
+    bytes
+        BER-encoded `value`.
+    """
+    try:
+        return _encodeValue(value)
+
+    except (_Unsupported, PyAsn1Error):
+        return encoder.encode(value)
+
+
+def _decodeHeader(substrate, pos, end):
+    if pos + 2 > end:
+        raise _Unsupported()
+
+    tagOctet = substrate[pos]
+    length = substrate[pos + 1]
+    pos += 2
+
+    if tagOctet & 0x1F == 0x1F:
+        raise _Unsupported()
+
+    if length & 0x80:
+        size = length & 0x7F
+        # indefinite or too long length
+        if not size or size > 4:
+            raise _Unsupported()
+        length = int.from_bytes(substrate[pos : pos + size], "big")
+        pos += size
+
+    if pos + length > end:
+        raise _Unsupported()
+
+    return tagOctet, pos, pos + length
+
+
+def _getChoiceMap(asn1Spec):
+    componentType = asn1Spec.componentType
+
+    try:
+        return _choiceMaps[id(componentType)][1]
+    except KeyError:
+        pass
+
+    choiceMap = {}
+    ambiguous = set()
+
+    for idx, namedType in enumerate(componentType.namedTypes):
+        componentSpec = namedType.asn1Object
+        kind = _getKind(componentSpec)
+
+        if kind == _CHOICE:
+            tagOctets = _getChoiceMap(componentSpec)
+        else:
+            tagOctets = (_getTagOctet(componentSpec.tagSet),)
+
+        for tagOctet in tagOctets:
+            if tagOctet in choiceMap:
+                ambiguous.add(tagOctet)
+            choiceMap[tagOctet] = idx, componentSpec
+
+    for tagOctet in ambiguous:
+        del choiceMap[tagOctet]
+
+    choiceMap.pop(None, None)
+
+    # keep NamedTypes object alive for its id() to stay unique
+    _choiceMaps[id(componentType)] = componentType, choiceMap
+
+    return choiceMap
+
+
+def _decodeValue(substrate, pos, end, asn1Spec):
+    kind = _getKind(asn1Spec)
+
+    if kind == _CHOICE:
+        if pos >= end:
+            raise _Unsupported()
+
+        try:
+            idx, componentSpec = _getChoiceMap(asn1Spec)[substrate[pos]]
+
+        except KeyError:
+            raise _Unsupported()
+
+        component, pos = _decodeValue(substrate, pos, end, componentSpec)
+
+        value = asn1Spec.clone()
+        value.setComponentByPosition(
+            idx,
+            component,
+            verifyConstraints=False,
+            matchTags=False,
+            matchConstraints=False,
+        )
+
+        return value, pos
+
+    tagOctet, pos, valueEnd = _decodeHeader(substrate, pos, end)
+
+    if kind == _UNSUPPORTED or tagOctet != _getTagOctet(asn1Spec.tagSet):
+        raise _Unsupported()
+
+    if kind == _INTEGER:
+        if pos == valueEnd:
+            raise _Unsupported()
+
+        value = asn1Spec.clone(
+            int.from_bytes(substrate[pos:valueEnd], "big", signed=True)
+        )
+
+    elif kind == _OCTET_STRING:
+        value = asn1Spec.clone(bytes(substrate[pos:valueEnd]))
+
+    elif kind == _OBJECT_IDENTIFIER:
+        value = asn1Spec.clone(_decodeOid(bytes(substrate[pos:valueEnd])))
+
+    elif kind == _NULL:
+        if pos != valueEnd:
+            raise _Unsupported()
+
+        value = asn1Spec.clone("")
+
+    elif kind == _SEQUENCE:
+        value = asn1Spec.clone()
+
+        for idx, namedType in enumerate(asn1Spec.componentType.namedTypes):
+            component, pos = _decodeValue(
+                substrate, pos, valueEnd, namedType.asn1Object
+            )
+            value.setComponentByPosition(
+                idx,
+                component,
+                verifyConstraints=False,
+                matchTags=False,
+                matchConstraints=False,
+            )
+
+        if pos != valueEnd:
+            raise _Unsupported()
+
+    else:
+        value = asn1Spec.clone()
+        componentSpec = asn1Spec.componentType
+
+        idx = 0
+        while pos < valueEnd:
+            component, pos = _decodeValue(substrate, pos, valueEnd, componentSpec)
+            value.setComponentByPosition(
+                idx,
+                component,
+                verifyConstraints=False,
+                matchTags=False,
+                matchConstraints=False,
+            )
+            idx += 1
+
+    return value, valueEnd
+
+
+def _decodeOid(octets):
+    try:
+        return _oidDecodings[octets]
+    except KeyError:
+        pass
+
+    if not octets or octets[-1] & 0x80:
+        raise _Unsupported()
+
+    subIds = []
+    subId = 0
+
+    for octet in octets:
+        # non-minimal sub-identifier encoding
+        if octet == 0x80 and not subId:
+            raise _Unsupported()
+        subId = subId << 7 | octet & 0x7F
+        if not octet & 0x80:
+            subIds.append(subId)
+            subId = 0
+
+    first = subIds[0]
+
+    if first < 40:
+        arcs = (0, first)
+    elif first < 80:
+        arcs = (1, first - 40)
+    else:
+        arcs = (2, first - 80)
+
+    arcs = _oidDecodings[octets] = arcs + tuple(subIds[1:])
+
+    return arcs
+
+
+def decode(substrate, asn1Spec):
+    """Deserialize BER-encoded SNMP message or its part.
+
+    Falls back to pyasn1 BER decoder for substrate this codec does
+    not support. Produces the same pyasn1 objects as pyasn1 does.
+
+    Parameters
+    ----------
+    substrate : bytes or :py:class:`~pyasn1.type.univ.OctetString`
+        BER octets to deserialize.
+    asn1Spec : pyasn1 object
+        ASN.1 type to decode `substrate` into.
+
+    Returns
+    -------
+    tuple
+        Decoded value and unprocessed trailing octets.
+    """
+    if isinstance(substrate, univ.OctetString):
+        substrate = substrate.asOctets()
+
+    try:
+        value, pos = _decodeValue(substrate, 0, len(substrate), asn1Spec)
+
+    except (_Unsupported, PyAsn1Error):
+        return decoder.decode(substrate, asn1Spec=asn1Spec)
+
+    return value, substrate[pos:]
+
+
+def locate(substrate, *path):
+    """Find value octets of BER-encoded SNMP message component.
+
+    Walks nested BER TLVs without decoding them. Each element of `path`
+    is a position of the TLV among its siblings, first one counting
+    TLVs at the top of `substrate`, next ones counting TLVs inside the
+    value of the previously located one. OCTET STRING values carrying
+    BER, such as SNMPv3 security parameters, are walked into the same
+    way.
+
+    Parameters
+    ----------
+    substrate : bytes
+        BER octets to walk.
+    path : int
+        Component positions.
+
+    Returns
+    -------
+    tuple
+        Start and end offsets of component value octets in `substrate`
+        or `None` if component can not be located.
+    """
+    pos, end = 0, len(substrate)
+
+    try:
+        for idx in path:
+            for _ in range(idx):
+                pos = _decodeHeader(substrate, pos, end)[2]
+
+            _, pos, end = _decodeHeader(substrate, pos, end)
+
+    except _Unsupported:
+        return
+
+    return pos, end
@@ -10,6 +10,8 @@ from pysnmp.proto import error
 
 class AbstractMessageProcessingModel:
     SNMP_MSG_SPEC = NotImplementedError
+    # Serialized requests may be retransmitted as they are
+    RESENDABLE_REQUESTS = False
 
     def __init__(self):
         self._snmpMsgSpec = self.SNMP_MSG_SPEC()  # local copy
@@ -61,5 +63,9 @@ class AbstractMessageProcessingModel:
         except error.ProtocolError:
             pass  # XXX maybe these should all follow some scheme?
 
+    def refreshStateInformation(self, sendPduHandle):
+        """Keep state of retransmitted request, `False` if it is gone"""
+        return self._cache.refreshBySendPduHandle(sendPduHandle)
+
     def receiveTimerTick(self, snmpEngine, timeNow):
         self._cache.expireCaches()
@@ -88,6 +88,24 @@ class Cache:
         if sendPduHandle in self.__sendPduHandleIdx:
             self.popByMsgId(self.__sendPduHandleIdx[sendPduHandle])
 
+    def refreshBySendPduHandle(self, sendPduHandle):
+        # Restart expiration of retransmitted request
+        msgId = self.__sendPduHandleIdx.get(sendPduHandle)
+        if msgId not in self.__msgIdIndex:
+            return False
+        msgInfo, expireAt = self.__msgIdIndex[msgId]
+        del self.__expirationQueue[expireAt]["msgId"][msgId]
+
+        expireAt = self.__expirationTimer + 600
+        self.__msgIdIndex[msgId] = msgInfo, expireAt
+
+        if expireAt not in self.__expirationQueue:
+            self.__expirationQueue[expireAt] = {}
+        if "msgId" not in self.__expirationQueue[expireAt]:
+            self.__expirationQueue[expireAt]["msgId"] = {}
+        self.__expirationQueue[expireAt]["msgId"][msgId] = 1
+        return True
+
     def expireCaches(self):
         # Uses internal clock to expire pending messages
         if self.__expirationTimer in self.__expirationQueue:
@@ -97,6 +115,7 @@ class Cache:
                     del self.__stateReferenceIndex[stateReference]
             if "msgId" in cacheInfo:
                 for msgId in cacheInfo["msgId"]:
-                    del self.__msgIdIndex[msgId]
+                    msgInfo, expireAt = self.__msgIdIndex.pop(msgId)
+                    self.__sendPduHandleIdx.pop(msgInfo["sendPduHandle"], None)
             del self.__expirationQueue[self.__expirationTimer]
         self.__expirationTimer += 1
@@ -5,12 +5,12 @@
 # License: https://www.pysnmp.com/pysnmp/license.html
 #
 import sys
-from pyasn1.codec.ber import decoder, eoo
+from pyasn1.codec.ber import eoo
 from pyasn1.type import univ
 from pyasn1.compat.octets import null
 from pyasn1.error import PyAsn1Error
 from pysnmp.proto.mpmod.base import AbstractMessageProcessingModel
-from pysnmp.proto import rfc3411, errind, error
+from pysnmp.proto import rfc3411, ber, errind, error
 from pysnmp.proto.api import v1, v2c
 from pysnmp import debug
 
@@ -23,6 +23,8 @@ from pysnmp import debug
 class SnmpV1MessageProcessingModel(AbstractMessageProcessingModel):
     MESSAGE_PROCESSING_MODEL_ID = univ.Integer(0)  # SNMPv1
     SNMP_MSG_SPEC = v1.Message
+    # Community-based messages carry no time-bound security parameters
+    RESENDABLE_REQUESTS = True
 
     # rfc3412: 7.1
     def prepareOutgoingMessage(
@@ -147,7 +149,7 @@ class SnmpV1MessageProcessingModel(AbstractMessageProcessingModel):
         snmpEngine.observer.storeExecutionContext(
             snmpEngine,
             "rfc2576.prepareOutgoingMessage",
-            dict(
+            lambda: dict(
                 transportDomain=transportDomain,
                 transportAddress=transportAddress,
                 wholeMsg=wholeMsg,
@@ -284,7 +286,7 @@ class SnmpV1MessageProcessingModel(AbstractMessageProcessingModel):
         snmpEngine.observer.storeExecutionContext(
             snmpEngine,
             "rfc2576.prepareResponseMessage",
-            dict(
+            lambda: dict(
                 transportDomain=transportDomain,
                 transportAddress=transportAddress,
                 securityModel=securityModel,
@@ -311,7 +313,7 @@ class SnmpV1MessageProcessingModel(AbstractMessageProcessingModel):
         mibBuilder = snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder
 
         # rfc3412: 7.2.2
-        msg, restOfWholeMsg = decoder.decode(wholeMsg, asn1Spec=self._snmpMsgSpec)
+        msg, restOfWholeMsg = ber.decode(wholeMsg, asn1Spec=self._snmpMsgSpec)
 
         debug.logger & debug.FLAG_MP and debug.logger(
             f"prepareDataElements: {msg.prettyPrint()}"
@@ -373,7 +375,7 @@ class SnmpV1MessageProcessingModel(AbstractMessageProcessingModel):
             snmpEngine.observer.storeExecutionContext(
                 snmpEngine,
                 "rfc2576.prepareDataElements:sm-failure",
-                dict(
+                lambda: dict(
                     transportDomain=transportDomain,
                     transportAddress=transportAddress,
                     securityModel=securityModel,
@@ -450,7 +452,7 @@ class SnmpV1MessageProcessingModel(AbstractMessageProcessingModel):
             snmpEngine.observer.storeExecutionContext(
                 snmpEngine,
                 "rfc2576.prepareDataElements:response",
-                dict(
+                lambda: dict(
                     transportDomain=transportDomain,
                     transportAddress=transportAddress,
                     securityModel=securityModel,
@@ -527,7 +529,7 @@ class SnmpV1MessageProcessingModel(AbstractMessageProcessingModel):
             snmpEngine.observer.storeExecutionContext(
                 snmpEngine,
                 "rfc2576.prepareDataElements:confirmed",
-                dict(
+                lambda: dict(
                     transportDomain=transportDomain,
                     transportAddress=transportAddress,
                     securityModel=securityModel,
@@ -573,7 +575,7 @@ class SnmpV1MessageProcessingModel(AbstractMessageProcessingModel):
             snmpEngine.observer.storeExecutionContext(
                 snmpEngine,
                 "rfc2576.prepareDataElements:unconfirmed",
-                dict(
+                lambda: dict(
                     transportDomain=transportDomain,
                     transportAddress=transportAddress,
                     securityModel=securityModel,
@@ -6,9 +6,9 @@
 #
 import sys
 from pysnmp.proto.mpmod.base import AbstractMessageProcessingModel
-from pysnmp.proto import rfc1905, rfc3411, api, errind, error
+from pysnmp.proto import rfc1905, rfc3411, api, ber, errind, error
 from pyasn1.type import univ, namedtype, constraint
-from pyasn1.codec.ber import decoder, eoo
+from pyasn1.codec.ber import eoo
 from pyasn1.error import PyAsn1Error
 from pysnmp import debug
 
@@ -109,6 +109,8 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
         self.__scopedPDU = ScopedPDU()
         self.__engineIdCache = {}
         self.__engineIdCacheExpQueue = {}
+        # engines cached before timer resolution is known
+        self.__engineIdCacheExpPending = []
         self.__expirationTimer = 0
 
     def getPeerEngineInfo(self, transportDomain, transportAddress):
@@ -122,6 +124,56 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
         else:
             return None, None, None
 
+    def getPeerEnginesInfo(self):
+        """Return a list of `(transportDomain, transportAddress,
+        securityEngineId, contextEngineId, contextName)` tuples of
+        discovered SNMP engines."""
+        return [
+            (
+                transportDomain,
+                transportAddress,
+                peerSnmpEngineData["securityEngineId"],
+                peerSnmpEngineData["contextEngineId"],
+                peerSnmpEngineData["contextName"],
+            )
+            for (
+                transportDomain,
+                transportAddress,
+            ), peerSnmpEngineData in self.__engineIdCache.items()
+        ]
+
+    def setPeerEngineInfo(
+        self,
+        snmpEngine,
+        transportDomain,
+        transportAddress,
+        securityEngineId,
+        contextEngineId,
+        contextName,
+    ):
+        """Cache SNMP engine at transport endpoint as if it was discovered."""
+        k = transportDomain, transportAddress
+
+        self.__engineIdCache[k] = {
+            "securityEngineId": securityEngineId,
+            "contextEngineId": contextEngineId,
+            "contextName": contextName,
+        }
+
+        if snmpEngine.transportDispatcher is None:
+            self.__engineIdCacheExpPending.append(k)
+        else:
+            self.__scheduleEngineInfoExpiry(snmpEngine, k)
+
+    def __scheduleEngineInfoExpiry(self, snmpEngine, k):
+        expireAt = int(
+            self.__expirationTimer
+            + 300 / snmpEngine.transportDispatcher.getTimerResolution()
+        )
+        if expireAt not in self.__engineIdCacheExpQueue:
+            self.__engineIdCacheExpQueue[expireAt] = []
+        self.__engineIdCacheExpQueue[expireAt].append(k)
+
     # 7.1.1a
     def prepareOutgoingMessage(
         self,
@@ -326,7 +378,7 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
         snmpEngine.observer.storeExecutionContext(
             snmpEngine,
             "rfc3412.prepareOutgoingMessage",
-            dict(
+            lambda: dict(
                 transportDomain=transportDomain,
                 transportAddress=transportAddress,
                 wholeMsg=wholeMsg,
@@ -580,7 +632,7 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
         snmpEngine.observer.storeExecutionContext(
             snmpEngine,
             "rfc3412.prepareResponseMessage",
-            dict(
+            lambda: dict(
                 transportDomain=transportDomain,
                 transportAddress=transportAddress,
                 securityModel=securityModel,
@@ -604,7 +656,7 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
         self, snmpEngine, transportDomain, transportAddress, wholeMsg
     ):
         # 7.2.2
-        msg, restOfwholeMsg = decoder.decode(wholeMsg, asn1Spec=self._snmpMsgSpec)
+        msg, restOfwholeMsg = ber.decode(wholeMsg, asn1Spec=self._snmpMsgSpec)
 
         debug.logger & debug.FLAG_MP and debug.logger(
             f"prepareDataElements: {msg.prettyPrint()}"
@@ -695,7 +747,7 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
             snmpEngine.observer.storeExecutionContext(
                 snmpEngine,
                 "rfc3412.prepareDataElements:sm-failure",
-                dict(
+                lambda: dict(
                     transportDomain=transportDomain,
                     transportAddress=transportAddress,
                     securityModel=securityModel,
@@ -785,19 +837,14 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
                 # Here we assume that authentic/default EngineIDs
                 # come only in the course of engine-to-engine communication.
                 if pdu.tagSet in rfc3411.INTERNAL_CLASS_PDUS:
-                    self.__engineIdCache[k] = {
-                        "securityEngineId": securityEngineId,
-                        "contextEngineId": contextEngineId,
-                        "contextName": contextName,
-                    }
-
-                    expireAt = int(
-                        self.__expirationTimer
-                        + 300 / snmpEngine.transportDispatcher.getTimerResolution()
+                    self.setPeerEngineInfo(
+                        snmpEngine,
+                        transportDomain,
+                        transportAddress,
+                        securityEngineId,
+                        contextEngineId,
+                        contextName,
                     )
-                    if expireAt not in self.__engineIdCacheExpQueue:
-                        self.__engineIdCacheExpQueue[expireAt] = []
-                    self.__engineIdCacheExpQueue[expireAt].append(k)
 
                     debug.logger & debug.FLAG_MP and debug.logger(
                         "prepareDataElements: cache securityEngineId {!r} for {!r} {!r}".format(
@@ -867,7 +914,7 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
             snmpEngine.observer.storeExecutionContext(
                 snmpEngine,
                 "rfc3412.prepareDataElements:internal",
-                dict(
+                lambda: dict(
                     transportDomain=transportDomain,
                     transportAddress=transportAddress,
                     securityModel=securityModel,
@@ -913,7 +960,7 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
             snmpEngine.observer.storeExecutionContext(
                 snmpEngine,
                 "rfc3412.prepareDataElements:response",
-                dict(
+                lambda: dict(
                     transportDomain=transportDomain,
                     transportAddress=transportAddress,
                     securityModel=securityModel,
@@ -983,7 +1030,7 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
             snmpEngine.observer.storeExecutionContext(
                 snmpEngine,
                 "rfc3412.prepareDataElements:confirmed",
-                dict(
+                lambda: dict(
                     transportDomain=transportDomain,
                     transportAddress=transportAddress,
                     securityModel=securityModel,
@@ -1024,7 +1071,7 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
             snmpEngine.observer.storeExecutionContext(
                 snmpEngine,
                 "rfc3412.prepareDataElements:unconfirmed",
-                dict(
+                lambda: dict(
                     transportDomain=transportDomain,
                     transportAddress=transportAddress,
                     securityModel=securityModel,
@@ -1065,7 +1112,7 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
     def __expireEnginesInfo(self):
         if self.__expirationTimer in self.__engineIdCacheExpQueue:
             for engineKey in self.__engineIdCacheExpQueue[self.__expirationTimer]:
-                del self.__engineIdCache[engineKey]
+                self.__engineIdCache.pop(engineKey, None)
                 debug.logger & debug.FLAG_MP and debug.logger(
                     f"__expireEnginesInfo: expiring {engineKey!r}"
                 )
@@ -1073,5 +1120,9 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
         self.__expirationTimer += 1
 
     def receiveTimerTick(self, snmpEngine, timeNow):
+        while self.__engineIdCacheExpPending:
+            self.__scheduleEngineInfoExpiry(
+                snmpEngine, self.__engineIdCacheExpPending.pop()
+            )
         self.__expireEnginesInfo()
         AbstractMessageProcessingModel.receiveTimerTick(self, snmpEngine, timeNow)
@@ -10,6 +10,7 @@ from pyasn1.error import PyAsn1Error
 from pysnmp.smi import builder, instrum
 from pysnmp.proto import errind, error, cache
 from pysnmp.proto.api import verdec  # XXX
+from pysnmp.proto.proxy import rfc2576
 from pysnmp.error import PySnmpError
 from pysnmp import nextid, debug
 
@@ -48,6 +49,9 @@ class MsgAndPduDispatcher:
         # Source of sendPduHandle and cache of requesting apps
         self.__sendPduHandle = nextid.Integer(0xFFFFFF)
 
+        # Timed out requests the application may still resend
+        self.__expiredRequests = {}
+
         # To pass transport info to app (legacy)
         self.__transportInfo = {}
 
@@ -150,7 +154,6 @@ class MsgAndPduDispatcher:
                 sendPduHandle,
                 messageProcessingModel=messageProcessingModel,
                 sendPduHandle=sendPduHandle,
-                timeout=timeout + snmpEngine.transportDispatcher.getTimerTicks(),
                 cbFun=cbFun,
                 cbCtx=cbCtx,
             )
@@ -195,7 +198,7 @@ class MsgAndPduDispatcher:
             debug.logger & debug.FLAG_DSP and debug.logger("sendPdu: MP succeeded")
         except PySnmpError:
             if expectResponse:
-                self.__cache.pop(sendPduHandle)
+                self.__popRequest(sendPduHandle)
                 self.releaseStateInformation(
                     snmpEngine, sendPduHandle, messageProcessingModel
                 )
@@ -204,14 +207,14 @@ class MsgAndPduDispatcher:
         # 4.1.1.6
         if snmpEngine.transportDispatcher is None:
             if expectResponse:
-                self.__cache.pop(sendPduHandle)
+                self.__popRequest(sendPduHandle)
 
             raise error.PySnmpError("Transport dispatcher not set")
 
         snmpEngine.observer.storeExecutionContext(
             snmpEngine,
             "rfc3412.sendPdu",
-            dict(
+            lambda: dict(
                 transportDomain=transportDomain,
                 transportAddress=transportAddress,
                 outgoingMessage=outgoingMessage,
@@ -231,15 +234,29 @@ class MsgAndPduDispatcher:
             )
         except PySnmpError:
             if expectResponse:
-                self.__cache.pop(sendPduHandle)
+                self.__popRequest(sendPduHandle)
             raise
 
         snmpEngine.observer.clearExecutionContext(snmpEngine, "rfc3412.sendPdu")
 
         # Update cache with orignal req params (used for retrying)
         if expectResponse:
+            if mpHandler.RESENDABLE_REQUESTS:
+                self.__cache.update(
+                    sendPduHandle,
+                    outgoingMessage=outgoingMessage,
+                    sendTransportDomain=transportDomain,
+                    sendTransportAddress=transportAddress,
+                )
+
             self.__cache.update(
                 sendPduHandle,
+                timerCall=snmpEngine.transportDispatcher.scheduleTimerCall(
+                    timeout * snmpEngine.transportDispatcher.getTimerResolution(),
+                    self.__timeoutRequest,
+                    snmpEngine,
+                    sendPduHandle,
+                ),
                 transportDomain=origTransportDomain,
                 transportAddress=origTransportAddress,
                 securityModel=securityModel,
@@ -253,6 +270,150 @@ class MsgAndPduDispatcher:
 
         return sendPduHandle
 
+    def resendPdu(
+        self, snmpEngine, sendPduHandle, timeout: float = 0, cbFun=None, cbCtx=None
+    ):
+        """PDU dispatcher -- retransmit timed out request as it was serialized
+
+        Only works from within application callback notified of request
+        timeout and only for message processing models whose requests can
+        be sent again verbatim. Retransmitted request keeps its
+        sendPduHandle and message ID.
+
+        Returns sendPduHandle of the retransmitted request or `None` if
+        it can not be resent this way and should be sent anew.
+        """
+        cachedParams = self.__expiredRequests.pop(sendPduHandle, None)
+        if cachedParams is None:
+            return
+
+        mpHandler = snmpEngine.messageProcessingSubsystems[
+            int(cachedParams["messageProcessingModel"])
+        ]
+
+        # responses to retransmitted message are matched by its MP state
+        if not mpHandler.refreshStateInformation(sendPduHandle):
+            self.releaseStateInformation(
+                snmpEngine, sendPduHandle, cachedParams["messageProcessingModel"]
+            )
+            return
+
+        if snmpEngine.transportDispatcher is None:
+            self.releaseStateInformation(
+                snmpEngine, sendPduHandle, cachedParams["messageProcessingModel"]
+            )
+            raise error.PySnmpError("Transport dispatcher not set")
+
+        debug.logger & debug.FLAG_DSP and debug.logger(
+            f"resendPdu: sendPduHandle {sendPduHandle}, timeout {timeout} ticks, cbFun {cbFun}"
+        )
+
+        outgoingMessage = cachedParams["outgoingMessage"]
+        transportDomain = cachedParams["sendTransportDomain"]
+        transportAddress = cachedParams["sendTransportAddress"]
+
+        snmpEngine.observer.storeExecutionContext(
+            snmpEngine,
+            "rfc3412.sendPdu",
+            lambda: dict(
+                transportDomain=transportDomain,
+                transportAddress=transportAddress,
+                outgoingMessage=outgoingMessage,
+                messageProcessingModel=cachedParams["messageProcessingModel"],
+                securityModel=cachedParams["securityModel"],
+                securityName=cachedParams["securityName"],
+                securityLevel=cachedParams["securityLevel"],
+                contextEngineId=cachedParams["contextEngineId"],
+                contextName=cachedParams["contextName"],
+                pdu=cachedParams["PDU"],
+            ),
+        )
+
+        try:
+            snmpEngine.transportDispatcher.sendMessage(
+                outgoingMessage, transportDomain, transportAddress
+            )
+        except PySnmpError:
+            self.releaseStateInformation(
+                snmpEngine, sendPduHandle, cachedParams["messageProcessingModel"]
+            )
+            raise
+
+        snmpEngine.observer.clearExecutionContext(snmpEngine, "rfc3412.sendPdu")
+
+        cachedParams.update(
+            cbFun=cbFun,
+            cbCtx=cbCtx,
+            timerCall=snmpEngine.transportDispatcher.scheduleTimerCall(
+                timeout * snmpEngine.transportDispatcher.getTimerResolution(),
+                self.__timeoutRequest,
+                snmpEngine,
+                sendPduHandle,
+            ),
+        )
+
+        self.__cache.add(sendPduHandle, **cachedParams)
+
+        return sendPduHandle
+
+    def retryPdu(
+        self,
+        snmpEngine,
+        sendPduHandle,
+        transportDomain,
+        transportAddress,
+        messageProcessingModel,
+        securityModel,
+        securityName,
+        securityLevel,
+        contextEngineId,
+        contextName,
+        PDU,
+        timeout: float = 0,
+        cbFun=None,
+        cbCtx=None,
+    ):
+        """PDU dispatcher -- send failed request once again
+
+        Timed out requests are retransmitted as they were serialized
+        whenever :py:meth:`resendPdu` can do that, others are sent anew.
+        SMIv2 `PDU` is converted into SNMPv1 one for SNMPv1 message
+        processing model.
+
+        Returns sendPduHandle of the retransmitted request.
+        """
+        resentPduHandle = self.resendPdu(
+            snmpEngine, sendPduHandle, timeout, cbFun, cbCtx
+        )
+
+        if resentPduHandle is not None:
+            return resentPduHandle
+
+        # User-side API assumes SMIv2
+        if messageProcessingModel == 0:
+            PDU = rfc2576.v2ToV1(PDU)
+            pduVersion = 0
+        else:
+            pduVersion = 1
+
+        return self.sendPdu(
+            snmpEngine,
+            transportDomain,
+            transportAddress,
+            messageProcessingModel,
+            securityModel,
+            securityName,
+            securityLevel,
+            contextEngineId,
+            contextName,
+            pduVersion,
+            PDU,
+            True,
+            timeout,
+            cbFun,
+            cbCtx,
+        )
+
     # 4.1.2.1
     def returnResponsePdu(
         self,
@@ -328,7 +489,7 @@ class MsgAndPduDispatcher:
         snmpEngine.observer.storeExecutionContext(
             snmpEngine,
             "rfc3412.returnResponsePdu",
-            dict(
+            lambda: dict(
                 transportDomain=transportDomain,
                 transportAddress=transportAddress,
                 outgoingMessage=outgoingMessage,
@@ -425,7 +586,7 @@ class MsgAndPduDispatcher:
                 )
                 self.__expireRequest(
                     statusInformation["sendPduHandle"],  # type: ignore
-                    self.__cache.pop(statusInformation["sendPduHandle"]),  # type: ignore
+                    self.__popRequest(statusInformation["sendPduHandle"]),  # type: ignore
                     snmpEngine,
                     statusInformation,
                 )
@@ -522,7 +683,7 @@ class MsgAndPduDispatcher:
                 snmpEngine.observer.storeExecutionContext(
                     snmpEngine,
                     "rfc3412.receiveMessage:request",
-                    dict(
+                    lambda: dict(
                         transportDomain=transportDomain,
                         transportAddress=transportAddress,
                         wholeMsg=wholeMsg,
@@ -574,7 +735,7 @@ class MsgAndPduDispatcher:
             # 4.2.2.2 (response)
 
             # 4.2.2.2.1
-            cachedParams = self.__cache.pop(sendPduHandle)
+            cachedParams = self.__popRequest(sendPduHandle)
 
             # 4.2.2.2.2
             if cachedParams is None:
@@ -596,7 +757,7 @@ class MsgAndPduDispatcher:
             snmpEngine.observer.storeExecutionContext(
                 snmpEngine,
                 "rfc3412.receiveMessage:response",
-                dict(
+                lambda: dict(
                     transportDomain=transportDomain,
                     transportAddress=transportAddress,
                     wholeMsg=wholeMsg,
@@ -646,54 +807,72 @@ class MsgAndPduDispatcher:
             mpHandler = snmpEngine.messageProcessingSubsystems[k]
             mpHandler.releaseStateInformation(sendPduHandle)
 
-        self.__cache.pop(sendPduHandle)
+        self.__popRequest(sendPduHandle)
 
     # Cache expiration stuff
 
+    def __popRequest(self, sendPduHandle):
+        cachedParams = self.__cache.pop(sendPduHandle)
+        if cachedParams is not None and "timerCall" in cachedParams:
+            cachedParams["timerCall"].cancel()
+        return cachedParams
+
+    def __timeoutRequest(self, snmpEngine, sendPduHandle):
+        cachedParams = self.__cache.pop(sendPduHandle)
+        if cachedParams is not None:
+            self.__expireRequest(sendPduHandle, cachedParams, snmpEngine)
+
     # noinspection PyUnusedLocal
     def __expireRequest(
         self, cacheKey, cachedParams, snmpEngine, statusInformation=None
     ):
-        timeNow = snmpEngine.transportDispatcher.getTimerTicks()
-        timeoutAt = cachedParams["timeout"]
-
-        if statusInformation is None and timeNow < timeoutAt:
-            return
-
         processResponsePdu = cachedParams["cbFun"]
 
         debug.logger & debug.FLAG_DSP and debug.logger(
             "__expireRequest: req cachedParams %s" % cachedParams
         )
 
+        sendPduHandle = cachedParams["sendPduHandle"]
+
+        # Keep MP state of timed out resendable requests until application gives up
+        if not statusInformation and "outgoingMessage" in cachedParams:
+            self.__expiredRequests[sendPduHandle] = cachedParams
+        else:
+            self.releaseStateInformation(
+                snmpEngine, sendPduHandle, cachedParams["messageProcessingModel"]
+            )
+
         # Fail timed-out requests
         if not statusInformation:
             statusInformation = error.StatusInformation(
                 errorIndication=errind.requestTimedOut
             )
 
-        self.releaseStateInformation(
-            snmpEngine,
-            cachedParams["sendPduHandle"],
-            cachedParams["messageProcessingModel"],
-        )
+        try:
+            processResponsePdu(
+                snmpEngine,
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+                statusInformation,
+                sendPduHandle,
+                cachedParams["cbCtx"],
+            )
+
+        finally:
+            if self.__expiredRequests.pop(sendPduHandle, None) is not None:
+                self.releaseStateInformation(
+                    snmpEngine, sendPduHandle, cachedParams["messageProcessingModel"]
+                )
 
-        processResponsePdu(
-            snmpEngine,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            statusInformation,
-            cachedParams["sendPduHandle"],
-            cachedParams["cbCtx"],
-        )
         return True
 
     # noinspection PyUnusedLocal
     def receiveTimerTick(self, snmpEngine, timeNow):
-        self.__cache.expire(self.__expireRequest, snmpEngine)
+        # Pending requests expire at their own deadlines, see sendPdu
+        pass
@@ -5,12 +5,11 @@
 # License: https://www.pysnmp.com/pysnmp/license.html
 #
 import sys
-from pyasn1.codec.ber import encoder
 from pyasn1.error import PyAsn1Error
 from pysnmp.proto.secmod import base
 from pysnmp.carrier.asyncio.dgram import udp, udp6, unix
 from pysnmp.smi.error import NoSuchInstanceError
-from pysnmp.proto import errind, error
+from pysnmp.proto import ber, errind, error
 from pysnmp import debug
 
 
@@ -477,7 +476,7 @@ class SnmpV1SecurityModel(base.AbstractSecurityModel):
         )
 
         try:
-            return securityParameters, encoder.encode(msg)
+            return securityParameters, ber.encode(msg)
 
         except PyAsn1Error:
             debug.logger & debug.FLAG_MP and debug.logger(
@@ -526,7 +525,7 @@ class SnmpV1SecurityModel(base.AbstractSecurityModel):
         )
 
         try:
-            return communityName, encoder.encode(msg)
+            return communityName, ber.encode(msg)
 
         except PyAsn1Error:
             debug.logger & debug.FLAG_MP and debug.logger(
@@ -588,7 +587,7 @@ class SnmpV1SecurityModel(base.AbstractSecurityModel):
         snmpEngine.observer.storeExecutionContext(
             snmpEngine,
             "rfc2576.processIncomingMsg",
-            dict(
+            lambda: dict(
                 transportInformation=transportInformation,
                 securityEngineId=securityEngineID,
                 securityName=securityName,
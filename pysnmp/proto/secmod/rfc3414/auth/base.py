@@ -4,7 +4,13 @@
 # Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysnmp/license.html
 #
-from pysnmp.proto import errind, error
+import hmac
+import weakref
+from pysnmp.proto import ber, errind, error
+
+# localized key -> {hash: keyed HMAC}, entries live as long as USM user
+# table keeps localized key objects
+_hmacCache = weakref.WeakKeyDictionary()
 
 
 class AbstractAuthenticationService:
@@ -27,3 +33,57 @@ class AbstractAuthenticationService:
     # 7.2.4.2
     def authenticateIncomingMsg(self, authKey, authParameters, wholeMsg):
         raise error.ProtocolError(errind.noAuthentication)
+
+    @staticmethod
+    def _newHmac(authKey, digestmod):
+        """Return HMAC object keyed with `authKey`.
+
+        Inner and outer hash states of every key are computed once and
+        then cloned for each message.
+        """
+        try:
+            keyedHmacs = _hmacCache[authKey]
+
+        except KeyError:
+            keyedHmacs = _hmacCache[authKey] = {}
+
+        try:
+            keyedHmac = keyedHmacs[digestmod]
+
+        except KeyError:
+            keyedHmac = keyedHmacs[digestmod] = hmac.new(
+                authKey.asOctets(), digestmod=digestmod
+            )
+
+        return keyedHmac.copy()
+
+    @staticmethod
+    def _updateHmac(mac, wholeMsg, location, digestLength):
+        """Feed `wholeMsg` into `mac` as if its digest was zeroed.
+
+        Message parts around the digest are passed as memory views
+        rather than joined into a copy of the message.
+        """
+        wholeMsg = memoryview(wholeMsg)
+
+        mac.update(wholeMsg[:location])
+        mac.update(bytes(digestLength))
+        mac.update(wholeMsg[location + digestLength :])
+
+    @staticmethod
+    def _locateDigest(wholeMsg, digest):
+        """Return offset of `digest` in serialized SNMPv3 message.
+
+        Digest is expected in msgAuthenticationParameters field of
+        msgSecurityParameters, otherwise its first occurrence is
+        searched for, -1 is returned if there is none.
+        """
+        # msgSecurityParameters -> UsmSecurityParameters -> msgAuthenticationParameters
+        location = ber.locate(wholeMsg, 0, 2, 0, 4)
+
+        if location is not None:
+            start, end = location
+            if wholeMsg[start:end] == digest:
+                return start
+
+        return wholeMsg.find(digest)
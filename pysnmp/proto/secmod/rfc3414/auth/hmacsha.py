@@ -11,7 +11,6 @@ from pysnmp.proto.secmod.rfc3414 import localkey
 from pysnmp.proto import errind, error
 
 TWELVE_ZEROS = univ.OctetString((0,) * 12).asOctets()
-FORTY_FOUR_ZEROS = (0,) * 44
 
 
 # 7.2.4
@@ -19,8 +18,6 @@ FORTY_FOUR_ZEROS = (0,) * 44
 
 class HmacSha(base.AbstractAuthenticationService):
     SERVICE_ID = (1, 3, 6, 1, 6, 3, 10, 1, 1, 3)  # usmHMACSHAAuthProtocol
-    IPAD = [0x36] * 64
-    OPAD = [0x5C] * 64
 
     def hashPassphrase(self, authKey):
         return localkey.hashPassphraseSHA(authKey)
@@ -34,36 +31,22 @@ class HmacSha(base.AbstractAuthenticationService):
 
     # 7.3.1
     def authenticateOutgoingMsg(self, authKey, wholeMsg):
-        # 7.3.1.1
         # Here we expect calling secmod to indicate where the digest
         # should be in the substrate. Also, it pre-sets digest placeholder
         # so we hash wholeMsg out of the box.
         # Yes, that's ugly but that's rfc...
-        l = wholeMsg.find(TWELVE_ZEROS)
+        l = self._locateDigest(wholeMsg, TWELVE_ZEROS)
         if l == -1:
             raise error.ProtocolError("Cant locate digest placeholder")
         wholeHead = wholeMsg[:l]
         wholeTail = wholeMsg[l + 12 :]
 
-        # 7.3.1.2a
-        extendedAuthKey = authKey.asNumbers() + FORTY_FOUR_ZEROS
+        # 7.3.1.1 & 2 -- keyed HMAC state is cached per key
 
-        # 7.3.1.2b -- no-op
-
-        # 7.3.1.2c
-        k1 = univ.OctetString(map(lambda x, y: x ^ y, extendedAuthKey, self.IPAD))
-
-        # 7.3.1.2d -- no-op
-
-        # 7.3.1.2e
-        k2 = univ.OctetString(map(lambda x, y: x ^ y, extendedAuthKey, self.OPAD))
-
-        # 7.3.1.3
-        d1 = sha1(k1.asOctets() + wholeMsg).digest()
-
-        # 7.3.1.4
-        d2 = sha1(k2.asOctets() + d1).digest()
-        mac = d2[:12]
+        # 7.3.1.3 & 4
+        mac = self._newHmac(authKey, sha1)
+        mac.update(wholeMsg)
+        mac = mac.digest()[:12]
 
         # 7.3.1.5 & 6
         return wholeHead + mac + wholeTail
@@ -75,37 +58,19 @@ class HmacSha(base.AbstractAuthenticationService):
             raise error.StatusInformation(errorIndication=errind.authenticationError)
 
         # 7.3.2.3
-        l = wholeMsg.find(authParameters.asOctets())
+        l = self._locateDigest(wholeMsg, authParameters.asOctets())
         if l == -1:
             raise error.ProtocolError("Cant locate digest in wholeMsg")
-        wholeHead = wholeMsg[:l]
-        wholeTail = wholeMsg[l + 12 :]
-        authenticatedWholeMsg = wholeHead + TWELVE_ZEROS + wholeTail
-
-        # 7.3.2.4a
-        extendedAuthKey = authKey.asNumbers() + FORTY_FOUR_ZEROS
-
-        # 7.3.2.4b --> no-op
-
-        # 7.3.2.4c
-        k1 = univ.OctetString(map(lambda x, y: x ^ y, extendedAuthKey, self.IPAD))
-
-        # 7.3.2.4d --> no-op
-
-        # 7.3.2.4e
-        k2 = univ.OctetString(map(lambda x, y: x ^ y, extendedAuthKey, self.OPAD))
-
-        # 7.3.2.5a
-        d1 = sha1(k1.asOctets() + authenticatedWholeMsg).digest()
 
-        # 7.3.2.5b
-        d2 = sha1(k2.asOctets() + d1).digest()
+        # 7.3.2.4 -- keyed HMAC state is cached per key
 
-        # 7.3.2.5c
-        mac = d2[:12]
+        # 7.3.2.5
+        mac = self._newHmac(authKey, sha1)
+        self._updateHmac(mac, wholeMsg, l, 12)
+        mac = mac.digest()[:12]
 
         # 7.3.2.6
         if mac != authParameters:
             raise error.StatusInformation(errorIndication=errind.authenticationFailure)
 
-        return authenticatedWholeMsg
+        return wholeMsg
@@ -4,32 +4,232 @@
 # Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysnmp/license.html
 #
-from hashlib import md5, sha1
+import hmac
+import os
+import stat
+import tempfile
+import threading
+from collections import OrderedDict
+from hashlib import md5, sha1, sha256
 from pyasn1.type import univ
+from pysnmp import debug
+from pysnmp import error
+
+# RFC 3414 A.2 password to key algorithm digests that many octets
+PASSPHRASE_EXPANSION_SIZE = 1048576
+PASSPHRASE_BLOCK_SIZE = 65536
+
+# Default number of master (Ku) and localized (Kul) keys kept in memory
+PASS_KEY_CACHE_SIZE = 65536
+LOCAL_KEY_CACHE_SIZE = 131072
+
+# Random secret on-disk cache file names are HMAC-keyed with
+KEY_CACHE_SECRET = "secret"
+KEY_CACHE_SECRET_SIZE = 32
+
+
+class _LruCache:
+    """Least recently used cache of derived keys"""
+
+    def __init__(self, maxSize):
+        self.maxSize = maxSize
+        self.__items = OrderedDict()
+
+    def __len__(self):
+        return len(self.__items)
+
+    def get(self, key):
+        try:
+            self.__items.move_to_end(key)
+
+        except KeyError:
+            return
+
+        return self.__items[key]
+
+    def __setitem__(self, key, value):
+        self.__items[key] = value
+        self.__items.move_to_end(key)
+        self.trim()
+
+    def trim(self):
+        while len(self.__items) > self.maxSize:
+            self.__items.popitem(last=False)
+
+
+# Key derivation caches: master keys (Ku) indexed by hash algorithm and
+# passphrase digest, localized keys (Kul) by algorithm, Ku and engine ID
+_passKeyCache = _LruCache(PASS_KEY_CACHE_SIZE)
+_localKeyCache = _LruCache(LOCAL_KEY_CACHE_SIZE)
+_cacheLock = threading.Lock()
+_cacheDir = _cacheSecret = None
+
+
+def setKeyCacheSize(passKeys=PASS_KEY_CACHE_SIZE, localKeys=LOCAL_KEY_CACHE_SIZE):
+    """Set how many master and localized keys to keep in memory.
+
+    Least recently used keys are dropped once either cache grows
+    beyond its size.
+    """
+    with _cacheLock:
+        _passKeyCache.maxSize = passKeys
+        _passKeyCache.trim()
+        _localKeyCache.maxSize = localKeys
+        _localKeyCache.trim()
+
+
+def setKeyCacheDir(cacheDir=None):
+    """Enable on-disk master key cache at `cacheDir` or disable it.
+
+    Master keys derived from passphrases are stored in files readable
+    only by the owner, so that subsequent processes can skip the costly
+    RFC 3414 passphrase hashing. Cache directory must be owned by the
+    current user, group and others access to it is revoked. File names
+    are keyed with a random secret kept in the directory, so that they
+    can not be matched against guessed passphrases.
+    """
+    global _cacheDir, _cacheSecret
+
+    cacheSecret = None
+
+    if cacheDir is not None:
+        try:
+            os.makedirs(cacheDir, mode=0o700, exist_ok=True)
+
+            st = os.stat(cacheDir)
+
+            if hasattr(os, "getuid") and st.st_uid != os.getuid():
+                raise error.PySnmpError(
+                    f"Key cache directory {cacheDir} is not owned by current user"
+                )
+
+            if stat.S_IMODE(st.st_mode) & (stat.S_IRWXG | stat.S_IRWXO):
+                os.chmod(cacheDir, 0o700)
+
+            cacheSecret = _readCacheSecret(cacheDir)
+
+        except OSError as exc:
+            raise error.PySnmpError(f"Can't set up key cache directory: {exc}")
+
+    with _cacheLock:
+        _cacheDir, _cacheSecret = cacheDir, cacheSecret
+
+
+def clearKeyCache():
+    """Drop all in-memory cached keys."""
+    global _passKeyCache, _localKeyCache
+
+    with _cacheLock:
+        _passKeyCache = _LruCache(_passKeyCache.maxSize)
+        _localKeyCache = _LruCache(_localKeyCache.maxSize)
+
+
+def _readCacheSecret(cacheDir):
+    path = os.path.join(cacheDir, KEY_CACHE_SECRET)
+
+    if not os.path.exists(path):
+        # mkstemp creates files accessible by the owner only
+        fd, fn = tempfile.mkstemp(dir=cacheDir)
+
+        try:
+            os.write(fd, os.urandom(KEY_CACHE_SECRET_SIZE))
+            os.close(fd)
+
+            # first process to link its secret wins
+            os.link(fn, path)
+
+        except FileExistsError:
+            pass
+
+        finally:
+            os.unlink(fn)
+
+    with open(path, "rb") as f:
+        cacheSecret = f.read()
+
+    if len(cacheSecret) != KEY_CACHE_SECRET_SIZE:
+        raise error.PySnmpError(f"Malformed key cache secret at {path}")
+
+    return cacheSecret
+
+
+def _readCachedPassKey(cacheDir, fileName, keySize):
+    try:
+        with open(os.path.join(cacheDir, fileName), "rb") as f:
+            passKey = f.read()
+
+    except OSError:
+        return
+
+    if len(passKey) == keySize:
+        return passKey
+
+
+def _writeCachedPassKey(cacheDir, fileName, passKey):
+    try:
+        # mkstemp creates files accessible by the owner only
+        fd, fn = tempfile.mkstemp(dir=cacheDir)
+        os.write(fd, passKey)
+        os.close(fd)
+        os.replace(fn, os.path.join(cacheDir, fileName))
+
+    except OSError as exc:
+        debug.logger & debug.FLAG_SM and debug.logger(
+            f"_writeCachedPassKey: could not store master key: {exc}"
+        )
 
 
 def hashPassphrase(passphrase, hashFunc):
     passphrase = univ.OctetString(passphrase).asOctets()
+    hashName = hashFunc().name
+
+    # plaintext passphrases are never kept in memory
+    cacheKey = hashName, sha256(hashName.encode() + b":" + passphrase).digest()
+
+    with _cacheLock:
+        passKey = _passKeyCache.get(cacheKey)
+        cacheDir, cacheSecret = _cacheDir, _cacheSecret
+
+    if passKey is not None:
+        return univ.OctetString(passKey)
+
+    if cacheDir is not None:
+        fileName = hmac.new(
+            cacheSecret, hashName.encode() + b":" + passphrase, sha256
+        ).hexdigest()
+
+        passKey = _readCachedPassKey(cacheDir, fileName, hashFunc().digest_size)
+
+    if passKey is None:
+        passKey = _hashPassphrase(passphrase, hashFunc)
+
+        if cacheDir is not None:
+            _writeCachedPassKey(cacheDir, fileName, passKey)
+
+    with _cacheLock:
+        _passKeyCache[cacheKey] = passKey
+
+    return univ.OctetString(passKey)
+
+
+def _hashPassphrase(passphrase, hashFunc):
+    # RFC 3414 A.2: digest one megabyte made of the passphrase repeated
+    # over and over. Rather than feeding it in 64-octet slices, hash it
+    # in large blocks each holding a whole number of passphrase copies,
+    # so that every block starts at the beginning of the passphrase.
+    block = memoryview(passphrase * (PASSPHRASE_BLOCK_SIZE // len(passphrase) + 1))
+
     # noinspection PyDeprecation,PyCallingNonCallable
     hasher = hashFunc()
-    ringBuffer = passphrase * (64 // len(passphrase) + 1)
-    # noinspection PyTypeChecker
-    ringBufferLen = len(ringBuffer)
-    count = 0
-    mark = 0
-    while count < 16384:
-        e = mark + 64
-        if e < ringBufferLen:
-            hasher.update(ringBuffer[mark:e])
-            mark = e
-        else:
-            hasher.update(
-                ringBuffer[mark:ringBufferLen] + ringBuffer[0 : e - ringBufferLen]
-            )
-            mark = e - ringBufferLen
-        count += 1
-    digest = hasher.digest()
-    return univ.OctetString(digest)
+
+    remaining = PASSPHRASE_EXPANSION_SIZE
+    while remaining >= len(block):
+        hasher.update(block)
+        remaining -= len(block)
+
+    hasher.update(block[:remaining])
+
+    return hasher.digest()
 
 
 def passwordToKey(passphrase, snmpEngineId, hashFunc):
@@ -38,11 +238,38 @@ def passwordToKey(passphrase, snmpEngineId, hashFunc):
 
 def localizeKey(passKey, snmpEngineId, hashFunc):
     passKey = univ.OctetString(passKey).asOctets()
+    snmpEngineId = univ.OctetString(snmpEngineId).asOctets()
+
+    cacheKey = (hashFunc().name, passKey, snmpEngineId)
+
+    with _cacheLock:
+        digest = _localKeyCache.get(cacheKey)
+
+    if digest is not None:
+        return univ.OctetString(digest)
+
     # noinspection PyDeprecation,PyCallingNonCallable
-    digest = hashFunc(passKey + snmpEngineId.asOctets() + passKey).digest()
+    digest = hashFunc(passKey + snmpEngineId + passKey).digest()
+
+    with _cacheLock:
+        _localKeyCache[cacheKey] = digest
+
     return univ.OctetString(digest)
 
 
+def localizeKeys(passKey, snmpEngineIds, hashFunc):
+    """Localize one master key against many SNMP engine IDs at once."""
+    passKey = univ.OctetString(passKey).asOctets()
+    return [
+        localizeKey(passKey, snmpEngineId, hashFunc) for snmpEngineId in snmpEngineIds
+    ]
+
+
+def passwordToKeys(passphrase, snmpEngineIds, hashFunc):
+    """Derive localized keys for one passphrase and many SNMP engine IDs."""
+    return localizeKeys(hashPassphrase(passphrase, hashFunc), snmpEngineIds, hashFunc)
+
+
 # RFC3414: A.2.1
 def hashPassphraseMD5(passphrase):
     return hashPassphrase(passphrase, md5)
@@ -16,10 +16,10 @@ from pysnmp.proto.secmod.rfc3826.priv import aes
 from pysnmp.proto.secmod.rfc7860.auth import hmacsha2
 from pysnmp.proto.secmod.eso.priv import des3, aes192, aes256
 from pysnmp.smi.error import NoSuchInstanceError
-from pysnmp.proto import api, rfc1155, rfc3411, errind, error
+from pysnmp.proto import api, ber, rfc1155, rfc3411, errind, error
 from pysnmp import debug
 from pyasn1.type import univ, namedtype, constraint
-from pyasn1.codec.ber import encoder, decoder, eoo
+from pyasn1.codec.ber import eoo
 from pyasn1.error import PyAsn1Error
 from pyasn1.compat.octets import null
 
@@ -96,8 +96,22 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
         self.__securityParametersSpec = UsmSecurityParameters()
         self.__timeline = {}
         self.__timelineExpQueue = {}
+        # timelines set before timer resolution is known
+        self.__timelineExpPending = []
         self.__expirationTimer = 0
         self.__paramsBranchId = -1
+        self.__securityToUserMap = {}
+
+    def __indexUser(self, securityEngineID, securityName, userName):
+        k = securityEngineID, securityName
+
+        # first (lesser) userName wins, in table index order
+        if k in self.__securityToUserMap:
+            otherUserName = self.__securityToUserMap[k]
+            if (len(otherUserName), otherUserName) <= (len(userName), userName):
+                return
+
+        self.__securityToUserMap[k] = userName
 
     def __sec2usr(self, snmpEngine, securityName, securityEngineID=None):
         mibBuilder = snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder
@@ -136,11 +150,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
                     usmUserSecurityName.name + instId
                 ).syntax
 
-                k = __engineID, __securityName
-
-                # first (lesser) securityName wins
-                if k not in self.__securityToUserMap:
-                    self.__securityToUserMap[k] = __userName
+                self.__indexUser(__engineID, __securityName, __userName)
 
         if securityEngineID is None:
             (snmpEngineID,) = mibBuilder.importSymbols(
@@ -231,6 +241,11 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
 
         tblIdx2 = usmUserEntry.getInstIdFromIndices(securityEngineID, userName)
 
+        (usmUserEngineID,) = mibInstrumController.mibBuilder.importSymbols(
+            "SNMP-USER-BASED-SM-MIB", "usmUserEngineID"
+        )
+        branchId = usmUserEngineID.branchVersionId
+
         # New row
         mibInstrumController.writeVars(((usmUserEntry.name + (13,) + tblIdx2, 4),))
 
@@ -242,6 +257,14 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
             usmUserEntry.name + (3,) + tblIdx2
         ).syntax = usmUserSecurityName.syntax
 
+        # If the index was up to date before the new row has been created,
+        # just add the row to it rather than rescanning the whole table
+        if self.__paramsBranchId == branchId:
+            self.__indexUser(
+                securityEngineID, usmUserSecurityName.syntax, usmUserName.syntax
+            )
+            self.__paramsBranchId = usmUserEngineID.branchVersionId
+
         # Store a reference to original row
         usmUserEntry.getNode(
             usmUserEntry.name + (4,) + tblIdx2
@@ -666,7 +689,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
             )
 
             try:
-                dataToEncrypt = encoder.encode(scopedPDU)
+                dataToEncrypt = ber.encode(scopedPDU)
 
             except PyAsn1Error:
                 debug.logger & debug.FLAG_SM and debug.logger(
@@ -767,7 +790,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
 
             try:
                 msg.setComponentByPosition(
-                    2, encoder.encode(securityParameters), verifyConstraints=False
+                    2, ber.encode(securityParameters), verifyConstraints=False
                 )
 
             except PyAsn1Error:
@@ -783,7 +806,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
             )
 
             try:
-                wholeMsg = encoder.encode(msg)
+                wholeMsg = ber.encode(msg)
 
             except PyAsn1Error:
                 debug.logger & debug.FLAG_SM and debug.logger(
@@ -810,7 +833,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
             try:
                 msg.setComponentByPosition(
                     2,
-                    encoder.encode(securityParameters),
+                    ber.encode(securityParameters),
                     verifyConstraints=False,
                     matchTags=False,
                     matchConstraints=False,
@@ -828,7 +851,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
                     "__generateRequestOrResponseMsg: plain outgoing msg: %s"
                     % msg.prettyPrint()
                 )
-                authenticatedWholeMsg = encoder.encode(msg)
+                authenticatedWholeMsg = ber.encode(msg)
 
             except PyAsn1Error:
                 debug.logger & debug.FLAG_SM and debug.logger(
@@ -926,7 +949,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
         )
 
         # 3.2.1
-        securityParameters, rest = decoder.decode(
+        securityParameters, rest = ber.decode(
             securityParameters, asn1Spec=self.__securityParametersSpec
         )
 
@@ -1138,7 +1161,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
         snmpEngine.observer.storeExecutionContext(
             snmpEngine,
             "rfc3414.processIncomingMsg",
-            dict(
+            lambda: dict(
                 securityEngineId=msgAuthoritativeEngineId,
                 snmpEngineBoots=msgAuthoritativeEngineBoots,
                 snmpEngineTime=msgAuthoritativeEngineTime,
@@ -1239,23 +1262,15 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
                 )
 
             # synchronize time with authed peer
-            self.__timeline[msgAuthoritativeEngineId] = (
+            self.setPeerEngineTimeline(
+                snmpEngine,
+                msgAuthoritativeEngineId,
                 securityParameters.getComponentByPosition(1),
                 securityParameters.getComponentByPosition(2),
                 securityParameters.getComponentByPosition(2),
                 int(time.time()),
             )
 
-            timerResolution = (
-                snmpEngine.transportDispatcher is None
-                and 1.0
-                or snmpEngine.transportDispatcher.getTimerResolution()
-            )
-            expireAt = int(self.__expirationTimer + 300 / timerResolution)
-            if expireAt not in self.__timelineExpQueue:
-                self.__timelineExpQueue[expireAt] = []
-            self.__timelineExpQueue[expireAt].append(msgAuthoritativeEngineId)
-
             debug.logger & debug.FLAG_SM and debug.logger(
                 f"processIncomingMsg: store timeline for securityEngineID {msgAuthoritativeEngineId!r}"
             )
@@ -1331,23 +1346,15 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
                     or msgAuthoritativeEngineBoots == snmpEngineBoots
                     and msgAuthoritativeEngineTime > latestReceivedEngineTime
                 ):
-                    self.__timeline[msgAuthoritativeEngineId] = (
+                    self.setPeerEngineTimeline(
+                        snmpEngine,
+                        msgAuthoritativeEngineId,
                         msgAuthoritativeEngineBoots,
                         msgAuthoritativeEngineTime,
                         msgAuthoritativeEngineTime,
                         int(time.time()),
                     )
 
-                    timerResolution = (
-                        snmpEngine.transportDispatcher is None
-                        and 1.0
-                        or snmpEngine.transportDispatcher.getTimerResolution()
-                    )
-                    expireAt = int(self.__expirationTimer + 300 / timerResolution)
-                    if expireAt not in self.__timelineExpQueue:
-                        self.__timelineExpQueue[expireAt] = []
-                    self.__timelineExpQueue[expireAt].append(msgAuthoritativeEngineId)
-
                     debug.logger & debug.FLAG_SM and debug.logger(
                         "processIncomingMsg: stored timeline msgAuthoritativeEngineBoots {} msgAuthoritativeEngineTime {} for msgAuthoritativeEngineId {!r}".format(
                             msgAuthoritativeEngineBoots,
@@ -1419,7 +1426,7 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
                 0
             ).getComponentByPosition(0)
             try:
-                scopedPDU, rest = decoder.decode(decryptedData, asn1Spec=scopedPduSpec)
+                scopedPDU, rest = ber.decode(decryptedData, asn1Spec=scopedPduSpec)
 
             except PyAsn1Error:
                 debug.logger & debug.FLAG_SM and debug.logger(
@@ -1496,6 +1503,46 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
             securityStateReference,
         )
 
+    def getPeerEnginesTimeline(self):
+        """Return a list of `(securityEngineId, snmpEngineBoots,
+        snmpEngineTime, latestReceivedEngineTime, latestUpdateTimestamp)`
+        tuples of SNMP engines time is synchronized with."""
+        return [
+            (securityEngineId,) + tuple(timeline)
+            for securityEngineId, timeline in self.__timeline.items()
+        ]
+
+    def setPeerEngineTimeline(
+        self,
+        snmpEngine,
+        securityEngineId,
+        snmpEngineBoots,
+        snmpEngineTime,
+        latestReceivedEngineTime,
+        latestUpdateTimestamp,
+    ):
+        """Synchronize time with SNMP engine."""
+        self.__timeline[securityEngineId] = (
+            snmpEngineBoots,
+            snmpEngineTime,
+            latestReceivedEngineTime,
+            latestUpdateTimestamp,
+        )
+
+        if snmpEngine.transportDispatcher is None:
+            self.__timelineExpPending.append(securityEngineId)
+        else:
+            self.__scheduleTimelineExpiry(snmpEngine, securityEngineId)
+
+    def __scheduleTimelineExpiry(self, snmpEngine, securityEngineId):
+        expireAt = int(
+            self.__expirationTimer
+            + 300 / snmpEngine.transportDispatcher.getTimerResolution()
+        )
+        if expireAt not in self.__timelineExpQueue:
+            self.__timelineExpQueue[expireAt] = []
+        self.__timelineExpQueue[expireAt].append(securityEngineId)
+
     def __expireTimelineInfo(self):
         if self.__expirationTimer in self.__timelineExpQueue:
             for engineIdKey in self.__timelineExpQueue[self.__expirationTimer]:
@@ -1508,4 +1555,6 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
         self.__expirationTimer += 1
 
     def receiveTimerTick(self, snmpEngine, timeNow):
+        while self.__timelineExpPending:
+            self.__scheduleTimelineExpiry(snmpEngine, self.__timelineExpPending.pop())
         self.__expireTimelineInfo()
@@ -5,7 +5,6 @@
 # License: https://www.pysnmp.com/pysnmp/license.html
 #
 import sys
-import hmac
 from hashlib import sha224, sha256, sha384, sha512
 from pyasn1.type import univ
 from pysnmp.proto.secmod.rfc3414.auth import base
@@ -40,9 +39,6 @@ class HmacSha2(base.AbstractAuthenticationService):
         SHA512_SERVICE_ID: sha512,
     }
 
-    IPAD = [0x36] * 64
-    OPAD = [0x5C] * 64
-
     def __init__(self, oid):
         if oid not in self.HASH_ALGORITHM:
             raise error.ProtocolError(
@@ -65,7 +61,7 @@ class HmacSha2(base.AbstractAuthenticationService):
     # 7.3.1
     def authenticateOutgoingMsg(self, authKey, wholeMsg):
         # 7.3.1.1
-        location = wholeMsg.find(self.__placeHolder)
+        location = self._locateDigest(wholeMsg, self.__placeHolder)
         if location == -1:
             raise error.ProtocolError("Can't locate digest placeholder")
         wholeHead = wholeMsg[:location]
@@ -73,11 +69,13 @@ class HmacSha2(base.AbstractAuthenticationService):
 
         # 7.3.1.2, 7.3.1.3
         try:
-            mac = hmac.new(authKey.asOctets(), wholeMsg, self.__hashAlgo)
+            mac = self._newHmac(authKey, self.__hashAlgo)
 
         except errind.ErrorIndication:
             raise error.StatusInformation(errorIndication=sys.exc_info()[1])
 
+        mac.update(wholeMsg)
+
         # 7.3.1.4
         mac = mac.digest()[: self.__digestLength]
 
@@ -91,20 +89,19 @@ class HmacSha2(base.AbstractAuthenticationService):
             raise error.StatusInformation(errorIndication=errind.authenticationError)
 
         # 7.3.2.3
-        location = wholeMsg.find(authParameters.asOctets())
+        location = self._locateDigest(wholeMsg, authParameters.asOctets())
         if location == -1:
             raise error.ProtocolError("Can't locate digest in wholeMsg")
-        wholeHead = wholeMsg[:location]
-        wholeTail = wholeMsg[location + self.__digestLength :]
-        authenticatedWholeMsg = wholeHead + self.__placeHolder + wholeTail
 
         # 7.3.2.4
         try:
-            mac = hmac.new(authKey.asOctets(), authenticatedWholeMsg, self.__hashAlgo)
+            mac = self._newHmac(authKey, self.__hashAlgo)
 
         except errind.ErrorIndication:
             raise error.StatusInformation(errorIndication=sys.exc_info()[1])
 
+        self._updateHmac(mac, wholeMsg, location, self.__digestLength)
+
         # 7.3.2.5
         mac = mac.digest()[: self.__digestLength]
 
@@ -112,4 +109,4 @@ class HmacSha2(base.AbstractAuthenticationService):
         if mac != authParameters:
             raise error.StatusInformation(errorIndication=errind.authenticationFailure)
 
-        return authenticatedWholeMsg
+        return wholeMsg
@@ -8,11 +8,14 @@ import os
 import sys
 import struct
 import marshal
+import tempfile
 import time
 import traceback
+from collections import deque
 from errno import ENOENT
 from importlib.machinery import SOURCE_SUFFIXES, BYTECODE_SUFFIXES
 from importlib.util import MAGIC_NUMBER as PY_MAGIC_NUMBER
+from importlib.util import cache_from_source, source_hash
 from pysnmp import version as pysnmp_version
 from pysnmp.smi import error
 from pysnmp import debug
@@ -24,8 +27,12 @@ classTypes = (type,)
 
 
 class __AbstractMibSource:
-    def __init__(self, srcName):
+    # whether MIB source location is a directory bytecode cache may go to
+    _cacheNextToSource = True
+
+    def __init__(self, srcName, cacheDir=None):
         self._srcName = srcName
+        self._cacheDir = cacheDir or os.environ.get("PYSNMP_MIB_CACHE_DIR")
         self.__inited = None
         debug.logger & debug.FLAG_BLD and debug.logger("trying %s" % self)
 
@@ -65,7 +72,12 @@ class __AbstractMibSource:
     def read(self, f):
         pycTime = pyTime = -1
 
+        index = self._getIndex()
+
         for pycSfx in BYTECODE_SUFFIXES:
+            if f + pycSfx not in index:
+                continue
+
             try:
                 pycData, pycPath = self._getData(f + pycSfx, "rb")
 
@@ -97,6 +109,9 @@ class __AbstractMibSource:
                     )
 
         for pySfx in SOURCE_SUFFIXES:
+            if f + pySfx not in index:
+                continue
+
             try:
                 pyTime = self._getTimestamp(f + pySfx)
 
@@ -122,42 +137,173 @@ class __AbstractMibSource:
             return marshal.loads(pycData), pycSfx
 
         if pyTime != -1:
-            modData, pyPath = self._getData(f + pySfx, "r")
-            return compile(modData, pyPath, "exec"), pyPath
+            modData, pyPath = self._getData(f + pySfx, "rb")
+
+            codeObj = self.__readBytecodeCache(pyPath, pyTime, modData)
+
+            if codeObj is None:
+                codeObj = compile(modData, pyPath, "exec")
+                self.__writeBytecodeCache(pyPath, pyTime, modData, codeObj)
+
+            return codeObj, pySfx
 
         raise OSError(ENOENT, "No suitable module found", f)
 
+    # Bytecode cache of MIB modules compiled from source
+
+    def __getCachePaths(self, pyPath):
+        # __pycache__ next to the source, then cache dir mirroring source path
+        try:
+            cachePath = cache_from_source(self._getCacheSourcePath(pyPath))
+
+        except NotImplementedError:
+            return ()
+
+        cachePaths = []
+
+        if self._cacheNextToSource:
+            cachePaths.append(cachePath)
+
+        if self._cacheDir:
+            cachePaths.append(
+                os.path.join(
+                    self._cacheDir,
+                    os.path.splitdrive(os.path.abspath(cachePath))[1].lstrip(os.sep),
+                )
+            )
+
+        return cachePaths
+
+    def __readBytecodeCache(self, pyPath, pyTime, pyData):
+        for cachePath in self.__getCachePaths(pyPath):
+            try:
+                with open(cachePath, "rb") as fp:
+                    cacheData = fp.read()
+
+            except OSError:
+                continue
+
+            if len(cacheData) < 16 or cacheData[:4] != PY_MAGIC_NUMBER:
+                debug.logger & debug.FLAG_BLD and debug.logger(
+                    "bad magic in %s" % cachePath
+                )
+                continue
+
+            flags = struct.unpack("<L", cacheData[4:8])[0]
+
+            if flags & 0x01:
+                valid = cacheData[8:16] == source_hash(pyData)
+
+            else:
+                valid = cacheData[8:16] == struct.pack(
+                    "<LL", int(pyTime) & 0xFFFFFFFF, len(pyData) & 0xFFFFFFFF
+                )
+
+            if not valid:
+                debug.logger & debug.FLAG_BLD and debug.logger(
+                    f"stale bytecode cache {cachePath} for {pyPath}"
+                )
+                continue
+
+            try:
+                codeObj = marshal.loads(cacheData[16:])
+
+            except (EOFError, ValueError, TypeError):
+                debug.logger & debug.FLAG_BLD and debug.logger(
+                    f"bad bytecode cache {cachePath}: {sys.exc_info()[1]}"
+                )
+                continue
+
+            debug.logger & debug.FLAG_BLD and debug.logger(
+                f"using bytecode cache {cachePath} for {pyPath}"
+            )
+
+            return codeObj
+
+    def __writeBytecodeCache(self, pyPath, pyTime, pyData, codeObj):
+        if sys.dont_write_bytecode:
+            return
+
+        # timestamp-based .pyc as written by importlib
+        cacheData = (
+            PY_MAGIC_NUMBER
+            + struct.pack("<LLL", 0, int(pyTime) & 0xFFFFFFFF, len(pyData) & 0xFFFFFFFF)
+            + marshal.dumps(codeObj)
+        )
+
+        for cachePath in self.__getCachePaths(pyPath):
+            cacheDir = os.path.dirname(cachePath)
+
+            try:
+                os.makedirs(cacheDir, exist_ok=True)
+
+                fd, tmpPath = tempfile.mkstemp(dir=cacheDir)
+
+                try:
+                    with os.fdopen(fd, "wb") as fp:
+                        fp.write(cacheData)
+
+                    os.replace(tmpPath, cachePath)
+
+                except OSError:
+                    os.unlink(tmpPath)
+                    raise
+
+            except OSError:
+                debug.logger & debug.FLAG_BLD and debug.logger(
+                    f"bytecode cache {cachePath} write error: {sys.exc_info()[1]}"
+                )
+                continue
+
+            debug.logger & debug.FLAG_BLD and debug.logger(
+                f"wrote bytecode cache {cachePath} for {pyPath}"
+            )
+
+            return
+
     # Interfaces for subclasses
     def _init(self):
         raise NotImplementedError()
 
-    def _listdir(self):
+    def _getIndex(self):
+        """Return a set of file names available at this MIB source."""
         raise NotImplementedError()
 
+    def _listdir(self):
+        return self._uniqNames(self._getIndex())
+
     def _getTimestamp(self, f):
         raise NotImplementedError()
 
     def _getData(self, f, mode):
         NotImplementedError()
 
+    def _getCacheSourcePath(self, pyPath):
+        """Return MIB source file path bytecode cache location derives from."""
+        return pyPath
+
 
 class ZipMibSource(__AbstractMibSource):
+    # nothing can be written into ZIP archive, only cache dir is used
+    _cacheNextToSource = False
+
     def _init(self):
         try:
             p = __import__(self._srcName, globals(), locals(), ["__init__"])
             if hasattr(p, "__loader__") and hasattr(p.__loader__, "_files"):
                 self.__loader = p.__loader__
+                self.__index = None
                 self._srcName = self._srcName.replace(".", os.sep)
                 return self
             elif hasattr(p, "__file__"):
                 # Dir relative to PYTHONPATH
-                return DirMibSource(os.path.split(p.__file__)[0]).init()
+                return DirMibSource(os.path.split(p.__file__)[0], self._cacheDir).init()
             else:
                 raise error.MibLoadError(f"{p} access error")
 
         except ImportError:
             # Dir relative to CWD
-            return DirMibSource(self._srcName).init()
+            return DirMibSource(self._srcName, self._cacheDir).init()
 
     @staticmethod
     def _parseDosTime(dosdate, dostime):
@@ -174,14 +320,17 @@ class ZipMibSource(__AbstractMibSource):
         )  # dst
         return time.mktime(t)
 
-    def _listdir(self):
-        l = []
-        # noinspection PyProtectedMember
-        for f in self.__loader._files.keys():
-            d, f = os.path.split(f)
-            if d == self._srcName:
-                l.append(f)
-        return tuple(self._uniqNames(l))
+    def _getIndex(self):
+        # ZIP archive contents do not change while it is being imported from
+        if self.__index is None:
+            index = set()
+            # noinspection PyProtectedMember
+            for f in self.__loader._files.keys():
+                d, f = os.path.split(f)
+                if d == self._srcName:
+                    index.add(f)
+            self.__index = frozenset(index)
+        return self.__index
 
     def _getTimestamp(self, f):
         p = os.path.join(self._srcName, f)
@@ -203,21 +352,50 @@ class ZipMibSource(__AbstractMibSource):
             why = sys.exc_info()
             raise OSError(ENOENT, f"File or ZIP archive {p} access error: {why[1]}")
 
+    def _getCacheSourcePath(self, pyPath):
+        # paths inside archive are relative, anchor them at the archive
+        return os.path.join(self.__loader.archive, pyPath)
+
 
 class DirMibSource(__AbstractMibSource):
+    # Directory listings younger than this, seconds, are not trusted
+    RACY_PERIOD = 2
+
     def _init(self):
         self._srcName = os.path.normpath(self._srcName)
+        self.__index = frozenset()
+        self.__indexMtime = None
+        self.__indexRacy = False
         return self
 
-    def _listdir(self):
+    def _getIndex(self):
+        # directory listing is re-read only when directory mtime changes
         try:
-            return self._uniqNames(os.listdir(self._srcName))
+            mtime = os.stat(self._srcName).st_mtime_ns
+
         except OSError:
-            why = sys.exc_info()
-            debug.logger & debug.FLAG_BLD and debug.logger(
-                f"listdir() failed for {self._srcName}: {why[1]}"
+            mtime = None
+
+        if mtime != self.__indexMtime or self.__indexRacy:
+            try:
+                self.__index = frozenset(os.listdir(self._srcName))
+
+            except OSError:
+                why = sys.exc_info()
+                debug.logger & debug.FLAG_BLD and debug.logger(
+                    f"listdir() failed for {self._srcName}: {why[1]}"
+                )
+                self.__index = frozenset()
+
+            self.__indexMtime = mtime
+
+            # changes within file system timestamp granularity (e.g. freshly
+            # compiled MIBs) may not update mtime
+            self.__indexRacy = (
+                mtime is not None and time.time() - mtime / 1e9 < self.RACY_PERIOD
             )
-            return ()
+
+        return self.__index
 
     def _getTimestamp(self, f):
         p = os.path.join(self._srcName, f)
@@ -229,7 +407,7 @@ class DirMibSource(__AbstractMibSource):
     def _getData(self, f, mode):
         p = os.path.join(self._srcName, "*")
         try:
-            if f in os.listdir(self._srcName):  # make FS case-sensitive
+            if f in self._getIndex():  # make FS case-sensitive
                 p = os.path.join(self._srcName, f)
                 fp = open(p, mode)
                 data = fp.read()
@@ -256,6 +434,9 @@ class MibBuilder:
 
     loadTexts = False
 
+    # How many past exports/unexports to remember for incremental indexing
+    CHANGES_JOURNAL_SIZE = 1024
+
     # MIB modules can use this to select the features they can use
     version = pysnmp_version
 
@@ -272,6 +453,7 @@ class MibBuilder:
         for m in self.DEFAULT_CORE_MIBS.split(os.pathsep):
             sources.insert(0, ZipMibSource(m))
         self.mibSymbols = {}
+        self.__changes = deque(maxlen=self.CHANGES_JOURNAL_SIZE)
         self.__mibSources = []
         self.__modSeen = {}
         self.__modPathsSeen = set()
@@ -305,6 +487,10 @@ class MibBuilder:
     def getMibSources(self):
         return tuple(self.__mibSources)
 
+    def getLoadedModules(self):
+        """Return a dict of loaded MIB module names and their file paths."""
+        return dict(self.__modSeen)
+
     # Legacy/compatibility methods (won't work for .eggs)
     def setMibPath(self, *mibPaths):
         self.setMibSources(*[DirMibSource(x) for x in mibPaths])
@@ -455,6 +641,7 @@ class MibBuilder:
         if modName not in self.mibSymbols:
             self.mibSymbols[modName] = {}
         mibSymbols = self.mibSymbols[modName]
+        addedSyms = []
 
         for symObj in anonymousSyms:
             debug.logger & debug.FLAG_BLD and debug.logger(
@@ -462,6 +649,7 @@ class MibBuilder:
                 % (modName, self._autoName)
             )
             mibSymbols["__pysnmp_%ld" % self._autoName] = symObj
+            addedSyms.append(symObj)
             self._autoName += 1
         for symName, symObj in namedSyms.items():
             if symName in mibSymbols:
@@ -475,12 +663,14 @@ class MibBuilder:
                     symObj.setLabel(symName)
 
             mibSymbols[symName] = symObj
+            addedSyms.append(symObj)
 
             debug.logger & debug.FLAG_BLD and debug.logger(
                 f"exportSymbols: symbol {modName}::{symName}"
             )
 
         self.lastBuildId += 1
+        self.__changes.append((self.lastBuildId, addedSyms, ()))
 
     def unexportSymbols(self, modName, *symNames):
         if modName not in self.mibSymbols:
@@ -488,10 +678,11 @@ class MibBuilder:
         mibSymbols = self.mibSymbols[modName]
         if not symNames:
             symNames = list(mibSymbols.keys())
+        removedSyms = []
         for symName in symNames:
             if symName not in mibSymbols:
                 raise error.SmiError(f"No symbol {modName}::{symName} at {self}")
-            del mibSymbols[symName]
+            removedSyms.append(mibSymbols.pop(symName))
 
             debug.logger & debug.FLAG_BLD and debug.logger(
                 f"unexportSymbols: symbol {modName}::{symName}"
@@ -501,3 +692,23 @@ class MibBuilder:
             del self.mibSymbols[modName]
 
         self.lastBuildId += 1
+        self.__changes.append((self.lastBuildId, (), removedSyms))
+
+    def getChangesSince(self, buildId):
+        """Return symbols exported and unexported after `buildId`.
+
+        Returns a list of `(addedSymbols, removedSymbols)` tuples in the
+        order changes were made or `None` if the journal does not reach
+        that far back and the caller should re-index everything.
+        """
+        if buildId == self.lastBuildId:
+            return []
+
+        if not self.__changes or self.__changes[0][0] > buildId + 1:
+            return None
+
+        return [
+            (addedSyms, removedSyms)
+            for changeId, addedSyms, removedSyms in self.__changes
+            if changeId > buildId
+        ]
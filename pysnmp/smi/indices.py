@@ -4,15 +4,77 @@
 # Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysnmp/license.html
 #
-from bisect import bisect
+from bisect import bisect_left, bisect_right, insort
+
+
+class OrderedView:
+    """Ordered, indexable view of OrderedDict keys, values or items
+
+    Nothing is copied, callers removing or adding keys while iterating
+    over the view should iterate over a list made of it instead.
+    """
+
+    def __init__(self, owner, getter):
+        self.__owner = owner
+        self.__getter = getter
+
+    def __len__(self):
+        return len(self.__owner)
+
+    def __iter__(self):
+        getter = self.__getter
+        for key in self.__owner:
+            yield getter(key)
+
+    def __reversed__(self):
+        owner = self.__owner
+        for index in range(len(owner) - 1, -1, -1):
+            yield self.__getter(owner.keyAt(index))
+
+    def __contains__(self, item):
+        return any(x == item for x in self)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self.__getter(self.__owner.keyAt(index))
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+
+class OrderedKeysView(OrderedView):
+    """Ordered, indexable view of OrderedDict keys"""
+
+    def __init__(self, owner):
+        OrderedView.__init__(self, owner, lambda k: k)
+        self.__owner = owner
+
+    def __contains__(self, key):
+        return key in self.__owner
 
 
 class OrderedDict(dict):
-    """Ordered dictionary used for indices"""
+    """Ordered dictionary used for indices
+
+    Keys are kept sorted in a list of bounded-size chunks, so that
+    insertion, removal and next key lookup take logarithmic time and
+    never require re-sorting or copying the whole set of keys.
+    """
+
+    CHUNK_SIZE = 256
 
     def __init__(self, *args, **kwargs):
-        self.__keys = []
-        self.__dirty = True
+        self.__chunks = []
+        self.__maxes = []
+        self.__offsets = None
+        self.__origKeys = {}
+        self.__lensCount = {}
+        self.__keysLens = None
+        self.__version = 0
         super().__init__()
         if args:
             self.update(*args)
@@ -21,41 +83,64 @@ class OrderedDict(dict):
 
     def __setitem__(self, key, value):
         if key not in self:
-            self.__keys.append(key)
-            self.__dirty = True
+            self.__insert(key)
         super().__setitem__(key, value)
 
     def __delitem__(self, key):
-        if key in self:
-            self.__keys.remove(key)
-            self.__dirty = True
         super().__delitem__(key)
+        self.__remove(key)
+
+    def __iter__(self):
+        version = self.__version
+        origKeys = self.__origKeys
+        for chunk in self.__chunks:
+            for sortKey in chunk:
+                if version != self.__version:
+                    raise RuntimeError("dictionary changed size during iteration")
+                yield origKeys.get(sortKey, sortKey) if origKeys else sortKey
+
+        if version != self.__version:
+            raise RuntimeError("dictionary changed size during iteration")
+
+    def __reduce__(self):
+        return self.__class__, (list(self.items()),)
 
     def clear(self):
         super().clear()
-        self.__keys = []
-        self.__dirty = True
+        self.__version += 1
+        self.__chunks = []
+        self.__maxes = []
+        self.__offsets = None
+        self.__origKeys = {}
+        self.__lensCount = {}
+        self.__keysLens = None
+
+    def pop(self, key, *default):
+        if key in self:
+            value = super().pop(key)
+            self.__remove(key)
+            return value
+        return super().pop(key, *default)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
 
     def keys(self):
-        if self.__dirty:
-            self.__order()
-        return list(self.__keys)
+        return OrderedKeysView(self)
 
     def values(self):
-        if self.__dirty:
-            self.__order()
-        return [self[k] for k in self.__keys]
+        return OrderedView(self, super().__getitem__)
 
     def items(self):
-        if self.__dirty:
-            self.__order()
-        return [(k, self[k]) for k in self.__keys]
+        return OrderedView(self, lambda k, g=super().__getitem__: (k, g(k)))
 
     def update(self, *args, **kwargs):
         if args:
             iterable = args[0]
             if hasattr(iterable, "keys"):
-                for k in iterable:
+                for k in iterable.keys():
                     self[k] = iterable[k]
             else:
                 for k, v in iterable:
@@ -65,53 +150,142 @@ class OrderedDict(dict):
             for k in kwargs:
                 self[k] = kwargs[k]
 
-    def sortingFun(self, keys):
-        keys.sort()
+    def sortKey(self, key):
+        return key
+
+    def __insert(self, key):
+        sortKey = self.sortKey(key)
+        if sortKey is not key:
+            self.__origKeys[sortKey] = key
 
-    def __order(self):
-        self.sortingFun(self.__keys)
-        self.__keysLens = sorted({len(k) for k in self.__keys}, reverse=True)
-        self.__dirty = False
+        chunks = self.__chunks
+        maxes = self.__maxes
+
+        if not maxes:
+            chunks.append([sortKey])
+            maxes.append(sortKey)
+
+        else:
+            pos = bisect_left(maxes, sortKey)
+            if pos == len(maxes):
+                pos -= 1
+                chunks[pos].append(sortKey)
+                maxes[pos] = sortKey
+            else:
+                insort(chunks[pos], sortKey)
+
+            chunk = chunks[pos]
+            if len(chunk) > self.CHUNK_SIZE * 2:
+                half = chunk[self.CHUNK_SIZE :]
+                del chunk[self.CHUNK_SIZE :]
+                maxes[pos] = chunk[-1]
+                chunks.insert(pos + 1, half)
+                maxes.insert(pos + 1, half[-1])
+
+        self.__offsets = None
+        self.__version += 1
+
+        keyLen = len(key)
+        if keyLen in self.__lensCount:
+            self.__lensCount[keyLen] += 1
+        else:
+            self.__lensCount[keyLen] = 1
+            self.__keysLens = None
+
+    def __remove(self, key):
+        sortKey = self.sortKey(key)
+        if sortKey is not key:
+            self.__origKeys.pop(sortKey, None)
+
+        chunks = self.__chunks
+        maxes = self.__maxes
+
+        pos = bisect_left(maxes, sortKey)
+        chunk = chunks[pos]
+        idx = bisect_left(chunk, sortKey)
+        del chunk[idx]
+
+        if not chunk:
+            del chunks[pos]
+            del maxes[pos]
+        elif idx == len(chunk):
+            maxes[pos] = chunk[-1]
+
+        self.__offsets = None
+        self.__version += 1
+
+        keyLen = len(key)
+        self.__lensCount[keyLen] -= 1
+        if not self.__lensCount[keyLen]:
+            del self.__lensCount[keyLen]
+            self.__keysLens = None
+
+    def __origKey(self, sortKey):
+        if self.__origKeys:
+            return self.__origKeys.get(sortKey, sortKey)
+        return sortKey
+
+    def firstKey(self):
+        if not self.__chunks:
+            raise KeyError("empty dictionary")
+        return self.__origKey(self.__chunks[0][0])
+
+    def lastKey(self):
+        if not self.__chunks:
+            raise KeyError("empty dictionary")
+        return self.__origKey(self.__chunks[-1][-1])
+
+    def keyAt(self, index):
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("key index out of range")
+
+        chunks = self.__chunks
+
+        if index == 0:
+            return self.__origKey(chunks[0][0])
+
+        if index == size - 1:
+            return self.__origKey(chunks[-1][-1])
+
+        if self.__offsets is None:
+            offsets = []
+            offset = 0
+            for chunk in chunks:
+                offsets.append(offset)
+                offset += len(chunk)
+            self.__offsets = offsets
+
+        pos = bisect_right(self.__offsets, index) - 1
+
+        return self.__origKey(chunks[pos][index - self.__offsets[pos]])
 
     def nextKey(self, key):
-        if self.__dirty:
-            self.__order()
+        sortKey = self.sortKey(key)
 
-        keys = self.__keys
+        maxes = self.__maxes
 
-        nextIdx = bisect(keys, key)
+        pos = bisect_right(maxes, sortKey)
 
-        if nextIdx < len(keys):
-            return keys[nextIdx]
+        if pos < len(maxes):
+            chunk = self.__chunks[pos]
+            return self.__origKey(chunk[bisect_right(chunk, sortKey)])
 
         else:
             raise KeyError(key)
 
     def getKeysLens(self):
-        if self.__dirty:
-            self.__order()
+        if self.__keysLens is None:
+            self.__keysLens = sorted(self.__lensCount, reverse=True)
         return self.__keysLens
 
 
 class OidOrderedDict(OrderedDict):
     """OID-ordered dictionary used for indices"""
 
-    def __init__(self, *args, **kwargs):
-        self.__keysCache = {}
-        OrderedDict.__init__(self, *args, **kwargs)
-
-    def __setitem__(self, key, value):
-        OrderedDict.__setitem__(self, key, value)
-        if key not in self.__keysCache:
-            if isinstance(key, tuple):
-                self.__keysCache[key] = key
-            else:
-                self.__keysCache[key] = [int(x) for x in key.split(".") if x]
-
-    def __delitem__(self, key):
-        OrderedDict.__delitem__(self, key)
-        if key in self.__keysCache:
-            del self.__keysCache[key]
-
-    def sortingFun(self, keys):
-        keys.sort(key=lambda k, d=self.__keysCache: d[k])
+    def sortKey(self, key):
+        if isinstance(key, str):
+            return tuple(int(x) for x in key.split(".") if x)
+        return key
@@ -4,6 +4,9 @@
 # Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysnmp/license.html
 #
+import asyncio
+import contextvars
+import inspect
 import sys
 import traceback
 from pysnmp.smi import error
@@ -12,6 +15,9 @@ from pysnmp.smi.builder import MibBuilder
 
 __all__ = ["AbstractMibInstrumController", "MibInstrumController"]
 
+# Executor to run synchronous managed objects hooks in
+HOOK_EXECUTOR = contextvars.ContextVar("HOOK_EXECUTOR", default=None)
+
 
 class AbstractMibInstrumController:
     def readVars(self, varBinds, acInfo=(None, None)):
@@ -23,6 +29,15 @@ class AbstractMibInstrumController:
     def writeVars(self, varBinds, acInfo=(None, None)):
         raise error.NoSuchObjectError(idx=0)
 
+    async def readVarsAsync(self, varBinds, acInfo=(None, None), executor=None):
+        return self.readVars(varBinds, acInfo)
+
+    async def readNextVarsAsync(self, varBinds, acInfo=(None, None), executor=None):
+        return self.readNextVars(varBinds, acInfo)
+
+    async def writeVarsAsync(self, varBinds, acInfo=(None, None), executor=None):
+        return self.writeVars(varBinds, acInfo)
+
 
 class MibInstrumController(AbstractMibInstrumController):
     mibBuilder: MibBuilder
@@ -59,11 +74,18 @@ class MibInstrumController(AbstractMibInstrumController):
         ("readGet", "err"): "stop",
         ("*", "err"): "stop",
     }
+    # States run for all var-binds at once
+    fsmConcurrentStates = frozenset(
+        ("readTest", "readGet", "readTestNext", "readGetNext")
+    )
 
     def __init__(self, mibBuilder: MibBuilder):
         self.mibBuilder = mibBuilder
         self.lastBuildId = -1
         self.lastBuildSyms = {}
+        self.__attachedSyms = {}
+        self.__shadowedSyms = set()
+        self.__writeLock = None
 
     def getMibBuilder(self):
         return self.mibBuilder
@@ -75,6 +97,14 @@ class MibInstrumController(AbstractMibInstrumController):
         if self.lastBuildId == self.mibBuilder.lastBuildId:
             return
 
+        changes = self.mibBuilder.getChangesSince(self.lastBuildId)
+
+        if changes is None or not self.__updateMib(changes):
+            self.__rebuildMib()
+
+        self.lastBuildId = self.mibBuilder.lastBuildId
+
+    def __classifySymbols(self, symObjs):
         (
             MibScalarInstance,
             MibScalar,
@@ -90,6 +120,128 @@ class MibInstrumController(AbstractMibInstrumController):
             "MibTable",
         )
 
+        scalars = {}
+        instances = {}
+        tables = {}
+        rows = {}
+        cols = {}
+        seen = set()
+        duplicates = set()
+
+        for symObj in symObjs:
+            if isinstance(
+                symObj, (MibTable, MibTableRow, MibScalar, MibScalarInstance)
+            ):
+                if symObj.name in seen:
+                    duplicates.add(symObj.name)
+                else:
+                    seen.add(symObj.name)
+
+            if isinstance(symObj, MibTable):
+                tables[symObj.name] = symObj
+            elif isinstance(symObj, MibTableRow):
+                rows[symObj.name] = symObj
+            elif isinstance(symObj, MibTableColumn):
+                cols[symObj.name] = symObj
+            elif isinstance(symObj, MibScalarInstance):
+                instances[symObj.name] = symObj
+            elif isinstance(symObj, MibScalar):
+                scalars[symObj.name] = symObj
+
+        return scalars, instances, tables, rows, cols, duplicates
+
+    def __updateMib(self, changes):
+        """Attach/detach only Managed Objects changed since last build.
+
+        Returns `False` if a change can not be applied incrementally
+        (e.g. conflicting or orphan objects), the caller should then
+        rebuild the whole tree.
+        """
+        (mibTree,) = self.mibBuilder.importSymbols("SNMPv2-SMI", "iso")
+
+        attachedSyms = self.__attachedSyms
+
+        for addedSyms, removedSyms in changes:
+            (
+                scalars,
+                instances,
+                tables,
+                rows,
+                cols,
+                duplicates,
+            ) = self.__classifySymbols(removedSyms)
+
+            if duplicates:
+                return False
+
+            # Detach leaves first
+            for symObjs in (instances, cols, rows, tables, scalars):
+                for symName, symObj in symObjs.items():
+                    if attachedSyms.get(symName) is not symObj:
+                        return False
+
+                    # Another module may define the same object
+                    if symName in self.__shadowedSyms:
+                        return False
+
+                    if getattr(symObj, "_vars", None):
+                        return False
+
+                    parentName = self.lastBuildSyms[symName]
+                    if parentName == mibTree.name:
+                        mibTree.unregisterSubtrees(symName)
+                    else:
+                        attachedSyms[parentName].unregisterSubtrees(symName)
+
+                    del attachedSyms[symName]
+                    del self.lastBuildSyms[symName]
+
+            (
+                scalars,
+                instances,
+                tables,
+                rows,
+                cols,
+                duplicates,
+            ) = self.__classifySymbols(addedSyms)
+
+            if duplicates:
+                return False
+
+            # Attach top-level objects first
+            for symObjs in (scalars, tables, rows):
+                for symName, symObj in symObjs.items():
+                    if symName in attachedSyms:
+                        return False
+
+                    mibTree.registerSubtrees(symObj)
+                    attachedSyms[symName] = symObj
+                    self.lastBuildSyms[symName] = mibTree.name
+
+            for symName, col in cols.items():
+                rowName = col.name[:-1]  # XXX
+                if symName in attachedSyms or rowName not in attachedSyms:
+                    return False
+
+                attachedSyms[rowName].registerSubtrees(col)
+                attachedSyms[symName] = col
+                self.lastBuildSyms[symName] = rowName
+
+            for symName, inst in instances.items():
+                if symName in attachedSyms or inst.typeName not in attachedSyms:
+                    return False
+
+                attachedSyms[inst.typeName].registerSubtrees(inst)
+                attachedSyms[symName] = inst
+                self.lastBuildSyms[symName] = inst.typeName
+
+        debug.logger & debug.FLAG_INS and debug.logger(
+            "__updateMib: applied %d change(s)" % len(changes)
+        )
+
+        return True
+
+    def __rebuildMib(self):
         (mibTree,) = self.mibBuilder.importSymbols("SNMPv2-SMI", "iso")
 
         #
@@ -112,42 +264,32 @@ class MibInstrumController(AbstractMibInstrumController):
         # Mind you, only Managed Objects get indexed here, various MIB defs and
         # constants can't be SNMP managed so we drop them.
         #
-        scalars = {}
-        instances = {}
-        tables = {}
-        rows = {}
-        cols = {}
 
         # Sort by module name to give user a chance to slip-in
         # custom MIB modules (that would be sorted out first)
         mibSymbols = list(self.mibBuilder.mibSymbols.items())
         mibSymbols.sort(key=lambda x: x[0], reverse=True)
 
-        for modName, mibMod in mibSymbols:
-            for symObj in mibMod.values():
-                if isinstance(symObj, MibTable):
-                    tables[symObj.name] = symObj
-                elif isinstance(symObj, MibTableRow):
-                    rows[symObj.name] = symObj
-                elif isinstance(symObj, MibTableColumn):
-                    cols[symObj.name] = symObj
-                elif isinstance(symObj, MibScalarInstance):
-                    instances[symObj.name] = symObj
-                elif isinstance(symObj, MibScalar):
-                    scalars[symObj.name] = symObj
+        (
+            scalars,
+            instances,
+            tables,
+            rows,
+            cols,
+            duplicates,
+        ) = self.__classifySymbols(
+            symObj for modName, mibMod in mibSymbols for symObj in mibMod.values()
+        )
 
         # Detach items from each other
         for symName, parentName in self.lastBuildSyms.items():
-            if parentName in scalars:
-                scalars[parentName].unregisterSubtrees(symName)
-            elif parentName in cols:
-                cols[parentName].unregisterSubtrees(symName)
-            elif parentName in rows:
-                rows[parentName].unregisterSubtrees(symName)
+            if parentName in self.__attachedSyms:
+                self.__attachedSyms[parentName].unregisterSubtrees(symName)
             else:
                 mibTree.unregisterSubtrees(symName)
 
         lastBuildSyms = {}
+        attachedSyms = {}
 
         # Attach Managed Objects Instances to Managed Objects
         for inst in instances.values():
@@ -158,6 +300,7 @@ class MibInstrumController(AbstractMibInstrumController):
             else:
                 raise error.SmiError(f"Orphan MIB scalar instance {inst!r} at {self!r}")
             lastBuildSyms[inst.name] = inst.typeName
+            attachedSyms[inst.name] = inst
 
         # Attach Table Columns to Table Rows
         for col in cols.values():
@@ -167,27 +310,31 @@ class MibInstrumController(AbstractMibInstrumController):
             else:
                 raise error.SmiError(f"Orphan MIB table column {col!r} at {self!r}")
             lastBuildSyms[col.name] = rowName
+            attachedSyms[col.name] = col
 
         # Attach Table Rows to MIB tree
         for row in rows.values():
             mibTree.registerSubtrees(row)
             lastBuildSyms[row.name] = mibTree.name
+            attachedSyms[row.name] = row
 
         # Attach Tables to MIB tree
         for table in tables.values():
             mibTree.registerSubtrees(table)
             lastBuildSyms[table.name] = mibTree.name
+            attachedSyms[table.name] = table
 
         # Attach Scalars to MIB tree
         for scalar in scalars.values():
             mibTree.registerSubtrees(scalar)
             lastBuildSyms[scalar.name] = mibTree.name
+            attachedSyms[scalar.name] = scalar
 
         self.lastBuildSyms = lastBuildSyms
+        self.__attachedSyms = attachedSyms
+        self.__shadowedSyms = duplicates
 
-        self.lastBuildId = self.mibBuilder.lastBuildId
-
-        debug.logger & debug.FLAG_INS and debug.logger("__indexMib: rebuilt")
+        debug.logger & debug.FLAG_INS and debug.logger("__rebuildMib: rebuilt")
 
     # MIB instrumentation
 
@@ -257,6 +404,112 @@ class MibInstrumController(AbstractMibInstrumController):
                 del origTraceback
         return outputVarBinds
 
+    async def flipFlopFsmAsync(self, fsmTable, inputVarBinds, acInfo, executor=None):
+        """Run MIB instrumentation FSM awaiting managed objects hooks.
+
+        Same as :meth:`flipFlopFsm` except that managed objects hooks
+        (e.g. `getValue` or `setValue`) may be coroutines. Read states
+        are run for all var-binds concurrently, write states are run
+        one var-bind after another.
+
+        Parameters
+        ----------
+        fsmTable : dict
+            FSM state transitions table.
+        inputVarBinds : list
+            Var-binds to run FSM on.
+        acInfo : tuple
+            Access control function and its context.
+        executor : concurrent.futures.Executor
+            If given, synchronous `getValue` hooks are run in this
+            executor so that slow ones do not block event loop.
+
+        Returns
+        -------
+        list
+            Output var-binds.
+        """
+        self.__indexMib()
+        debug.logger & debug.FLAG_INS and debug.logger(
+            f"flipFlopFsmAsync: input var-binds {inputVarBinds!r}"
+        )
+        (mibTree,) = self.mibBuilder.importSymbols("SNMPv2-SMI", "iso")
+        token = HOOK_EXECUTOR.set(executor)
+        try:
+            return await self.__runFsmAsync(mibTree, fsmTable, inputVarBinds, acInfo)
+        finally:
+            HOOK_EXECUTOR.reset(token)
+
+    async def __runFsmAsync(self, mibTree, fsmTable, inputVarBinds, acInfo):
+        outputVarBinds = []
+        state, status = "start", "ok"
+        origExc = None
+        while True:
+            k = (state, status)
+            if k in fsmTable:
+                fsmState = fsmTable[k]
+            else:
+                k = ("*", status)
+                if k in fsmTable:
+                    fsmState = fsmTable[k]
+                else:
+                    raise error.SmiError(f"Unresolved FSM state {state}, {status}")
+            debug.logger & debug.FLAG_INS and debug.logger(
+                f"flipFlopFsmAsync: state {state} status {status} -> fsmState {fsmState}"
+            )
+            state = fsmState
+            status = "ok"
+            if state == "stop":
+                break
+            f = getattr(mibTree, state, None)
+            if f is None:
+                raise error.SmiError(f"Unsupported state handler {state} at {self}")
+            if state in self.fsmConcurrentStates:
+                rvals = await asyncio.gather(
+                    *[
+                        self.__callStateHandler(f, name, val, idx, acInfo)
+                        for idx, (name, val) in enumerate(inputVarBinds)
+                    ],
+                    return_exceptions=True,
+                )
+            else:
+                rvals = []
+                for idx, (name, val) in enumerate(inputVarBinds):
+                    try:
+                        rvals.append(
+                            await self.__callStateHandler(f, name, val, idx, acInfo)
+                        )
+                    except error.SmiError:
+                        rvals.append(sys.exc_info()[1])
+                        break
+            for (name, val), rval in zip(inputVarBinds, rvals):
+                if isinstance(rval, error.SmiError):
+                    debug.logger & debug.FLAG_INS and debug.logger(
+                        f"flipFlopFsmAsync: fun {f} exception {rval!r} for {name}={val!r}"
+                    )
+                    if origExc is None:  # Take the first exception
+                        origExc = rval
+                    status = "err"
+                    break
+                elif isinstance(rval, BaseException):
+                    raise rval
+                elif rval is not None:
+                    outputVarBinds.append((rval[0], rval[1]))
+        if origExc:
+            raise origExc
+        return outputVarBinds
+
+    @staticmethod
+    async def __callStateHandler(f, name, val, idx, acInfo):
+        # Convert to tuple to avoid ObjectName instantiation
+        # on subscription
+        rval = f(tuple(name), val, idx, acInfo)
+        if inspect.isawaitable(rval):
+            rval = await rval
+        if rval is not None and inspect.isawaitable(rval[1]):
+            rval = rval[0], await rval[1]
+        return rval
+
     def readVars(self, varBinds, acInfo=(None, None)):
         return self.flipFlopFsm(self.fsmReadVar, varBinds, acInfo)
 
@@ -265,3 +518,20 @@ class MibInstrumController(AbstractMibInstrumController):
 
     def writeVars(self, varBinds, acInfo=(None, None)):
         return self.flipFlopFsm(self.fsmWriteVar, varBinds, acInfo)
+
+    async def readVarsAsync(self, varBinds, acInfo=(None, None), executor=None):
+        return await self.flipFlopFsmAsync(self.fsmReadVar, varBinds, acInfo, executor)
+
+    async def readNextVarsAsync(self, varBinds, acInfo=(None, None), executor=None):
+        return await self.flipFlopFsmAsync(
+            self.fsmReadNextVar, varBinds, acInfo, executor
+        )
+
+    async def writeVarsAsync(self, varBinds, acInfo=(None, None), executor=None):
+        # Two-phase commits of concurrent requests must not interleave
+        if self.__writeLock is None:
+            self.__writeLock = asyncio.Lock()
+        async with self.__writeLock:
+            return await self.flipFlopFsmAsync(
+                self.fsmWriteVar, varBinds, acInfo, executor
+            )
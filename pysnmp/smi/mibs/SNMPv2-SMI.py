@@ -4,10 +4,13 @@
 # Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysnmp/license.html
 #
+import asyncio
+import inspect
 import sys
 import traceback
+from collections import deque
 from pysnmp.smi.indices import OidOrderedDict
-from pysnmp.smi import exval, error
+from pysnmp.smi import exval, error, instrum
 from pysnmp.proto import rfc1902
 from pysnmp import cache, debug
 from pyasn1.type import univ
@@ -410,7 +413,7 @@ class MibTree(ObjectType):
     def getNextBranch(self, name, idx=None):
         # Start from the beginning
         if self._vars:
-            first = list(self._vars.keys())[0]
+            first = self._vars.firstKey()
         else:
             first = ()
         if self._vars and name < first:
@@ -556,7 +559,7 @@ class MibTree(ObjectType):
                     raise error.NotWritableError(idx=idx, name=name)
         else:
             node = self.getBranch(name, idx)
-            node.writeTest(name, val, idx, acInfo)
+            return node.writeTest(name, val, idx, acInfo)
 
     def writeCommit(self, name, val, idx, acInfo):
         self.getBranch(name, idx).writeCommit(name, val, idx, acInfo)
@@ -665,7 +668,7 @@ class MibScalar(MibTree):
                 name, self.syntax, idx, "write", acCtx
             ):
                 raise error.NotWritableError(idx=idx, name=name)
-        MibTree.writeTest(self, name, val, idx, acInfo)
+        return MibTree.writeTest(self, name, val, idx, acInfo)
 
 
 class MibScalarInstance(MibTree):
@@ -749,7 +752,13 @@ class MibScalarInstance(MibTree):
             debug.logger & debug.FLAG_INS and debug.logger(
                 f"readGet: {self.name}={self.syntax!r}"
             )
-            return self.name, self.getValue(name, idx)
+            executor = instrum.HOOK_EXECUTOR.get()
+            if executor is None or inspect.iscoroutinefunction(self.getValue):
+                return self.name, self.getValue(name, idx)
+            # Keep slow synchronous hook off the event loop
+            return self.name, asyncio.get_running_loop().run_in_executor(
+                executor, self.getValue, name, idx
+            )
         else:
             raise error.NoSuchInstanceError(idx=idx, name=name)
 
@@ -784,9 +793,24 @@ class MibScalarInstance(MibTree):
                     raise error.WrongValueError(
                         idx=idx, name=name, msg=sys.exc_info()[1]
                     )
+            if inspect.isawaitable(self.__newSyntax):
+                return self.__writeTestAsync(self.__newSyntax, name, idx)
         else:
             raise error.NoSuchInstanceError(idx=idx, name=name)
 
+    # noinspection PyAttributeOutsideInit
+    async def __writeTestAsync(self, newSyntax, name, idx):
+        try:
+            self.__newSyntax = await newSyntax
+        except error.MibOperationError:
+            # SMI exceptions may carry additional content
+            why = sys.exc_info()[1]
+            if "syntax" in why:
+                self.__newSyntax = why["syntax"]
+                raise why
+            else:
+                raise error.WrongValueError(idx=idx, name=name, msg=sys.exc_info()[1])
+
     def writeCommit(self, name, val, idx, acInfo):
         # Backup original value
         if self.__oldSyntax is None:
@@ -1073,10 +1097,13 @@ class MibTableRow(MibTree):
     Implements row creation/destruction.
     """
 
+    CHANGES_JOURNAL_SIZE = 1024
+
     def __init__(self, name):
         MibTree.__init__(self, name)
         self.__idToIdxCache = cache.Cache()
         self.__idxToIdCache = cache.Cache()
+        self.__changes = deque(maxlen=self.CHANGES_JOURNAL_SIZE)
         self.indexNames = ()
         self.augmentingRows = {}
 
@@ -1305,11 +1332,34 @@ class MibTableRow(MibTree):
 
     def writeCleanup(self, name, val, idx, acInfo):
         self.branchVersionId += 1
+        self.__changes.append((self.branchVersionId, name[len(self.name) + 1 :]))
         self.__delegate("Cleanup", name, val, idx, acInfo)
 
     def writeUndo(self, name, val, idx, acInfo):
         self.__delegate("Undo", name, val, idx, acInfo)
 
+    def getChangedRowsSince(self, versionId):
+        """Return instance IDs of rows modified after `versionId`.
+
+        Returns a set of row instance identifiers or `None` if the journal
+        does not reach that far back or the table has been changed other
+        than by writing its rows, so the caller should drop everything it
+        derived from this table.
+        """
+        changedRows = set()
+
+        changeCount = 0
+        for changeId, instId in reversed(self.__changes):
+            if changeId <= versionId:
+                break
+            changedRows.add(instId)
+            changeCount += 1
+
+        if changeCount != self.branchVersionId - versionId:
+            return None
+
+        return changedRows
+
     # Table row management
 
     # Table row access by instance name
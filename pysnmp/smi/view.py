@@ -4,7 +4,10 @@
 # Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysnmp/license.html
 #
+import os
+import pickle
 import sys
+import tempfile
 from pysnmp.smi.indices import OrderedDict, OidOrderedDict
 from pysnmp.smi import error
 from pysnmp import debug
@@ -15,11 +18,22 @@ classTypes = (type,)
 instanceTypes = (object,)
 
 
+def _getFingerprint(path):
+    try:
+        st = os.stat(path)
+
+    except OSError:
+        return None
+
+    return st.st_mtime_ns, st.st_size
+
+
 class MibViewController:
     def __init__(self, mibBuilder):
         self.mibBuilder = mibBuilder
         self.lastBuildId = -1
         self.__mibSymbolsIdx = OrderedDict()
+        self.__snapshotModules = None
 
     # Indexing part
 
@@ -27,6 +41,19 @@ class MibViewController:
         if self.lastBuildId == self.mibBuilder.lastBuildId:
             return
 
+        if self.__snapshotModules is not None:
+            if self.__isIndexed(self.mibBuilder.getChangesSince(self.lastBuildId)):
+                self.lastBuildId = self.mibBuilder.lastBuildId
+                return
+
+            debug.logger & debug.FLAG_MIB and debug.logger(
+                "indexMib: MIB view snapshot outdated, loading snapshot MIB modules"
+            )
+
+            snapshotModules, self.__snapshotModules = self.__snapshotModules, None
+
+            self.mibBuilder.loadModules(*snapshotModules)
+
         debug.logger & debug.FLAG_MIB and debug.logger("indexMib: re-indexing MIB view")
 
         (MibScalarInstance,) = self.mibBuilder.importSymbols(
@@ -108,7 +135,7 @@ class MibViewController:
         labelToOidIdx = self.__mibSymbolsIdx[""]["labelToOidIdx"]
         prevOid = ()
         baseLabel = ()
-        for key in oidToLabelIdx.keys():
+        for key in oidToLabelIdx:
             keydiff = len(key) - len(prevOid)
             if keydiff > 0:
                 if prevOid:
@@ -138,19 +165,168 @@ class MibViewController:
 
         # Build module-scope oid->long-label index
         for mibMod in self.__mibSymbolsIdx.values():
-            for oid in mibMod["oidToLabelIdx"].keys():
+            for oid in mibMod["oidToLabelIdx"]:
                 mibMod["oidToLabelIdx"][oid] = oidToLabelIdx[oid]
                 mibMod["labelToOidIdx"][oidToLabelIdx[oid]] = oid
 
         self.lastBuildId = self.mibBuilder.lastBuildId
 
+    def __isIndexed(self, changes):
+        # symbols exported by lazily loaded snapshot modules are indexed already
+        if changes is None:
+            return False
+
+        for modName in self.mibBuilder.mibSymbols:
+            if modName not in self.__mibSymbolsIdx:
+                return False
+
+        (MibScalarInstance,) = self.mibBuilder.importSymbols(
+            "SNMPv2-SMI", "MibScalarInstance"
+        )
+
+        oidToModIdx = self.__mibSymbolsIdx[""]["oidToModIdx"]
+
+        for addedSyms, removedSyms in changes:
+            if removedSyms:
+                return False
+
+            for symObj in addedSyms:
+                if isinstance(symObj, classTypes) or isinstance(
+                    symObj, MibScalarInstance
+                ):
+                    continue
+
+                if getattr(symObj, "name", None) not in oidToModIdx:
+                    return False
+
+        return True
+
+    # Snapshot management
+
+    def saveSnapshot(self, path):
+        """Store MIB view indices into a file.
+
+        The snapshot holds the indices of all MIB modules loaded into
+        MIB builder along with the list of these modules. A
+        :py:meth:`loadSnapshot` in another process makes the MIB view
+        usable without loading and indexing these MIB modules.
+
+        Parameters
+        ----------
+        path : str
+            File to store the snapshot in.
+        """
+        self.indexMib()
+
+        snapshot = {
+            "version": self.mibBuilder.version,
+            "sources": [x.fullPath() for x in self.mibBuilder.getMibSources()],
+            "modules": {
+                modName: (modPath, _getFingerprint(modPath))
+                for modName, modPath in self.mibBuilder.getLoadedModules().items()
+            },
+            "index": self.__mibSymbolsIdx,
+        }
+
+        fd, tmpPath = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                pickle.dump(snapshot, fp, pickle.HIGHEST_PROTOCOL)
+
+            os.replace(tmpPath, path)
+
+        except OSError:
+            os.unlink(tmpPath)
+            raise error.SmiError(
+                f"MIB view snapshot {path} write error: {sys.exc_info()[1]}"
+            )
+
+        debug.logger & debug.FLAG_MIB and debug.logger(
+            f"saveSnapshot: stored {len(snapshot['modules'])} MIB modules at {path}"
+        )
+
+    def loadSnapshot(self, path):
+        """Restore MIB view indices from a file.
+
+        Snapshot is only restored if it has been taken with the same MIB
+        sources and none of its MIB modules files changed since. MIB
+        modules are then loaded into MIB builder only once their
+        objects are requested.
+
+        Snapshot files are unpickled, they should only be read from
+        trusted locations.
+
+        Parameters
+        ----------
+        path : str
+            File to restore the snapshot from.
+
+        Returns
+        -------
+        bool
+            `True` if MIB view has been restored from the snapshot,
+            `False` if snapshot is missing or outdated.
+        """
+        try:
+            with open(path, "rb") as fp:
+                snapshot = pickle.load(fp)
+
+            version = snapshot["version"]
+            sources = snapshot["sources"]
+            modules = snapshot["modules"]
+            mibSymbolsIdx = snapshot["index"]
+
+        except Exception:
+            debug.logger & debug.FLAG_MIB and debug.logger(
+                f"loadSnapshot: could not read {path}: {sys.exc_info()[1]}"
+            )
+            return False
+
+        if version != self.mibBuilder.version or sources != [
+            x.fullPath() for x in self.mibBuilder.getMibSources()
+        ]:
+            debug.logger & debug.FLAG_MIB and debug.logger(
+                f"loadSnapshot: {path} taken with other MIB sources or version"
+            )
+            return False
+
+        for modName, (modPath, fingerprint) in modules.items():
+            if _getFingerprint(modPath) != fingerprint:
+                debug.logger & debug.FLAG_MIB and debug.logger(
+                    f"loadSnapshot: MIB module {modPath} changed since {path}"
+                )
+                return False
+
+        # indexed modules must be loadable or loaded, loaded ones indexed
+        for modName in mibSymbolsIdx:
+            if (
+                modName
+                and modName not in modules
+                and modName not in self.mibBuilder.mibSymbols
+            ):
+                return False
+
+        for modName in self.mibBuilder.mibSymbols:
+            if modName not in mibSymbolsIdx:
+                return False
+
+        self.__mibSymbolsIdx = mibSymbolsIdx
+        self.__snapshotModules = list(modules)
+        self.lastBuildId = self.mibBuilder.lastBuildId
+
+        debug.logger & debug.FLAG_MIB and debug.logger(
+            f"loadSnapshot: restored {len(modules)} MIB modules from {path}"
+        )
+
+        return True
+
     # Module management
 
     def getOrderedModuleName(self, index):
         self.indexMib()
-        modNames = self.__mibSymbolsIdx.keys()
-        if modNames:
-            return modNames[index]
+        if self.__mibSymbolsIdx:
+            return self.__mibSymbolsIdx.keyAt(index)
         raise error.SmiError("No modules loaded at %s" % self)
 
     def getFirstModuleName(self):
@@ -248,8 +424,9 @@ class MibViewController:
                 str=f"No variables at MIB module {modName} at {self}"
             )
         try:
-            oid, label = mibMod["oidToLabelIdx"].items()[index]
-        except KeyError:
+            oid = mibMod["oidToLabelIdx"].keyAt(index)
+            label = mibMod["oidToLabelIdx"][oid]
+        except (KeyError, IndexError):
             raise error.NoSuchObjectError(
                 str=f"No symbol at position {index} in MIB module {modName} at {self}"
             )
@@ -311,7 +488,7 @@ class MibViewController:
             raise error.NoSuchObjectError(
                 str=f"No types at MIB module {modName} at {self}"
             )
-        t = mibMod["typeToModIdx"].keys()[index]
+        t = mibMod["typeToModIdx"].keyAt(index)
         return mibMod["typeToModIdx"][t], t
 
     def getFirstTypeName(self, modName=""):
@@ -0,0 +1,42 @@
+import pytest
+from pysnmp.carrier.asyncio.dgram import udp
+from pysnmp.carrier.asyncio.dispatch import AsyncioDispatcher
+
+import asyncio
+import socket
+
+
+@pytest.mark.asyncio
+async def test_batched_receive_and_send():
+    received = []
+
+    def cbFun(dispatcher, transportDomain, transportAddress, wholeMsg):
+        received.append(wholeMsg)
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    serverAddress = sock.getsockname()
+
+    dispatcher = AsyncioDispatcher()
+    dispatcher.registerRecvCbFun(cbFun)
+    dispatcher.registerTransport(
+        udp.DOMAIN_NAME,
+        udp.UdpAsyncioTransport(batchSize=16).openServerMode(sock=sock),
+    )
+
+    client = udp.UdpAsyncioTransport(batchSize=16).openClientMode()
+    dispatcher.registerTransport(udp.DOMAIN_NAME + (1,), client)
+
+    await asyncio.sleep(0.1)
+
+    for idx in range(100):
+        client.sendMessage(b"msg%d" % idx, serverAddress)
+
+    for _ in range(50):
+        if len(received) == 100:
+            break
+        await asyncio.sleep(0.02)
+
+    dispatcher.closeDispatcher()
+
+    assert sorted(received) == sorted(b"msg%d" % idx for idx in range(100))
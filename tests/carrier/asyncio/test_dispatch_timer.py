@@ -0,0 +1,34 @@
+import pytest
+from pysnmp.carrier.asyncio.dispatch import AsyncioDispatcher
+
+import asyncio
+
+
+@pytest.mark.asyncio
+async def test_timer_call_fires_at_deadline():
+    dispatcher = AsyncioDispatcher()
+    loop = asyncio.get_event_loop()
+    fired = []
+
+    start = loop.time()
+    dispatcher.scheduleTimerCall(0.05, lambda x: fired.append((x, loop.time())), 1)
+    cancelled = dispatcher.scheduleTimerCall(0.05, fired.append, 2)
+    cancelled.cancel()
+
+    await asyncio.sleep(0.2)
+
+    assert [x for x, _ in fired] == [1]
+    assert fired[0][1] - start < 0.15
+
+
+@pytest.mark.asyncio
+async def test_timer_calls_cancelled_on_close():
+    dispatcher = AsyncioDispatcher()
+    fired = []
+
+    dispatcher.scheduleTimerCall(0.05, fired.append, 1)
+    dispatcher.closeDispatcher()
+
+    await asyncio.sleep(0.1)
+
+    assert not fired
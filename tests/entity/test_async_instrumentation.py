@@ -0,0 +1,174 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pysnmp.hlapi.asyncio import *
+from pysnmp.carrier.asyncio.dgram import udp
+from pysnmp.entity import config, engine
+from pysnmp.entity.rfc3413 import cmdrsp, context
+from pysnmp.proto.api import v2c
+
+AGENT_PORT = 1613
+
+
+async def _startAgent(executor=None, timeout=None):
+    snmpEngine = engine.SnmpEngine()
+
+    config.addTransport(
+        snmpEngine,
+        udp.DOMAIN_NAME,
+        udp.UdpTransport().openServerMode(("localhost", AGENT_PORT)),
+    )
+    config.addV1System(snmpEngine, "public", "public")
+    config.addVacmUser(snmpEngine, 2, "public", "noAuthNoPriv", (1, 3, 6), (1, 3, 6))
+
+    snmpContext = context.SnmpContext(snmpEngine)
+
+    mibBuilder = snmpContext.getMibInstrum().getMibBuilder()
+
+    MibScalar, MibScalarInstance = mibBuilder.importSymbols(
+        "SNMPv2-SMI", "MibScalar", "MibScalarInstance"
+    )
+
+    class AsyncMibScalarInstance(MibScalarInstance):
+        async def getValue(self, name, idx):
+            await asyncio.sleep(0.5)
+            return self.getSyntax().clone("async value")
+
+        async def setValue(self, value, name, idx):
+            await asyncio.sleep(0.2)
+            return self.getSyntax().clone(value)
+
+    class SlowMibScalarInstance(MibScalarInstance):
+        def getValue(self, name, idx):
+            time.sleep(0.5)
+            return self.getSyntax().clone("sync value")
+
+    mibBuilder.exportSymbols(
+        "__ASYNC_MIB",
+        MibScalar((1, 3, 6, 1, 4, 1, 60069, 10, 1), v2c.OctetString()).setMaxAccess(
+            "read-write"
+        ),
+        AsyncMibScalarInstance(
+            (1, 3, 6, 1, 4, 1, 60069, 10, 1), (0,), v2c.OctetString()
+        ),
+        MibScalar((1, 3, 6, 1, 4, 1, 60069, 10, 2), v2c.OctetString()),
+        SlowMibScalarInstance(
+            (1, 3, 6, 1, 4, 1, 60069, 10, 2), (0,), v2c.OctetString()
+        ),
+    )
+
+    for responderClass in (
+        cmdrsp.GetCommandResponder,
+        cmdrsp.NextCommandResponder,
+        cmdrsp.SetCommandResponder,
+    ):
+        responder = responderClass(snmpEngine, snmpContext)
+        responder.asyncInstrumentation = True
+        responder.instrumentationExecutor = executor
+        responder.instrumentationTimeout = timeout
+
+    snmpEngine.transportDispatcher.jobStarted(1)
+    snmpEngine.openDispatcher()
+
+    # Wait for the agent to start
+    await asyncio.sleep(0.5)
+
+    return snmpEngine
+
+
+async def _get(snmpEngine, *names):
+    return await getCmd(
+        snmpEngine,
+        CommunityData("public"),
+        UdpTransportTarget(("localhost", AGENT_PORT), timeout=3, retries=0),
+        ContextData(),
+        *[ObjectType(ObjectIdentity(name)) for name in names],
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_hooks_do_not_block_agent():
+    executor = ThreadPoolExecutor()
+    agent = await _startAgent(executor=executor)
+    snmpEngine = SnmpEngine()
+
+    try:
+        completed = []
+
+        async def get(*names):
+            result = await _get(snmpEngine, *names)
+            completed.append(names)
+            return result
+
+        slow, fast = await asyncio.gather(
+            get("1.3.6.1.4.1.60069.10.1.0", "1.3.6.1.4.1.60069.10.2.0"),
+            get("1.3.6.1.2.1.1.1.0"),
+        )
+
+        # fast request is not held up by slow managed objects
+        assert completed[0] == ("1.3.6.1.2.1.1.1.0",)
+
+        errorIndication, errorStatus, errorIndex, varBinds = slow
+        assert errorIndication is None
+        assert errorStatus == 0
+        assert varBinds[0][1] == b"async value"
+        assert varBinds[1][1] == b"sync value"
+
+        errorIndication, errorStatus, errorIndex, varBinds = fast
+        assert errorIndication is None
+        assert varBinds[0][1].prettyPrint().startswith("PySNMP engine version")
+
+        errorIndication, errorStatus, errorIndex, varBinds = await setCmd(
+            snmpEngine,
+            CommunityData("public"),
+            UdpTransportTarget(("localhost", AGENT_PORT), timeout=3, retries=0),
+            ContextData(),
+            ObjectType(
+                ObjectIdentity("1.3.6.1.4.1.60069.10.1.0"), OctetString("new value")
+            ),
+        )
+
+        assert errorIndication is None
+        assert errorStatus == 0
+
+    finally:
+        snmpEngine.closeDispatcher()
+        agent.transportDispatcher.jobFinished(1)
+        agent.closeDispatcher()
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_async_hooks_timeout():
+    agent = await _startAgent(timeout=0.1)
+    snmpEngine = SnmpEngine()
+
+    try:
+        errorIndication, errorStatus, errorIndex, varBinds = await _get(
+            snmpEngine, "1.3.6.1.4.1.60069.10.1.0"
+        )
+
+        assert errorIndication is None
+        assert errorStatus.prettyPrint() == "genErr"
+
+        # write requests run to completion
+        errorIndication, errorStatus, errorIndex, varBinds = await setCmd(
+            snmpEngine,
+            CommunityData("public"),
+            UdpTransportTarget(("localhost", AGENT_PORT), timeout=3, retries=0),
+            ContextData(),
+            ObjectType(
+                ObjectIdentity("1.3.6.1.4.1.60069.10.1.0"), OctetString("new value")
+            ),
+        )
+
+        assert errorIndication is None
+        assert errorStatus == 0
+
+    finally:
+        snmpEngine.closeDispatcher()
+        agent.transportDispatcher.jobFinished(1)
+        agent.closeDispatcher()
@@ -0,0 +1,70 @@
+import pytest
+
+from pysnmp.entity.discovery import JsonEngineDiscoveryStore, SqliteEngineDiscoveryStore
+from pysnmp.hlapi.asyncio import *
+from tests.agent_context import AGENT_PORT, AgentContextManager
+
+
+async def getSysDescr(snmpEngine):
+    reports = []
+
+    def storeReport(snmpEngine, execpoint, variables, cbCtx):
+        reports.append(variables["pdu"])
+
+    snmpEngine.observer.registerObserver(
+        storeReport, "rfc3412.prepareDataElements:internal"
+    )
+
+    errorIndication, errorStatus, errorIndex, varBinds = await getCmd(
+        snmpEngine,
+        UsmUserData(
+            "usr-sha-aes",
+            "authkey1",
+            "privkey1",
+            authProtocol=USM_AUTH_HMAC96_SHA,
+            privProtocol=USM_PRIV_CFB128_AES,
+        ),
+        UdpTransportTarget(("localhost", AGENT_PORT)),
+        ContextData(),
+        ObjectType(ObjectIdentity("SNMPv2-MIB", "sysDescr", 0)),
+    )
+
+    assert errorIndication is None
+    assert errorStatus == 0
+    assert varBinds[0][1].prettyPrint().startswith("PySNMP engine version")
+
+    snmpEngine.observer.unregisterObserver("rfc3412.prepareDataElements:internal")
+
+    return reports
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "storeClass,fileName",
+    [
+        (JsonEngineDiscoveryStore, "engines.json"),
+        (SqliteEngineDiscoveryStore, "engines.db"),
+    ],
+)
+async def test_engine_discovery_store(tmp_path, storeClass, fileName):
+    path = str(tmp_path / fileName)
+
+    async with AgentContextManager():
+        snmpEngine = SnmpEngine(engineDiscoveryStore=storeClass(path))
+
+        # engine ID discovery and time synchronization
+        assert await getSysDescr(snmpEngine)
+
+        snmpEngine.closeDispatcher()
+
+        (record,) = storeClass(path).readRecords()
+        assert record["transportAddress"] == ("127.0.0.1", AGENT_PORT)
+        assert record["securityEngineId"]
+        assert record["snmpEngineBoots"] is not None
+
+        # restarted engine talks to the agent right away
+        snmpEngine = SnmpEngine(engineDiscoveryStore=storeClass(path))
+
+        assert not await getSysDescr(snmpEngine)
+
+        snmpEngine.closeDispatcher()
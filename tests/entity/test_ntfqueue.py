@@ -0,0 +1,111 @@
+import socket
+
+import pytest
+
+from pysnmp.carrier.asyncio.dgram import udp
+from pysnmp.entity import config, engine
+from pysnmp.entity.rfc3413 import ntfrcv
+from pysnmp.hlapi.asyncio import *
+
+import asyncio
+
+
+def makeNotifications(snmpEngine, ntfQueue, count):
+    for idx in range(count):
+        ntfQueue.put(
+            snmpEngine, None, b"", b"", [((1, 3, 6, 1, 2, 1, 1, 3, 0), idx)], None
+        )
+
+
+@pytest.mark.asyncio
+async def test_notification_queue_overflow():
+    snmpEngine = engine.SnmpEngine()
+
+    ntfQueue = ntfrcv.NotificationQueue(maxSize=4, batchSize=3, batchTimeout=0)
+    makeNotifications(snmpEngine, ntfQueue, 6)
+
+    assert len(ntfQueue) == 4
+    batch = await ntfQueue.getBatch()
+    assert [varBinds[0][1] for _, _, _, _, varBinds in batch] == [0, 1, 2]
+
+    ntfQueue = ntfrcv.NotificationQueue(
+        maxSize=4, batchSize=4, batchTimeout=0, overflowPolicy="oldest"
+    )
+    makeNotifications(snmpEngine, ntfQueue, 6)
+
+    batch = await ntfQueue.getBatch()
+    assert [varBinds[0][1] for _, _, _, _, varBinds in batch] == [2, 3, 4, 5]
+
+    ntfQueue = ntfrcv.NotificationQueue(
+        maxSize=4, batchSize=4, batchTimeout=0, overflowPolicy="sample", sampleRate=3
+    )
+    makeNotifications(snmpEngine, ntfQueue, 10)
+
+    batch = await ntfQueue.getBatch()
+    assert [varBinds[0][1] for _, _, _, _, varBinds in batch] == [2, 3, 6, 9]
+
+    statistics = ntfQueue.getStatistics()
+    assert statistics["depth"] == 0
+    assert statistics["received"] == 10
+    assert statistics["delivered"] == 4
+    assert statistics["dropped"] == 6
+
+
+@pytest.mark.asyncio
+async def test_notification_queue_batches():
+    snmpEngine = engine.SnmpEngine()
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    receiverPort = sock.getsockname()[1]
+
+    config.addTransport(
+        snmpEngine, udp.DOMAIN_NAME, udp.UdpTransport().openServerMode(sock=sock)
+    )
+    config.addV1System(snmpEngine, "public", "public")
+
+    ntfQueue = ntfrcv.NotificationQueue(batchSize=3, batchTimeout=0.5)
+    ntfrcv.NotificationReceiver(snmpEngine, ntfQueue.put)
+
+    snmpEngine.transportDispatcher.jobStarted(1)
+    snmpEngine.openDispatcher()
+
+    agentEngine = SnmpEngine()
+
+    for idx in range(4):
+        errorIndication, errorStatus, errorIndex, varBinds = await sendNotification(
+            agentEngine,
+            CommunityData("public"),
+            UdpTransportTarget(("127.0.0.1", receiverPort)),
+            ContextData(),
+            "trap",
+            NotificationType(ObjectIdentity("1.3.6.1.6.3.1.1.5.2")).addVarBinds(
+                ("1.3.6.1.2.1.1.1.0", OctetString("my system %d" % idx))
+            ),
+        )
+        assert errorIndication is None
+
+    # full batch goes out at once, the rest when batch timeout expires
+    batches = [
+        await asyncio.wait_for(ntfQueue.getBatch(), 5),
+        await asyncio.wait_for(ntfQueue.getBatch(), 5),
+    ]
+    assert [len(batch) for batch in batches] == [3, 1]
+
+    transportDomain, transportAddress, contextEngineId, contextName, varBinds = batches[
+        0
+    ][0]
+    assert transportDomain == udp.DOMAIN_NAME
+    assert transportAddress[0] == "127.0.0.1"
+    assert varBinds[-1][1] == OctetString("my system 0")
+
+    ntfQueue.close()
+    assert [batch async for batch in ntfQueue] == []
+
+    statistics = ntfQueue.getStatistics()
+    assert statistics["received"] == statistics["delivered"] == 4
+    assert 0 < statistics["maxLatency"] < 5
+
+    agentEngine.closeDispatcher()
+    snmpEngine.transportDispatcher.jobFinished(1)
+    snmpEngine.closeDispatcher()
@@ -0,0 +1,42 @@
+from pysnmp.entity.observer import MetaObserver
+
+
+def test_lazy_execution_context():
+    observer = MetaObserver()
+    calls = []
+
+    def variables():
+        calls.append(None)
+        return dict(pdu="pdu")
+
+    observer.storeExecutionContext(None, "test.execpoint", variables)
+
+    assert not calls
+
+    assert observer.getExecutionContext("test.execpoint") == dict(pdu="pdu")
+    assert observer.getExecutionContext("test.execpoint") == dict(pdu="pdu")
+    assert len(calls) == 1
+
+    observer.clearExecutionContext(None, "test.execpoint")
+
+
+def test_observed_execution_context():
+    observer = MetaObserver()
+    observed = []
+
+    def cbFun(snmpEngine, execpoint, variables, cbCtx):
+        observed.append((execpoint, variables, cbCtx))
+
+    observer.registerObserver(cbFun, "test.execpoint", cbCtx="ctx")
+
+    observer.storeExecutionContext(None, "test.execpoint", lambda: dict(pdu="pdu"))
+    observer.clearExecutionContext(None, "test.execpoint")
+
+    assert observed == [("test.execpoint", dict(pdu="pdu"), "ctx")]
+
+    observer.unregisterObserver(cbFun)
+
+    observer.storeExecutionContext(None, "test.execpoint", lambda: dict(pdu="other"))
+    observer.clearExecutionContext(None, "test.execpoint")
+
+    assert len(observed) == 1
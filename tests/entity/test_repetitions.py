@@ -0,0 +1,122 @@
+import pytest
+
+from pysnmp.entity.rfc3413.repetitions import RepetitionsEstimator
+from pysnmp.error import PySnmpError
+from pysnmp.hlapi.asyncio import *
+from pysnmp.proto.api import v2c
+from tests.agent_context import AGENT_PORT, AgentContextManager
+
+
+def makePDUs(maxRepetitions, rows, errorStatus=0):
+    reqPDU = v2c.GetBulkRequestPDU()
+    v2c.apiBulkPDU.setDefaults(reqPDU)
+    v2c.apiBulkPDU.setMaxRepetitions(reqPDU, maxRepetitions)
+    v2c.apiBulkPDU.setVarBinds(reqPDU, [((1, 3, 6, 1, 2, 1, 2, 2, 1, 2), v2c.null)])
+
+    rspPDU = v2c.ResponsePDU()
+    v2c.apiPDU.setDefaults(rspPDU)
+    v2c.apiPDU.setErrorStatus(rspPDU, errorStatus)
+    v2c.apiPDU.setVarBinds(
+        rspPDU,
+        [
+            ((1, 3, 6, 1, 2, 1, 2, 2, 1, 2, idx), v2c.OctetString("x" * 80))
+            for idx in range(rows)
+        ],
+    )
+
+    return reqPDU, rspPDU
+
+
+def test_repetitions_estimates():
+    repetitionsEstimator = RepetitionsEstimator(maxMessageSize=1452)
+    peer = ((1, 3, 6, 1, 6, 1, 1), ("127.0.0.1", 161))
+
+    assert repetitionsEstimator.getMaxRepetitions(peer, 4) == 4
+
+    # full response grows repetitions
+    repetitionsEstimator.addResponse(peer, *makePDUs(4, 4))
+    assert repetitionsEstimator.getMaxRepetitions(peer, 4) == 8
+
+    # growth stops at what fits into a message
+    for _ in range(5):
+        maxRepetitions = repetitionsEstimator.getMaxRepetitions(peer, 4)
+        repetitionsEstimator.addResponse(
+            peer, *makePDUs(maxRepetitions, maxRepetitions)
+        )
+
+    repetitions, limit, rowSize, samples = repetitionsEstimator.getPeerInfo(peer)
+    assert repetitions * rowSize <= 1452 - RepetitionsEstimator.HEADROOM
+    assert (repetitions + 1) * rowSize > 1452 - RepetitionsEstimator.HEADROOM
+    assert samples == 6
+
+    # truncated response caps repetitions
+    repetitionsEstimator.addResponse(peer, *makePDUs(repetitions, 5))
+    assert repetitionsEstimator.getPeerInfo(peer)[:2] == (5, 5)
+
+    # tooBig halves repetitions
+    repetitionsEstimator.addResponse(peer, *makePDUs(5, 0, errorStatus=1))
+    assert repetitionsEstimator.getMaxRepetitions(peer, 4) == 2
+
+    assert repetitionsEstimator.getPeers() == [peer]
+    repetitionsEstimator.forgetPeer(peer)
+
+    with pytest.raises(PySnmpError):
+        repetitionsEstimator.getPeerInfo(peer)
+
+
+def test_repetitions_latency():
+    repetitionsEstimator = RepetitionsEstimator(maxLatency=0.5)
+    peer = ((1, 3, 6, 1, 6, 1, 1), ("127.0.0.1", 161))
+
+    repetitionsEstimator.addResponse(peer, *makePDUs(8, 8), rtt=1)
+    assert repetitionsEstimator.getMaxRepetitions(peer, 8) == 4
+
+
+def test_repetitions_probing():
+    repetitionsEstimator = RepetitionsEstimator(probeInterval=4)
+    peer = ((1, 3, 6, 1, 6, 1, 1), ("127.0.0.1", 161))
+
+    # transient truncation caps repetitions
+    repetitionsEstimator.addResponse(peer, *makePDUs(8, 2), messageSize=300)
+    assert repetitionsEstimator.getPeerInfo(peer)[:3] == (2, 2, 150)
+
+    for _ in range(4):
+        maxRepetitions = repetitionsEstimator.getMaxRepetitions(peer, 8)
+        repetitionsEstimator.addResponse(
+            peer, *makePDUs(maxRepetitions, maxRepetitions)
+        )
+
+    # cap lifted after enough full responses
+    repetitions, limit, rowSize, samples = repetitionsEstimator.getPeerInfo(peer)
+    assert limit == 4
+    assert repetitions == 4
+
+
+@pytest.mark.asyncio
+async def test_learned_repetitions():
+    async with AgentContextManager():
+        snmpEngine = SnmpEngine()
+        repetitionsEstimator = RepetitionsEstimator(maxMessageSize=65000)
+        snmpEngine.setUserContext(repetitionsEstimator=repetitionsEstimator)
+
+        errorIndication, errorStatus, errorIndex, varBindTable = await bulkCmd(
+            snmpEngine,
+            CommunityData("public"),
+            UdpTransportTarget(("localhost", AGENT_PORT)),
+            ContextData(),
+            0,
+            100,
+            ObjectType(ObjectIdentity("SNMPv2-MIB", "sysDescr")),
+        )
+
+        assert errorIndication is None
+        assert errorStatus == 0
+
+        (peer,) = repetitionsEstimator.getPeers()
+        assert peer[1] == ("127.0.0.1", AGENT_PORT)
+
+        # agent returns at most 64 variable-bindings
+        assert len(varBindTable) == 64
+        assert repetitionsEstimator.getPeerInfo(peer)[:2] == (64, 64)
+
+        snmpEngine.closeDispatcher()
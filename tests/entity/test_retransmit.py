@@ -0,0 +1,45 @@
+import pytest
+
+from pysnmp.hlapi.asyncio import *
+from pysnmp.proto import errind
+from tests.agent_context import AGENT_PORT
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mpModel", [0, 1])
+async def test_timed_out_request_resent_verbatim(mpModel):
+    snmpEngine = SnmpEngine()
+    mpHandler = snmpEngine.messageProcessingSubsystems[mpModel]
+
+    prepared = []
+    prepareOutgoingMessage = mpHandler.prepareOutgoingMessage
+
+    def countingPrepareOutgoingMessage(*args):
+        prepared.append(args)
+        return prepareOutgoingMessage(*args)
+
+    mpHandler.prepareOutgoingMessage = countingPrepareOutgoingMessage
+
+    sentMessages = []
+
+    def collectSentMessage(snmpEngine, execpoint, variables, cbCtx):
+        sentMessages.append(variables["outgoingMessage"])
+
+    snmpEngine.observer.registerObserver(collectSentMessage, "rfc3412.sendPdu")
+
+    # nothing listens there
+    errorIndication, errorStatus, errorIndex, varBinds = await getCmd(
+        snmpEngine,
+        CommunityData("public", mpModel=mpModel),
+        UdpTransportTarget(("localhost", AGENT_PORT + 1), timeout=0.1, retries=2),
+        ContextData(),
+        ObjectType(ObjectIdentity("SNMPv2-MIB", "sysDescr", 0)),
+    )
+
+    assert isinstance(errorIndication, errind.RequestTimedOut)
+
+    assert len(prepared) == 1
+    assert len(sentMessages) == 3
+    assert sentMessages[0] == sentMessages[1] == sentMessages[2]
+
+    snmpEngine.closeDispatcher()
@@ -0,0 +1,106 @@
+import pytest
+
+from pysnmp.entity.rfc3413 import rtt
+from pysnmp.entity.rfc3413.rtt import RttEstimator
+from pysnmp.error import PySnmpError
+from pysnmp.hlapi.asyncio import *
+from pysnmp.proto import errind
+from tests.agent_context import AGENT_PORT, AgentContextManager
+
+
+def test_rtt_estimates(monkeypatch):
+    now = 0
+
+    monkeypatch.setattr(rtt.time, "monotonic", lambda: now)
+
+    rttEstimator = RttEstimator(minTimeout=0.01, maxTimeout=10, jitter=0)
+    peer = ((1, 3, 6, 1, 6, 1, 1), ("127.0.0.1", 161))
+
+    assert rttEstimator.getTimeout(peer, 1) == 1
+
+    rttEstimator.addSample(peer, 0.1)
+    assert rttEstimator.getPeerInfo(peer) == (0.1, 0.05, pytest.approx(0.3), 1)
+    assert rttEstimator.getTimeout(peer, 1) == pytest.approx(0.3)
+
+    rttEstimator.addSample(peer, 0.1)
+    srtt, rttvar, rto, samples = rttEstimator.getPeerInfo(peer)
+    assert srtt == pytest.approx(0.1)
+    assert rttvar == pytest.approx(0.0375)
+    assert rto == pytest.approx(0.25)
+    assert samples == 2
+
+    rttEstimator.backoff(peer, 1)
+    assert rttEstimator.getTimeout(peer, 1) == pytest.approx(0.5)
+
+    # concurrent requests timing out back off only once
+    rttEstimator.backoff(peer, 1)
+    assert rttEstimator.getTimeout(peer, 1) == pytest.approx(0.5)
+
+    now += 0.25
+    rttEstimator.backoff(peer, 1)
+    assert rttEstimator.getTimeout(peer, 1) == pytest.approx(1)
+
+    # next sample resets backed off RTO
+    rttEstimator.addSample(peer, 0.1)
+    assert rttEstimator.getTimeout(peer, 1) < 0.25
+
+    for _ in range(10):
+        now += 10
+        rttEstimator.backoff(peer, 1)
+    assert rttEstimator.getTimeout(peer, 1) == 10
+
+    assert rttEstimator.getPeers() == [peer]
+    rttEstimator.forgetPeer(peer)
+
+    with pytest.raises(PySnmpError):
+        rttEstimator.getPeerInfo(peer)
+
+
+def test_rtt_peers_bound():
+    rttEstimator = RttEstimator(maxPeers=2)
+
+    for port in range(3):
+        rttEstimator.addSample(((1, 3, 6, 1, 6, 1, 1), ("127.0.0.1", port)), 0.1)
+
+    assert [peer[1][1] for peer in rttEstimator.getPeers()] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_adaptive_timeout():
+    async with AgentContextManager():
+        snmpEngine = SnmpEngine()
+        rttEstimator = RttEstimator(jitter=0)
+        snmpEngine.setUserContext(rttEstimator=rttEstimator)
+
+        errorIndication, errorStatus, errorIndex, varBinds = await getCmd(
+            snmpEngine,
+            CommunityData("public"),
+            UdpTransportTarget(("localhost", AGENT_PORT)),
+            ContextData(),
+            ObjectType(ObjectIdentity("SNMPv2-MIB", "sysDescr", 0)),
+        )
+
+        assert errorIndication is None
+
+        (peer,) = rttEstimator.getPeers()
+        assert peer[1] == ("127.0.0.1", AGENT_PORT)
+
+        srtt, rttvar, rto, samples = rttEstimator.getPeerInfo(peer)
+        assert 0 < srtt < 1
+        assert samples == 1
+
+        # nothing listens there, retries are backed off
+        errorIndication, errorStatus, errorIndex, varBinds = await getCmd(
+            snmpEngine,
+            CommunityData("public"),
+            UdpTransportTarget(("localhost", AGENT_PORT + 1), timeout=0.1, retries=2),
+            ContextData(),
+            ObjectType(ObjectIdentity("SNMPv2-MIB", "sysDescr", 0)),
+        )
+
+        assert isinstance(errorIndication, errind.RequestTimedOut)
+
+        peer = peer[0], ("127.0.0.1", AGENT_PORT + 1)
+        assert rttEstimator.getPeerInfo(peer) == (None, None, pytest.approx(0.8), 0)
+
+        snmpEngine.closeDispatcher()
@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from pysnmp.carrier.asyncio.dgram import udp
+from pysnmp.entity import config
+from pysnmp.entity.engine import SnmpEngine
+from pysnmp.entity.rfc3413.config import (
+    getTargetAddr,
+    getTargetNames,
+    getTargetParams,
+)
+from pysnmp.smi.error import SmiError
+
+
+@pytest.fixture
+def snmpEngine():
+    snmpEngine = SnmpEngine()
+    config.addTransport(snmpEngine, udp.DOMAIN_NAME, udp.UdpTransport())
+    config.addV1System(snmpEngine, "my-area", "public")
+    config.addTargetParams(snmpEngine, "my-creds", "my-area", "noAuthNoPriv", 1)
+    loop = snmpEngine.transportDispatcher.loop
+    yield snmpEngine
+    snmpEngine.closeDispatcher()
+    # let the cancelled dispatcher timer task finish before the loop goes away
+    loop.run_until_complete(asyncio.sleep(0))
+
+
+def test_target_addr_cached_per_row(snmpEngine):
+    config.addTargetAddr(
+        snmpEngine, "target-1", udp.DOMAIN_NAME, ("127.0.0.1", 161), "my-creds"
+    )
+
+    target1 = getTargetAddr(snmpEngine, "target-1")
+    params = getTargetParams(snmpEngine, "my-creds")
+
+    config.addTargetAddr(
+        snmpEngine, "target-2", udp.DOMAIN_NAME, ("127.0.0.2", 161), "my-creds"
+    )
+    config.addTargetParams(snmpEngine, "other-creds", "my-area", "noAuthNoPriv", 0)
+
+    assert getTargetAddr(snmpEngine, "target-1") is target1
+    assert getTargetParams(snmpEngine, "my-creds") is params
+    assert getTargetAddr(snmpEngine, "target-2")[1] == ("127.0.0.2", 161)
+
+    config.addTargetAddr(
+        snmpEngine, "target-1", udp.DOMAIN_NAME, ("127.0.0.3", 161), "my-creds"
+    )
+
+    assert getTargetAddr(snmpEngine, "target-1")[1] == ("127.0.0.3", 161)
+
+    config.delTargetAddr(snmpEngine, "target-1")
+
+    with pytest.raises(SmiError):
+        getTargetAddr(snmpEngine, "target-1")
+
+
+def test_target_names_updated_per_row(snmpEngine):
+    for name, tagList in (
+        ("target-1", "tag-a"),
+        ("target-3", "tag-a tag-b"),
+        ("target-2", "tag-b"),
+    ):
+        config.addTargetAddr(
+            snmpEngine,
+            name,
+            udp.DOMAIN_NAME,
+            ("127.0.0.1", 161),
+            "my-creds",
+            tagList=tagList,
+        )
+
+    assert getTargetNames(snmpEngine, b"tag-a") == [b"target-1", b"target-3"]
+    assert getTargetNames(snmpEngine, b"tag-b") == [b"target-2", b"target-3"]
+
+    config.delTargetAddr(snmpEngine, "target-3")
+    config.addTargetAddr(
+        snmpEngine,
+        "target-4",
+        udp.DOMAIN_NAME,
+        ("127.0.0.1", 161),
+        "my-creds",
+        tagList="tag-a",
+    )
+
+    assert getTargetNames(snmpEngine, b"tag-a") == [b"target-1", b"target-4"]
+    assert getTargetNames(snmpEngine, b"tag-b") == [b"target-2"]
+
+    config.delTargetAddr(snmpEngine, "target-2")
+
+    with pytest.raises(SmiError):
+        getTargetNames(snmpEngine, b"tag-b")
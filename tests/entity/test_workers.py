@@ -0,0 +1,49 @@
+import pytest
+from pysnmp.hlapi.asyncio import *
+from pysnmp.entity import config
+from pysnmp.entity.rfc3413 import cmdrsp, context
+from pysnmp.entity.workers import SnmpEngineWorkers
+
+import asyncio
+import socket
+
+
+def configure(snmpEngine):
+    config.addV1System(snmpEngine, "public", "public")
+    config.addVacmUser(snmpEngine, 2, "public", "noAuthNoPriv", (1, 3, 6), (1, 3, 6))
+    snmpContext = context.SnmpContext(snmpEngine)
+    cmdrsp.GetCommandResponder(snmpEngine, snmpContext)
+
+
+@pytest.mark.asyncio
+async def test_workers_share_port():
+    # workers bind their own SO_REUSEPORT sockets, so just pick a free port
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    workers = SnmpEngineWorkers(configure, ("127.0.0.1", port), workers=2)
+    workers.start()
+    try:
+        await asyncio.sleep(2)
+
+        assert len(set(workers.pids)) == 2
+
+        snmpEngine = SnmpEngine()
+        for _ in range(4):
+            errorIndication, errorStatus, errorIndex, varBinds = await getCmd(
+                snmpEngine,
+                CommunityData("public"),
+                UdpTransportTarget(("127.0.0.1", port), timeout=1, retries=2),
+                ContextData(),
+                ObjectType(ObjectIdentity("SNMPv2-MIB", "sysDescr", 0)),
+            )
+
+            assert errorIndication is None
+            assert errorStatus == 0
+            assert varBinds[0][1].prettyPrint().startswith("PySNMP engine version")
+
+        snmpEngine.closeDispatcher()
+
+    finally:
+        workers.stop()
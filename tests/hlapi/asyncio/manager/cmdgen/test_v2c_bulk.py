@@ -1,4 +1,7 @@
+from array import array
+
 import pytest
+from pysnmp.error import PySnmpError
 
 from pysnmp.hlapi.asyncio import *
 from tests.agent_context import AGENT_PORT, AgentContextManager
@@ -61,3 +64,149 @@ async def test_v2c_get_table_bulk():
         assert len(objects_list), 50
 
         snmpEngine.closeDispatcher()
+
+
+@pytest.mark.asyncio
+async def test_v2c_get_table_bulk_compact():
+    async with AgentContextManager():
+        snmpEngine = SnmpEngine()
+        objects = bulkWalkCmd(
+            snmpEngine,
+            CommunityData("public"),
+            UdpTransportTarget(("localhost", AGENT_PORT)),
+            ContextData(),
+            0,
+            4,
+            ObjectType(ObjectIdentity("SNMPv2-MIB", "system")),
+            lexicographicMode=False,
+            compactVarBinds=True,
+        )
+
+        objects_list = [item async for item in objects]
+
+        assert len(objects_list) > 2
+
+        for errorIndication, errorStatus, errorIndex, varBinds in objects_list:
+            assert errorIndication is None
+            assert errorStatus == 0
+            ((name, value),) = varBinds
+            assert name[:7] == (1, 3, 6, 1, 2, 1, 1)
+
+        assert objects_list[1][3] == [
+            ((1, 3, 6, 1, 2, 1, 1, 2, 0), (1, 3, 6, 1, 4, 1, 20408))
+        ]
+
+        snmpEngine.closeDispatcher()
+
+
+@pytest.mark.asyncio
+async def test_v2c_bulk_table():
+    async with AgentContextManager():
+        snmpEngine = SnmpEngine()
+        errorIndication, errorStatus, errorIndex, indices, columns = await bulkTableCmd(
+            snmpEngine,
+            CommunityData("public"),
+            UdpTransportTarget(("localhost", AGENT_PORT)),
+            ContextData(),
+            2,
+            ObjectType(ObjectIdentity("SNMP-VIEW-BASED-ACM-MIB", "vacmGroupName")),
+            ObjectType(
+                ObjectIdentity(
+                    "SNMP-VIEW-BASED-ACM-MIB", "vacmSecurityToGroupStorageType"
+                )
+            ),
+            ObjectType(ObjectIdentity("SNMP-USER-BASED-SM-MIB", "usmUserAuthProtocol")),
+        )
+
+        assert errorIndication is None
+        assert errorStatus == 0
+
+        groupNames, storageTypes, authProtocols = columns
+
+        # v1 and v2c community entries followed by three USM users
+        assert len(indices) == 8
+        assert indices[0] == (1, 6) + tuple(b"public")
+        assert indices == sorted(indices)
+
+        assert all(isinstance(x, bytes) for x in groupNames[:5])
+        assert groupNames[5:] == [None] * 3
+        assert storageTypes[:5] == [3] * 5
+        assert authProtocols[:5] == [None] * 5
+        assert authProtocols[7] == (1, 3, 6, 1, 6, 3, 10, 1, 1, 1)
+
+        errorIndication, errorStatus, errorIndex, indices, columns = await bulkTableCmd(
+            snmpEngine,
+            CommunityData("public"),
+            UdpTransportTarget(("localhost", AGENT_PORT)),
+            ContextData(),
+            50,
+            ObjectType(
+                ObjectIdentity(
+                    "SNMP-VIEW-BASED-ACM-MIB", "vacmSecurityToGroupStorageType"
+                )
+            ),
+            maxRows=3,
+        )
+
+        assert errorIndication is None
+        assert len(indices) == 3
+        assert columns == [array("l", [3, 3, 3])]
+
+        # sparse columns do not add up to more than maxRows rows
+        errorIndication, errorStatus, errorIndex, indices, columns = await bulkTableCmd(
+            snmpEngine,
+            CommunityData("public"),
+            UdpTransportTarget(("localhost", AGENT_PORT)),
+            ContextData(),
+            50,
+            ObjectType(ObjectIdentity("SNMP-VIEW-BASED-ACM-MIB", "vacmGroupName")),
+            ObjectType(ObjectIdentity("SNMP-USER-BASED-SM-MIB", "usmUserAuthProtocol")),
+            maxRows=6,
+        )
+
+        assert errorIndication is None
+        assert len(indices) == 6
+        assert [len(column) for column in columns] == [6, 6]
+        assert columns[1][:5] == [None] * 5
+
+        snmpEngine.closeDispatcher()
+
+
+@pytest.mark.asyncio
+async def test_v2c_bulk_walk_parallel():
+    async with AgentContextManager():
+        snmpEngine = SnmpEngine()
+
+        async def walk(**options):
+            names = []
+
+            async for errorIndication, errorStatus, errorIndex, varBinds in bulkWalkCmd(
+                snmpEngine,
+                CommunityData("public"),
+                UdpTransportTarget(("localhost", AGENT_PORT)),
+                ContextData(),
+                0,
+                10,
+                ObjectType(ObjectIdentity("1.3.6.1.6.3")),
+                lookupMib=False,
+                lexicographicMode=False,
+                **options,
+            ):
+                assert errorIndication is None
+                assert errorStatus == 0
+                names.extend(tuple(varBind[0]) for varBind in varBinds)
+
+            return names
+
+        names = await walk(maxConcurrency=8)
+
+        assert len(names) > 100
+        assert names == sorted(set(await walk()))
+
+        assert await walk(maxConcurrency=4, maxRows=17) == names[:17]
+
+        for option in ("maxCalls", "ignoreNonIncreasingOid"):
+            with pytest.raises(PySnmpError):
+                await walk(maxConcurrency=4, **{option: 1})
+
+        snmpEngine.closeDispatcher()
@@ -2,6 +2,8 @@ from datetime import datetime
 import pytest
 from pysnmp.hlapi.asyncio.slim import Slim
 from pysnmp.hlapi.asyncio import *
+from pysnmp.hlapi.asyncio.varbinds import CompactVarBind, CommandGeneratorVarBinds
+from pysnmp.proto.rfc1902 import ObjectName
 from pysnmp.proto import errind
 from tests.agent_context import AGENT_PORT, AgentContextManager
 
@@ -61,3 +63,68 @@ async def test_v2_get_legacy_object():
             errorStatus.prettyPrint() == "noAccess"
         )  # PySMI <1.3.0 generates such objects
         snmpEngine.closeDispatcher()
+
+
+@pytest.mark.asyncio
+async def test_v2_get_compact():
+    async with AgentContextManager():
+        snmpEngine = SnmpEngine()
+        errorIndication, errorStatus, errorIndex, varBinds = await getCmd(
+            snmpEngine,
+            CommunityData("public"),
+            UdpTransportTarget(("localhost", AGENT_PORT)),
+            ContextData(),
+            ObjectType(ObjectIdentity("1.3.6.1.2.1.1.1.0")),
+            ObjectType(ObjectIdentity("1.3.6.1.2.1.1.2.0")),
+            ObjectType(ObjectIdentity("1.3.6.1.2.1.1.3.0")),
+            ObjectType(ObjectIdentity("1.3.6.1.2.1.1.99.0")),
+            compactVarBinds=True,
+        )
+
+        assert errorIndication is None
+        assert errorStatus == 0
+
+        (
+            (sysDescrOid, sysDescr),
+            (sysObjectIdOid, sysObjectId),
+            (sysUpTimeOid, sysUpTime),
+            (missingOid, missing),
+        ) = varBinds
+
+        assert sysDescrOid == (1, 3, 6, 1, 2, 1, 1, 1, 0)
+        assert sysDescr.startswith(b"PySNMP engine version")
+        assert sysObjectId == (1, 3, 6, 1, 4, 1, 20408)
+        assert type(sysUpTime) is int
+        assert missingOid == (1, 3, 6, 1, 2, 1, 1, 99, 0)
+        assert isinstance(missing, NoSuchObject)
+
+        snmpEngine.closeDispatcher()
+
+
+def test_compact_varbind_values():
+    class MalformedIpAddress(OctetString):
+        tagSet = IpAddress.tagSet
+
+    varBinds = CommandGeneratorVarBinds.compactVarBinds(
+        [
+            (ObjectName("1.3.6.1.2.1.4.20.1.1.0"), IpAddress("127.0.0.1")),
+            (ObjectName("1.3.6.1.2.1.4.20.1.1.1"), MalformedIpAddress(b"\x7f\x00")),
+        ]
+    )
+
+    assert varBinds[0].value == "127.0.0.1"
+    assert varBinds[1].value == b"\x7f\x00"  # malformed, left as is
+
+    assert varBinds[0] in set(varBinds)
+    assert varBinds[0] != None
+    assert varBinds[0] != (1, 2, 3)
+
+    (_, null), (_, endOfMib) = CommandGeneratorVarBinds.compactVarBinds(
+        [
+            (ObjectName("1.3.6.1"), Null("")),
+            (ObjectName("1.3.6.2"), EndOfMibView("")),
+        ]
+    )
+    assert null is None
+    assert isinstance(endOfMib, EndOfMibView)
+    assert hash(varBinds[0]) == hash(CompactVarBind(*varBinds[0]))
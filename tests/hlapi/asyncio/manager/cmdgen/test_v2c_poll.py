@@ -0,0 +1,96 @@
+import pytest
+
+from pysnmp.hlapi.asyncio import *
+from pysnmp.proto import errind
+from tests.agent_context import AGENT_PORT, AgentContextManager
+
+import asyncio
+
+
+@pytest.mark.asyncio
+async def test_v2c_poll():
+    async with AgentContextManager():
+        snmpEngine = SnmpEngine()
+
+        targets = [UdpTransportTarget(("localhost", AGENT_PORT)) for _ in range(5)] + [
+            (
+                CommunityData("wrong"),
+                UdpTransportTarget(("localhost", AGENT_PORT), timeout=0.5, retries=0),
+            )
+        ]
+
+        results = []
+
+        async for result in pollCmd(
+            snmpEngine,
+            CommunityData("public"),
+            targets,
+            ContextData(),
+            ObjectType(ObjectIdentity("SNMPv2-MIB", "sysDescr", 0)),
+            ObjectType(ObjectIdentity("SNMPv2-MIB", "sysObjectID", 0)),
+            maxConcurrency=2,
+        ):
+            results.append(result)
+
+        assert len(results) == 6
+
+        # the timed out request completes last
+        transportTarget, errorIndication = results[-1][:2]
+        assert transportTarget is targets[-1][1]
+        assert isinstance(errorIndication, errind.RequestTimedOut)
+
+        for (
+            transportTarget,
+            errorIndication,
+            errorStatus,
+            errorIndex,
+            varBinds,
+        ) in results[:-1]:
+            assert transportTarget in targets
+            assert errorIndication is None
+            assert errorStatus == 0
+            assert len(varBinds) == 2
+            assert varBinds[0][0].prettyPrint() == "SNMPv2-MIB::sysDescr.0"
+            assert varBinds[0][1].prettyPrint().startswith("PySNMP engine version")
+            assert varBinds[1][1].prettyPrint() == "PYSNMP-MIB::pysnmp"
+
+        snmpEngine.closeDispatcher()
+
+
+@pytest.mark.asyncio
+async def test_v2c_bulk_poll_rate_limited():
+    async with AgentContextManager():
+        snmpEngine = SnmpEngine()
+
+        transportTarget = UdpTransportTarget(("localhost", AGENT_PORT))
+
+        loop = asyncio.get_running_loop()
+        startTime = loop.time()
+
+        results = []
+
+        async for result in bulkPollCmd(
+            snmpEngine,
+            CommunityData("public"),
+            [transportTarget] * 3,
+            ContextData(),
+            0,
+            2,
+            ObjectType(ObjectIdentity("SNMPv2-MIB", "sysDescr")),
+            maxRate=5,
+        ):
+            results.append(result)
+
+        # requests to the same peer are spaced 0.2 sec apart
+        assert loop.time() - startTime >= 0.4
+
+        assert len(results) == 3
+
+        for _, errorIndication, errorStatus, errorIndex, varBindTable in results:
+            assert errorIndication is None
+            assert errorStatus == 0
+            assert len(varBindTable) == 2
+            assert varBindTable[0][0][0].prettyPrint() == "SNMPv2-MIB::sysDescr.0"
+            assert varBindTable[1][0][0].prettyPrint() == "SNMPv2-MIB::sysObjectID.0"
+
+        snmpEngine.closeDispatcher()
@@ -0,0 +1,75 @@
+import pytest
+from pyasn1.codec.ber import decoder, encoder
+from pyasn1.error import PyAsn1Error
+
+from pysnmp.proto import ber, rfc1905
+from pysnmp.proto.api import v1, v2c, verdec
+from pysnmp.proto.mpmod.rfc3412 import SNMPv3Message
+
+
+def makeMessages():
+    for api in (v1, v2c):
+        varBinds = [
+            ((1, 3, 6, 1, 2, 1, 1, 1, 0), api.OctetString("x" * 200)),
+            (
+                (1, 3, 6, 1, 2, 1, 1, 2, 0),
+                api.ObjectIdentifier((1, 3, 6, 1, 4, 1, 20408)),
+            ),
+            ((1, 3, 6, 1, 2, 1, 1, 3, 0), api.TimeTicks(123456)),
+            ((1, 3, 6, 1, 2, 1, 2, 2, 1, 10, 1), api.Integer(-129)),
+            ((1, 3, 6, 1, 2, 1, 2, 2, 1, 10, 2), api.IpAddress("10.0.0.1")),
+            ((1, 3, 6, 1, 2, 1, 2, 2, 1, 10, 3), api.null),
+        ]
+
+        if api is v2c:
+            varBinds += [
+                ((1, 3, 6, 1, 2, 1, 31, 1, 1, 1, 6, 1), api.Counter64(2**64 - 1)),
+                ((1, 3, 6, 1, 2, 1, 2, 2, 1, 10, 4), rfc1905.noSuchInstance),
+                ((1, 3, 6, 1, 2, 1, 2, 2, 1, 10, 5), rfc1905.endOfMibView),
+            ]
+
+        for pdu, apiPDU in (
+            (api.GetRequestPDU(), api.apiPDU),
+            (api.GetResponsePDU(), api.apiPDU),
+            (api.TrapPDU(), api.apiTrapPDU),
+        ):
+            apiPDU.setDefaults(pdu)
+            apiPDU.setVarBinds(pdu, varBinds)
+
+            msg = api.Message()
+            api.apiMessage.setDefaults(msg)
+            api.apiMessage.setPDU(msg, pdu)
+
+            yield api.Message(), msg
+
+
+@pytest.mark.parametrize("asn1Spec,msg", list(makeMessages()))
+def test_codec_matches_pyasn1(asn1Spec, msg):
+    wholeMsg = encoder.encode(msg)
+
+    assert ber.encode(msg) == wholeMsg
+
+    value, rest = ber.decode(wholeMsg + b"\x00", asn1Spec=asn1Spec)
+
+    assert rest == b"\x00"
+    assert value == decoder.decode(wholeMsg, asn1Spec=asn1Spec)[0]
+    assert encoder.encode(value) == wholeMsg
+
+    assert verdec.decodeMessageVersion(wholeMsg) == msg[0]
+
+
+def test_codec_falls_back_to_pyasn1():
+    (asn1Spec, msg), *_ = makeMessages()
+
+    wholeMsg = encoder.encode(msg, defMode=False)
+
+    value, rest = ber.decode(wholeMsg, asn1Spec=asn1Spec)
+
+    assert not rest
+    assert value == msg
+
+    msg = SNMPv3Message()
+    msg["msgVersion"] = 3
+
+    with pytest.raises(PyAsn1Error):
+        ber.encode(msg)
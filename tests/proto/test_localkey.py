@@ -0,0 +1,131 @@
+import os
+import stat
+from hashlib import md5, sha1, sha224, sha256, sha384, sha512
+
+from pysnmp.proto.secmod.rfc3414 import localkey
+from pysnmp.proto.rfc1902 import OctetString
+
+
+ENGINE_ID = OctetString(hexValue="000000000000000000000002")
+
+
+def test_localized_key_cache_is_consistent():
+    localkey.clearKeyCache()
+
+    key = localkey.passwordToKeySHA("maplesyrup", ENGINE_ID)
+    assert localkey.passwordToKeySHA("maplesyrup", ENGINE_ID) == key
+    assert localkey.passwordToKeyMD5("maplesyrup", ENGINE_ID) != key
+
+
+def test_localize_keys_in_bulk():
+    engineIds = [OctetString(b"\x80\x00\x00\x00" + bytes([x])) for x in range(50)]
+
+    keys = localkey.passwordToKeys("maplesyrup", engineIds, sha1)
+
+    assert len(keys) == len(set(keys)) == 50
+    assert keys[7] == localkey.passwordToKeySHA("maplesyrup", engineIds[7])
+
+
+def test_on_disk_key_cache(tmp_path):
+    cacheDir = str(tmp_path / "keys")
+    os.mkdir(cacheDir, 0o755)
+
+    localkey.setKeyCacheDir(cacheDir)
+    try:
+        assert not os.stat(cacheDir).st_mode & (stat.S_IRWXG | stat.S_IRWXO)
+
+        localkey.clearKeyCache()
+        passKey = localkey.hashPassphrase("maplesyrup", md5)
+
+        fileNames = set(os.listdir(cacheDir))
+        assert localkey.KEY_CACHE_SECRET in fileNames
+
+        (fileName,) = fileNames - {localkey.KEY_CACHE_SECRET}
+        assert fileName != sha256(b"md5:maplesyrup").hexdigest()
+
+        for fileName in fileNames:
+            assert not os.stat(os.path.join(cacheDir, fileName)).st_mode & (
+                stat.S_IRWXG | stat.S_IRWXO
+            )
+
+        localkey.clearKeyCache()
+        assert localkey.hashPassphrase("maplesyrup", md5) == passKey
+
+        # the secret survives re-enabling the cache
+        localkey.setKeyCacheDir(cacheDir)
+        assert set(os.listdir(cacheDir)) == fileNames
+
+    finally:
+        localkey.setKeyCacheDir(None)
+
+
+def test_key_cache_evicts_least_recently_used(monkeypatch):
+    hashed = []
+
+    def hashPassphrase(passphrase, hashFunc):
+        hashed.append(passphrase)
+        return hashFunc(passphrase).digest()
+
+    monkeypatch.setattr(localkey, "_hashPassphrase", hashPassphrase)
+
+    localkey.clearKeyCache()
+    localkey.setKeyCacheSize(passKeys=2)
+    try:
+        for passphrase in (b"first", b"second", b"first", b"third", b"first"):
+            localkey.hashPassphrase(passphrase, sha1)
+
+        assert hashed == [b"first", b"second", b"third"]
+
+        localkey.hashPassphrase(b"second", sha1)
+        assert hashed[-1] == b"second"
+
+    finally:
+        localkey.setKeyCacheSize()
+        localkey.clearKeyCache()
+
+
+def _referenceHashPassphrase(passphrase, hashFunc):
+    # RFC 3414 A.2.1 reference algorithm
+    hasher = hashFunc()
+    count = 0
+    passwordIndex = 0
+    while count < 1048576:
+        chunk = bytes(
+            passphrase[(passwordIndex + i) % len(passphrase)] for i in range(64)
+        )
+        passwordIndex += 64
+        hasher.update(chunk)
+        count += 64
+    return hasher.digest()
+
+
+def test_rfc3414_md5_test_vector():
+    localkey.clearKeyCache()
+
+    assert localkey.hashPassphraseMD5("maplesyrup") == OctetString(
+        hexValue="9faf3283884e92834ebc9847d8edd963"
+    )
+    assert localkey.passwordToKeyMD5("maplesyrup", ENGINE_ID) == OctetString(
+        hexValue="526f5eed9fcce26f8964c2930787d82b"
+    )
+
+
+def test_rfc3414_sha_test_vector():
+    localkey.clearKeyCache()
+
+    assert localkey.hashPassphraseSHA("maplesyrup") == OctetString(
+        hexValue="9fb5cc0381497b3793528939ff788d5d79145211"
+    )
+    assert localkey.passwordToKeySHA("maplesyrup", ENGINE_ID) == OctetString(
+        hexValue="6695febc9288e36282235fc7151f128497b38f3f"
+    )
+
+
+def test_sha2_matches_reference_algorithm():
+    localkey.clearKeyCache()
+
+    for hashFunc in (sha224, sha256, sha384, sha512):
+        for passphrase in (b"maplesyrup", b"x" * 7, b"y" * 64, b"z" * 70000):
+            assert localkey.hashPassphrase(
+                passphrase, hashFunc
+            ).asOctets() == _referenceHashPassphrase(passphrase, hashFunc)
@@ -0,0 +1,29 @@
+from pysnmp.proto.mpmod import cache
+
+
+def test_refresh_keeps_retransmitted_request():
+    mpCache = cache.Cache()
+
+    msgId = mpCache.newMsgID()
+    mpCache.pushByMsgId(msgId, sendPduHandle=1)
+
+    for _ in range(500):
+        mpCache.expireCaches()
+
+    assert mpCache.refreshBySendPduHandle(1)
+
+    for _ in range(500):
+        mpCache.expireCaches()
+
+    assert mpCache.popByMsgId(msgId) == {"sendPduHandle": 1}
+
+
+def test_refresh_of_expired_request():
+    mpCache = cache.Cache()
+
+    mpCache.pushByMsgId(mpCache.newMsgID(), sendPduHandle=1)
+
+    for _ in range(601):
+        mpCache.expireCaches()
+
+    assert not mpCache.refreshBySendPduHandle(1)
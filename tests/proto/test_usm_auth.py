@@ -0,0 +1,83 @@
+import hmac
+from hashlib import md5, sha1, sha256, sha512
+
+import pytest
+from pyasn1.type import univ
+
+from pysnmp.proto import ber, error
+from pysnmp.proto.mpmod.rfc3412 import SNMPv3Message
+from pysnmp.proto.secmod.rfc3414.auth import base, hmacmd5, hmacsha
+from pysnmp.proto.secmod.rfc3414.service import UsmSecurityParameters
+from pysnmp.proto.secmod.rfc7860.auth import hmacsha2
+
+
+def makeMessage(digestLength):
+    securityParameters = UsmSecurityParameters()
+    # zeros elsewhere in the message must not be taken for digest placeholder
+    securityParameters["msgAuthoritativeEngineId"] = b"\x00" * 24
+    securityParameters["msgAuthoritativeEngineBoots"] = 1
+    securityParameters["msgAuthoritativeEngineTime"] = 2
+    securityParameters["msgUserName"] = b"user"
+    securityParameters["msgAuthenticationParameters"] = b"\x00" * digestLength
+    securityParameters["msgPrivacyParameters"] = b""
+
+    msg = SNMPv3Message()
+    msg["msgVersion"] = 3
+    msg["msgGlobalData"]["msgID"] = 1
+    msg["msgGlobalData"]["msgMaxSize"] = 65507
+    msg["msgGlobalData"]["msgFlags"] = b"\x01"
+    msg["msgGlobalData"]["msgSecurityModel"] = 3
+    msg["msgSecurityParameters"] = ber.encode(securityParameters)
+    msg["msgData"]["encryptedPDU"] = b"\x00" * 32
+
+    return ber.encode(msg)
+
+
+@pytest.mark.parametrize(
+    "authHandler,digestmod",
+    [
+        (hmacmd5.HmacMd5(), md5),
+        (hmacsha.HmacSha(), sha1),
+        (hmacsha2.HmacSha2(hmacsha2.HmacSha2.SHA256_SERVICE_ID), sha256),
+        (hmacsha2.HmacSha2(hmacsha2.HmacSha2.SHA512_SERVICE_ID), sha512),
+    ],
+)
+def test_authenticate_msg(authHandler, digestmod):
+    authKey = univ.OctetString(b"\x01" * digestmod().digest_size)
+    digestLength = authHandler.digestLength
+
+    wholeMsg = makeMessage(digestLength)
+
+    authenticatedWholeMsg = authHandler.authenticateOutgoingMsg(authKey, wholeMsg)
+
+    mac = hmac.new(authKey.asOctets(), wholeMsg, digestmod).digest()[:digestLength]
+
+    start, end = ber.locate(authenticatedWholeMsg, 0, 2, 0, 4)
+    assert authenticatedWholeMsg[start:end] == mac
+    assert authenticatedWholeMsg[:start] == wholeMsg[:start]
+    assert authenticatedWholeMsg[end:] == wholeMsg[end:]
+
+    assert (
+        authHandler.authenticateIncomingMsg(
+            authKey, univ.OctetString(mac), authenticatedWholeMsg
+        )
+        == authenticatedWholeMsg
+    )
+
+    with pytest.raises(error.StatusInformation):
+        authHandler.authenticateIncomingMsg(
+            univ.OctetString(b"\x02" * len(authKey)),
+            univ.OctetString(mac),
+            authenticatedWholeMsg,
+        )
+
+
+def test_keyed_hmac_cache_follows_key():
+    authHandler = hmacsha.HmacSha()
+    authKey = univ.OctetString(b"\x03" * 20)
+
+    authHandler.authenticateOutgoingMsg(authKey, makeMessage(12))
+    assert authKey in base._hmacCache
+
+    del authKey
+    assert univ.OctetString(b"\x03" * 20) not in base._hmacCache
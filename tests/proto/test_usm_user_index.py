@@ -0,0 +1,55 @@
+from pysnmp.entity import config
+from pysnmp.entity.engine import SnmpEngine
+from pysnmp.proto.rfc1902 import OctetString
+from pysnmp.proto.secmod.rfc3414.service import SnmpUSMSecurityModel
+
+
+def _setup():
+    snmpEngine = SnmpEngine()
+    config.addV3User(
+        snmpEngine,
+        "usr-sha-aes",
+        config.USM_AUTH_HMAC96_SHA,
+        "authkey1",
+        config.USM_PRIV_CFB128_AES,
+        "privkey1",
+    )
+    usm = snmpEngine.securityModels[SnmpUSMSecurityModel.SECURITY_MODEL_ID]
+    return snmpEngine, usm
+
+
+def test_cloned_user_indexed_without_rescan(monkeypatch):
+    snmpEngine, usm = _setup()
+    mibInstrumController = snmpEngine.msgAndPduDsp.mibInstrumController
+    sec2usr = usm._SnmpUSMSecurityModel__sec2usr
+
+    assert sec2usr(snmpEngine, OctetString("usr-sha-aes")) == b"usr-sha-aes"
+
+    peerEngineId = OctetString(hexValue="80000000010203040506")
+    usm._SnmpUSMSecurityModel__cloneUserInfo(
+        mibInstrumController, peerEngineId, OctetString("usr-sha-aes")
+    )
+
+    (usmUserEngineID,) = mibInstrumController.mibBuilder.importSymbols(
+        "SNMP-USER-BASED-SM-MIB", "usmUserEngineID"
+    )
+
+    def getNextNode(name):
+        raise AssertionError("usmUserTable rescanned")
+
+    monkeypatch.setattr(usmUserEngineID, "getNextNode", getNextNode)
+
+    assert (
+        sec2usr(snmpEngine, OctetString("usr-sha-aes"), peerEngineId) == b"usr-sha-aes"
+    )
+
+
+def test_configured_user_indexed():
+    snmpEngine, usm = _setup()
+    sec2usr = usm._SnmpUSMSecurityModel__sec2usr
+
+    assert sec2usr(snmpEngine, OctetString("usr-sha-aes")) == b"usr-sha-aes"
+
+    config.addV3User(snmpEngine, "usr-md5-none", config.USM_AUTH_HMAC96_MD5, "authkey1")
+
+    assert sec2usr(snmpEngine, OctetString("usr-md5-none")) == b"usr-md5-none"
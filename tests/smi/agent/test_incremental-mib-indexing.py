@@ -0,0 +1,67 @@
+import pytest
+from pysnmp.proto.api import v2c
+from pysnmp.smi import builder, error, instrum
+
+
+@pytest.fixture
+def mibInstrum():
+    mibBuilder = builder.MibBuilder()
+    mibBuilder.loadModules("SNMPv2-MIB")
+    mibInstrum = instrum.MibInstrumController(mibBuilder)
+    mibInstrum.readVars([((1, 3, 6, 1, 2, 1, 1, 1, 0), None)])
+    return mibInstrum
+
+
+def test_exported_instances_indexed_incrementally(mibInstrum):
+    mibBuilder = mibInstrum.getMibBuilder()
+    (mibTree,) = mibBuilder.importSymbols("SNMPv2-SMI", "iso")
+    MibScalar, MibScalarInstance = mibBuilder.importSymbols(
+        "SNMPv2-SMI", "MibScalar", "MibScalarInstance"
+    )
+
+    mibBuilder.exportSymbols(
+        "__MY_MIB", MibScalar((1, 3, 6, 1, 4, 1, 60069, 1), v2c.Integer())
+    )
+    mibInstrum.readVars([((1, 3, 6, 1, 2, 1, 1, 1, 0), None)])
+
+    branchVersionId = mibTree.branchVersionId
+
+    for idx in range(1, 10):
+        mibBuilder.exportSymbols(
+            "__MY_MIB",
+            **{
+                "row%d"
+                % idx: MibScalarInstance(
+                    (1, 3, 6, 1, 4, 1, 60069, 1), (idx,), v2c.Integer(idx)
+                )
+            },
+        )
+
+        varBinds = mibInstrum.readVars([((1, 3, 6, 1, 4, 1, 60069, 1, idx), None)])
+        assert varBinds[0][1] == idx
+
+    # Top-level MIB tree has not been rebuilt
+    assert mibTree.branchVersionId == branchVersionId
+
+    mibBuilder.unexportSymbols("__MY_MIB", "row5")
+
+    varBinds = mibInstrum.readNextVars([((1, 3, 6, 1, 4, 1, 60069, 1, 4), None)])
+    assert varBinds[0][0] == (1, 3, 6, 1, 4, 1, 60069, 1, 6)
+
+    varBinds = mibInstrum.readVars([((1, 3, 6, 1, 4, 1, 60069, 1, 5), None)])
+    assert isinstance(varBinds[0][1], v2c.NoSuchInstance)
+
+    assert mibTree.branchVersionId == branchVersionId
+
+
+def test_orphan_instance_falls_back_to_rebuild(mibInstrum):
+    mibBuilder = mibInstrum.getMibBuilder()
+    (MibScalarInstance,) = mibBuilder.importSymbols("SNMPv2-SMI", "MibScalarInstance")
+
+    mibBuilder.exportSymbols(
+        "__MY_MIB",
+        MibScalarInstance((1, 3, 6, 1, 4, 1, 60069, 2), (0,), v2c.Integer(1)),
+    )
+
+    with pytest.raises(error.SmiError):
+        mibInstrum.readVars([((1, 3, 6, 1, 2, 1, 1, 1, 0), None)])
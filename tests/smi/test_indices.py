@@ -0,0 +1,86 @@
+import pickle
+import random
+
+import pytest
+
+from pysnmp.smi.indices import OrderedDict, OidOrderedDict
+
+
+def test_oid_ordered_dict_keeps_order():
+    keys = [(1, 3, 6, 1, 2, 1, 2, 2, 1, 1, x) for x in range(2000)]
+    keys += [(1, 3, 6, 1, 2, 1, 1, x) for x in range(100)]
+    shuffled = list(keys)
+    random.shuffle(shuffled)
+
+    d = OidOrderedDict()
+    for k in shuffled:
+        d[k] = k[-1]
+
+    assert list(d.keys()) == sorted(keys)
+    assert d.firstKey() == (1, 3, 6, 1, 2, 1, 1, 0)
+    assert d.keys()[0] == d.firstKey()
+    assert d.keys()[-1] == d.lastKey() == (1, 3, 6, 1, 2, 1, 2, 2, 1, 1, 1999)
+    assert d.keys()[150] == (1, 3, 6, 1, 2, 1, 2, 2, 1, 1, 50)
+    assert d.items()[1] == ((1, 3, 6, 1, 2, 1, 1, 1), 1)
+    assert d.getKeysLens() == [11, 8]
+
+
+def test_oid_ordered_dict_next_key_and_delete():
+    d = OidOrderedDict()
+    for x in range(1000):
+        d[(1, 3, 6, x)] = x
+
+    assert d.nextKey((1, 3, 6, 10)) == (1, 3, 6, 11)
+    assert d.nextKey((1, 3, 5)) == (1, 3, 6, 0)
+    assert d.nextKey((1, 3, 6, 10, 5)) == (1, 3, 6, 11)
+
+    for x in range(0, 1000, 2):
+        del d[(1, 3, 6, x)]
+
+    assert len(d) == len(d.keys()) == 500
+    assert d.nextKey((1, 3, 6, 10)) == (1, 3, 6, 11)
+    assert d.nextKey((1, 3, 6, 11)) == (1, 3, 6, 13)
+    assert d.firstKey() == (1, 3, 6, 1)
+
+    try:
+        d.nextKey((1, 3, 6, 999))
+    except KeyError:
+        pass
+    else:
+        assert False, "KeyError expected"
+
+
+def test_oid_ordered_dict_string_keys():
+    d = OidOrderedDict()
+    d["1.3.6.1.10"] = 2
+    d["1.3.6.1.9"] = 1
+
+    assert list(d.keys()) == ["1.3.6.1.9", "1.3.6.1.10"]
+    assert d.nextKey("1.3.6.1.9") == "1.3.6.1.10"
+
+
+def test_ordered_dict_pickle():
+    d = OrderedDict({"b": 2, "a": 1})
+    restored = pickle.loads(pickle.dumps(d))
+
+    assert list(restored.items()) == [("a", 1), ("b", 2)]
+    restored["c"] = 3
+    assert restored.nextKey("b") == "c"
+
+
+def test_ordered_dict_mutation_while_iterating():
+    d = OidOrderedDict(((1, x), x) for x in range(10))
+
+    with pytest.raises(RuntimeError):
+        for k in d.keys():
+            del d[k]
+
+    assert len(d) == 9
+
+    for k in list(d.keys()):
+        if k[-1] % 2:
+            del d[k]
+
+    assert d.keys() == [(1, 2), (1, 4), (1, 6), (1, 8)]
+    assert (1, 4) in d.keys() and (1, 5) not in d.keys()
+    assert d.keyAt(-1) == (1, 8)
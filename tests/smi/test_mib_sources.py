@@ -0,0 +1,155 @@
+import os
+import sys
+import zipfile
+from importlib.util import cache_from_source
+
+import pytest
+
+from pysnmp.smi import builder
+
+
+def test_dir_mib_source_index(tmp_path, monkeypatch):
+    (tmp_path / "FOO-MIB.py").write_text("fooSymbol = 1\n")
+
+    # listings of just modified directories are not trusted
+    stat = os.stat(tmp_path)
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10 * 10**9))
+
+    listdirCalls = []
+    listdir = os.listdir
+
+    def countingListdir(path):
+        listdirCalls.append(path)
+        return listdir(path)
+
+    monkeypatch.setattr(os, "listdir", countingListdir)
+
+    mibSource = builder.DirMibSource(str(tmp_path)).init()
+
+    assert mibSource.read("FOO-MIB")[1] == ".py"
+    assert mibSource.listdir() == ("FOO-MIB",)
+
+    # case-sensitive lookups and misses are answered from the index
+    for modName in ("foo-mib", "BAR-MIB", "BAR-MIB"):
+        with pytest.raises(OSError):
+            mibSource.read(modName)
+
+    assert len(listdirCalls) == 1
+
+    (tmp_path / "BAR-MIB.py").write_text("barSymbol = 1\n")
+
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 5 * 10**9))
+
+    assert mibSource.read("BAR-MIB")[1] == ".py"
+    assert sorted(mibSource.listdir()) == ["BAR-MIB", "FOO-MIB"]
+    assert len(listdirCalls) == 2
+
+
+def test_mib_builder_loads_from_indexed_sources(tmp_path):
+    (tmp_path / "FOO-MIB.py").write_text(
+        '(MibIdentifier,) = mibBuilder.importSymbols("SNMPv2-SMI", "MibIdentifier")\n'
+        "fooObject = MibIdentifier((1, 3, 6, 1, 4, 1, 99999))\n"
+        'mibBuilder.exportSymbols("FOO-MIB", fooObject=fooObject)\n'
+    )
+
+    mibBuilder = builder.MibBuilder()
+    mibBuilder.addMibSources(builder.DirMibSource(str(tmp_path)))
+    mibBuilder.loadModules("SNMPv2-MIB", "FOO-MIB")
+
+    (fooObject,) = mibBuilder.importSymbols("FOO-MIB", "fooObject")
+    assert fooObject.getName() == (1, 3, 6, 1, 4, 1, 99999)
+
+
+def test_dir_mib_source_bytecode_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+
+    srcDir = tmp_path / "mibs"
+    srcDir.mkdir()
+    (srcDir / "FOO-MIB.py").write_text("fooSymbol = 1\n")
+
+    mibSource = builder.DirMibSource(str(srcDir)).init()
+
+    codeObj, sfx = mibSource.read("FOO-MIB")
+    assert os.path.exists(cache_from_source(mibSource.fullPath("FOO-MIB", sfx)))
+
+    def noCompile(*args):
+        raise AssertionError("MIB module compiled again")
+
+    # subsequent loads use cached bytecode
+    monkeypatch.setattr(builder, "compile", noCompile, raising=False)
+
+    g = {}
+    exec(mibSource.read("FOO-MIB")[0], g)
+    assert g["fooSymbol"] == 1
+
+    monkeypatch.delattr(builder, "compile")
+
+    # source changes invalidate cached bytecode
+    (srcDir / "FOO-MIB.py").write_text("fooSymbol = 12\n")
+
+    g = {}
+    exec(mibSource.read("FOO-MIB")[0], g)
+    assert g["fooSymbol"] == 12
+
+
+def test_dir_mib_source_bytecode_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+
+    srcDir = tmp_path / "mibs"
+    srcDir.mkdir()
+    (srcDir / "FOO-MIB.py").write_text("fooSymbol = 1\n")
+
+    # source directory is not writable
+    (srcDir / "__pycache__").write_text("")
+
+    cacheDir = tmp_path / "cache"
+
+    mibSource = builder.DirMibSource(str(srcDir), cacheDir=str(cacheDir)).init()
+
+    pyPath = mibSource.fullPath("FOO-MIB", mibSource.read("FOO-MIB")[1])
+
+    (cachePath,) = [
+        os.path.join(path, name)
+        for path, dirs, files in os.walk(cacheDir)
+        for name in files
+    ]
+    assert cachePath.endswith(os.path.basename(cache_from_source(pyPath)))
+    assert cachePath.startswith(str(cacheDir))
+
+
+def test_zip_mib_source_bytecode_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+
+    zipPath = tmp_path / "mibs.zip"
+
+    with zipfile.ZipFile(zipPath, "w") as zf:
+        zf.writestr("zipped_mibs/__init__.py", "")
+        zf.writestr("zipped_mibs/FOO-MIB.py", "fooSymbol = 1\n")
+
+    workDir = tmp_path / "work"
+    workDir.mkdir()
+
+    monkeypatch.chdir(workDir)
+    monkeypatch.syspath_prepend(str(zipPath))
+
+    cacheDir = tmp_path / "cache"
+
+    try:
+        mibSource = builder.ZipMibSource("zipped_mibs", cacheDir=str(cacheDir)).init()
+
+        g = {}
+        exec(mibSource.read("FOO-MIB")[0], g)
+        assert g["fooSymbol"] == 1
+
+    finally:
+        sys.modules.pop("zipped_mibs", None)
+
+    # nothing is written relative to current directory
+    assert not os.listdir(workDir)
+
+    (cachePath,) = [
+        os.path.join(path, name)
+        for path, dirs, files in os.walk(cacheDir)
+        for name in files
+    ]
+    assert str(zipPath).lstrip(os.sep) in cachePath
@@ -0,0 +1,93 @@
+import os
+
+from pysnmp.smi import builder, view
+from pysnmp.smi.rfc1902 import ObjectIdentity
+
+FOO_MIB = """\
+(MibScalar, Integer32) = mibBuilder.importSymbols(
+    "SNMPv2-SMI", "MibScalar", "Integer32"
+)
+fooObject = MibScalar((1, 3, 6, 1, 4, 1, 99999, 1), Integer32())
+mibBuilder.exportSymbols("FOO-MIB", fooObject=fooObject)
+"""
+
+SYS_DESCR = (1, 3, 6, 1, 2, 1, 1, 1)
+
+
+def makeMibView(mibDir):
+    mibBuilder = builder.MibBuilder()
+    mibBuilder.addMibSources(builder.DirMibSource(str(mibDir)))
+    return view.MibViewController(mibBuilder)
+
+
+def test_mib_view_snapshot(tmp_path):
+    mibDir = tmp_path / "mibs"
+    mibDir.mkdir()
+    (mibDir / "FOO-MIB.py").write_text(FOO_MIB)
+
+    snapshotPath = str(tmp_path / "mibview.snapshot")
+
+    mibView = makeMibView(mibDir)
+    mibView.mibBuilder.loadModules("SNMPv2-MIB", "FOO-MIB")
+    mibView.saveSnapshot(snapshotPath)
+
+    mibView = makeMibView(mibDir)
+    assert mibView.loadSnapshot(snapshotPath)
+
+    # MIB modules are not loaded until their objects are needed
+    assert "SNMPv2-MIB" not in mibView.mibBuilder.mibSymbols
+    assert mibView.getNodeName(SYS_DESCR)[1] == (
+        "iso",
+        "org",
+        "dod",
+        "internet",
+        "mgmt",
+        "mib-2",
+        "system",
+        "sysDescr",
+    )
+
+    objectIdentity = ObjectIdentity("1.3.6.1.4.1.99999.1.0").resolveWithMib(mibView)
+    assert objectIdentity.getMibSymbol()[:2] == ("FOO-MIB", "fooObject")
+    assert "FOO-MIB" in mibView.mibBuilder.mibSymbols
+
+    # lazily loaded modules do not cause re-indexing
+    assert mibView.getNodeLocation(SYS_DESCR) == ("SNMPv2-MIB", "sysDescr", ())
+    assert "SNMPv2-MIB" not in mibView.mibBuilder.mibSymbols
+
+    # symbols unknown to snapshot bring in all snapshot modules
+    (MibIdentifier,) = mibView.mibBuilder.importSymbols("SNMPv2-SMI", "MibIdentifier")
+    mibView.mibBuilder.exportSymbols(
+        "BAR-MIB", barObject=MibIdentifier((1, 3, 6, 1, 4, 1, 99998))
+    )
+
+    assert mibView.getNodeLocation((1, 3, 6, 1, 4, 1, 99998)) == (
+        "BAR-MIB",
+        "barObject",
+        (),
+    )
+    assert mibView.getNodeLocation(SYS_DESCR) == ("SNMPv2-MIB", "sysDescr", ())
+    assert "SNMPv2-MIB" in mibView.mibBuilder.mibSymbols
+
+
+def test_mib_view_snapshot_outdated(tmp_path):
+    mibDir = tmp_path / "mibs"
+    mibDir.mkdir()
+    (mibDir / "FOO-MIB.py").write_text(FOO_MIB)
+
+    snapshotPath = str(tmp_path / "mibview.snapshot")
+
+    mibView = makeMibView(mibDir)
+    assert not mibView.loadSnapshot(snapshotPath)
+
+    mibView.mibBuilder.loadModules("FOO-MIB")
+    mibView.saveSnapshot(snapshotPath)
+
+    assert makeMibView(mibDir).loadSnapshot(snapshotPath)
+
+    stat = os.stat(mibDir / "FOO-MIB.py")
+    os.utime(mibDir / "FOO-MIB.py", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert not makeMibView(mibDir).loadSnapshot(snapshotPath)
+
+    assert not view.MibViewController(builder.MibBuilder()).loadSnapshot(snapshotPath)